@@ -0,0 +1,465 @@
+import json
+import platform
+import statistics
+import time
+import tracemalloc
+from collections.abc import Callable
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any, NamedTuple
+
+import click
+from aether import BaseWebElement, render
+from aether.plugins.alpinejs import AlpineHookForm
+from aether.tags.html import Div, Main
+from rich.console import Console
+from rich.table import Table as RichTable
+from rich.traceback import install
+
+from altar_ui import __version__
+from altar_ui.accordion import (
+    Accordion,
+    AccordionContent,
+    AccordionItem,
+    AccordionTrigger,
+)
+from altar_ui.button import Button
+from altar_ui.carousel import (
+    Carousel,
+    CarouselContent,
+    CarouselItem,
+    CarouselNext,
+    CarouselPrevious,
+)
+from altar_ui.chart import Chart
+from altar_ui.dialog import (
+    Dialog,
+    DialogContent,
+    DialogDescription,
+    DialogFooter,
+    DialogHeader,
+    DialogTitle,
+    DialogTrigger,
+)
+from altar_ui.form import (
+    Form,
+    FormControl,
+    FormDescription,
+    FormField,
+    FormItem,
+    FormLabel,
+    FormMessage,
+)
+from altar_ui.input import Input
+from altar_ui.navigation_menu import (
+    NavigationMenu,
+    NavigationMenuContent,
+    NavigationMenuItem,
+    NavigationMenuLink,
+    NavigationMenuList,
+    NavigationMenuTrigger,
+)
+from altar_ui.pagination import (
+    Pagination,
+    PaginationContent,
+    PaginationItem,
+    PaginationLink,
+    PaginationNext,
+    PaginationPrevious,
+)
+from altar_ui.sidebar import (
+    Sidebar,
+    SidebarContent,
+    SidebarFooter,
+    SidebarGroup,
+    SidebarGroupContent,
+    SidebarGroupLabel,
+    SidebarHeader,
+    SidebarMenu,
+    SidebarMenuButton,
+    SidebarMenuItem,
+    SidebarProvider,
+)
+from altar_ui.table import (
+    Table,
+    TableBody,
+    TableCaption,
+    TableCell,
+    TableFooter,
+    TableHead,
+    TableHeader,
+    TableRow,
+)
+
+install(extra_lines=0, max_frames=10)
+
+
+class BenchmarkResult(NamedTuple):
+    scenario: str
+    size: int
+    elements: int
+    ops_per_second: float
+    construct_us: float
+    render_us: float
+    per_element_us: float
+    html_bytes: int
+    peak_allocation_bytes: int
+
+
+def build_button(size: int) -> BaseWebElement:
+    return Div()(
+        Button(variant="outline", size="sm")(f"Button {index}") for index in range(size)
+    )
+
+
+def build_table(size: int) -> BaseWebElement:
+    return Table()(
+        TableCaption()("Invoices"),
+        TableHeader()(
+            TableRow()(
+                TableHead()("Invoice"),
+                TableHead()("Status"),
+                TableHead()("Method"),
+                TableHead(_class="text-right")("Amount"),
+            )
+        ),
+        TableBody()(
+            TableRow()(
+                TableCell(_class="font-medium")(f"INV{index:05}"),
+                TableCell()("Paid"),
+                TableCell()("Credit Card"),
+                TableCell(_class="text-right")(f"${index * 1.5:.2f}"),
+            )
+            for index in range(size)
+        ),
+        TableFooter()(TableRow()(TableCell(colspan=3)("Total"), TableCell()("$0.00"))),
+    )
+
+
+def build_sidebar(size: int) -> BaseWebElement:
+    return SidebarProvider()(
+        Sidebar()(
+            SidebarHeader()("Application"),
+            SidebarContent()(
+                SidebarGroup()(
+                    SidebarGroupLabel()("Navigation"),
+                    SidebarGroupContent()(
+                        SidebarMenu()(
+                            SidebarMenuItem(is_active=index == 0)(
+                                SidebarMenuButton(has_active_state=True)(
+                                    f"Item {index}"
+                                )
+                            )
+                            for index in range(size)
+                        )
+                    ),
+                )
+            ),
+            SidebarFooter()("Footer"),
+        ),
+        Main()("Content"),
+    )
+
+
+def build_form(size: int) -> BaseWebElement:
+    return Form()(
+        FormField()(
+            FormItem()(
+                FormLabel()(f"Field {index}"),
+                FormControl(
+                    hook_form_item=AlpineHookForm(
+                        name=f"field_{index}",
+                        required=True,
+                        validator={
+                            "validation_rules": [
+                                {"test": "/^[a-z]+$/", "message": "Lowercase only."}
+                            ]
+                        },
+                        constraints={
+                            "type": {"value": "text"},
+                            "min_length": {"value": 2},
+                            "max_length": {"value": 32},
+                        },
+                    )
+                )(Input(placeholder=f"Field {index}")),
+                FormDescription()("Description"),
+                FormMessage(),
+            )
+        )
+        for index in range(size)
+    )
+
+
+def build_chart(size: int) -> BaseWebElement:
+    return Chart(
+        chart_type="line",
+        chart_title="Benchmark",
+        chart_labels=[str(index) for index in range(size)],
+        chart_data=[index * 0.5 for index in range(size)],
+    )
+
+
+def build_accordion(size: int) -> BaseWebElement:
+    return Accordion(type="single")(
+        AccordionItem()(
+            AccordionTrigger()(f"Question {index}"),
+            AccordionContent()(f"Answer {index}"),
+        )
+        for index in range(size)
+    )
+
+
+def build_pagination(size: int) -> BaseWebElement:
+    return Pagination(number_of_pages=size)(
+        PaginationContent()(
+            PaginationItem()(PaginationPrevious()),
+            (
+                PaginationItem(item_index=index)(PaginationLink()(str(index + 1)))
+                for index in range(size)
+            ),
+            PaginationItem()(PaginationNext()),
+        )
+    )
+
+
+def build_carousel(size: int) -> BaseWebElement:
+    return Carousel(orientation="horizontal", number_of_slides=size)(
+        CarouselContent()(
+            CarouselItem(item_index=index)(f"Slide {index}") for index in range(size)
+        ),
+        CarouselPrevious(),
+        CarouselNext(),
+    )
+
+
+def build_dialog(size: int) -> BaseWebElement:
+    return Div()(
+        Dialog()(
+            DialogTrigger(variant="outline")("Open"),
+            DialogContent()(
+                DialogHeader()(
+                    DialogTitle()(f"Dialog {index}"),
+                    DialogDescription()("Description"),
+                ),
+                DialogFooter()(Button()("Save")),
+            ),
+        )
+        for index in range(size)
+    )
+
+
+def build_navigation_menu(size: int) -> BaseWebElement:
+    return NavigationMenu()(
+        NavigationMenuList()(
+            NavigationMenuItem()(
+                NavigationMenuTrigger()(f"Menu {index}"),
+                NavigationMenuContent()(
+                    NavigationMenuLink(active=None, href="#")(f"Link {index}")
+                ),
+            )
+            for index in range(size)
+        )
+    )
+
+
+SCENARIOS: dict[str, Callable[[int], BaseWebElement]] = {
+    "button": build_button,
+    "table": build_table,
+    "sidebar": build_sidebar,
+    "form": build_form,
+    "chart": build_chart,
+    "accordion": build_accordion,
+    "pagination": build_pagination,
+    "carousel": build_carousel,
+    "dialog": build_dialog,
+    "navigation_menu": build_navigation_menu,
+}
+
+
+def count_elements(element: Any) -> int:
+    if not isinstance(element, BaseWebElement):
+        return 0
+
+    # Lazy children (e.g. generator rows) are only reachable by consuming
+    # them, so this must be called on a tree that is not rendered afterwards.
+    children = [
+        *(getattr(element, "children", None) or []),
+        *getattr(element, "lazy_children", ()),
+    ]
+    return 1 + sum(count_elements(child) for child in children)
+
+
+def run_scenario(
+    scenario: str, builder: Callable[[int], BaseWebElement], size: int, repeat: int
+) -> BenchmarkResult:
+    # Warm up caches (class merging, pydantic schemas) so that every
+    # measured round reflects the steady state of a running server.
+    html = render(builder(size))
+
+    construct_timings = []
+    render_timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        element = builder(size)
+        constructed = time.perf_counter()
+        html = render(element)
+        rendered = time.perf_counter()
+
+        construct_timings.append(constructed - start)
+        render_timings.append(rendered - constructed)
+
+    tracemalloc.start()
+    render(builder(size))
+    _, peak_allocation_bytes = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    elements = count_elements(builder(size))
+    construct_time = statistics.median(construct_timings)
+    render_time = statistics.median(render_timings)
+    total_time = construct_time + render_time
+
+    return BenchmarkResult(
+        scenario=scenario,
+        size=size,
+        elements=elements,
+        ops_per_second=1 / total_time if total_time else float("inf"),
+        construct_us=construct_time * 1e6,
+        render_us=render_time * 1e6,
+        per_element_us=total_time * 1e6 / elements if elements else 0.0,
+        html_bytes=len(html.encode()),
+        peak_allocation_bytes=peak_allocation_bytes,
+    )
+
+
+def load_baseline(baseline_path: Path) -> dict[tuple[str, int], dict[str, Any]]:
+    baseline = json.loads(baseline_path.read_text())
+    return {
+        (result["scenario"], result["size"]): result for result in baseline["results"]
+    }
+
+
+def format_change(current: float, previous: float | None) -> str:
+    if not previous:
+        return ""
+
+    change = (current - previous) / previous * 100
+    color = "red" if change > 5 else "green" if change < -5 else "white"
+    return f" [{color}]({change:+.1f}%)[/{color}]"
+
+
+def display_results(
+    console: Console,
+    results: list[BenchmarkResult],
+    baseline: dict[tuple[str, int], dict[str, Any]] | None,
+) -> None:
+    table = RichTable(title=f"altar-ui {__version__} benchmark")
+    table.add_column("Scenario", style="cyan")
+    table.add_column("Size", justify="right")
+    table.add_column("Elements", justify="right")
+    table.add_column("ops/s", justify="right")
+    table.add_column("Construct (µs)", justify="right")
+    table.add_column("Render (µs)", justify="right")
+    table.add_column("µs/element", justify="right")
+    table.add_column("HTML (bytes)", justify="right")
+    table.add_column("Peak alloc (KiB)", justify="right")
+
+    for result in results:
+        previous = (baseline or {}).get((result.scenario, result.size), {})
+        table.add_row(
+            result.scenario,
+            str(result.size),
+            str(result.elements),
+            f"{result.ops_per_second:,.1f}",
+            f"{result.construct_us:,.0f}",
+            f"{result.render_us:,.0f}",
+            f"{result.per_element_us:,.1f}"
+            + format_change(result.per_element_us, previous.get("per_element_us")),
+            f"{result.html_bytes:,}"
+            + format_change(result.html_bytes, previous.get("html_bytes")),
+            f"{result.peak_allocation_bytes / 1024:,.0f}"
+            + format_change(
+                result.peak_allocation_bytes, previous.get("peak_allocation_bytes")
+            ),
+        )
+
+    console.print(table)
+
+
+@click.command()
+@click.option(
+    "--scenario",
+    "-s",
+    "scenarios",
+    multiple=True,
+    type=click.Choice(list(SCENARIOS), case_sensitive=False),
+    help="Scenario to run (repeatable). Runs every scenario by default.",
+)
+@click.option(
+    "--size",
+    "-n",
+    "sizes",
+    multiple=True,
+    type=int,
+    default=(1, 10, 100),
+    show_default=True,
+    help="Number of repeated items per scenario (repeatable)",
+)
+@click.option(
+    "--repeat",
+    "-r",
+    type=int,
+    default=5,
+    show_default=True,
+    help="Measured rounds per scenario and size",
+)
+@click.option(
+    "--save",
+    type=click.Path(dir_okay=False, path_type=Path),
+    help="Save the results as a JSON baseline",
+)
+@click.option(
+    "--compare",
+    type=click.Path(exists=True, dir_okay=False, path_type=Path),
+    help="Compare the results against a saved JSON baseline",
+)
+def main(
+    scenarios: tuple[str, ...],
+    sizes: tuple[int, ...],
+    repeat: int,
+    save: Path | None,
+    compare: Path | None,
+):
+    console = Console()
+    baseline = load_baseline(compare) if compare else None
+
+    results = []
+    with console.status("Running benchmarks...") as status:
+        for scenario in scenarios or SCENARIOS:
+            for size in sizes:
+                status.update(f"Running [cyan]{scenario}[/cyan] (size={size})...")
+                results.append(
+                    run_scenario(scenario, SCENARIOS[scenario], size, repeat)
+                )
+
+    display_results(console, results, baseline)
+
+    if save:
+        save.parent.mkdir(parents=True, exist_ok=True)
+        save.write_text(
+            json.dumps(
+                {
+                    "altar_ui_version": __version__,
+                    "python_version": platform.python_version(),
+                    "platform": platform.platform(),
+                    "created_at": datetime.now(UTC).isoformat(),
+                    "repeat": repeat,
+                    "results": [result._asdict() for result in results],
+                },
+                indent=2,
+            )
+        )
+        console.print(f"Saved baseline to [bold cyan]`{save}`[/bold cyan]")
+
+
+if __name__ == "__main__":
+    main()
@@ -4,7 +4,6 @@ from typing import Literal, Self
 
 from aether import BaseWebElement
 from aether.plugins.alpinejs import AlpineJSData, Statement, alpine_js_data_merge
-from aether.plugins.tailwindcss import tw_merge
 from aether.tags.html import (
     Button as PyButton,
 )
@@ -14,6 +13,8 @@ from aether.tags.html import (
 from aether.tags.html import Div, DivAttributes
 from altar_icons import ChevronDownIcon
 
+from .utils import tw_merge
+
 try:
     from typing import Unpack
 except ImportError:
@@ -3,9 +3,10 @@ from enum import StrEnum
 from typing import Literal, Self
 
 from aether import BaseWebElement
-from aether.plugins.tailwindcss import tw_merge
 from aether.tags.html import Div, DivAttributes, P
 
+from .utils import tw_merge
+
 try:
     from typing import Unpack
 except ImportError:
@@ -17,20 +18,27 @@ class AlertVariant(StrEnum):
     destructive = "text-destructive bg-card [&>svg]:text-current *:data-[slot=alert-description]:text-destructive/90"
 
 
+_alert_base_class_attribute = "grid grid-cols-[0_1fr] relative gap-y-0.5 items-start px-4 py-3 w-full text-sm rounded-lg border has-[>svg]:grid-cols-[calc(var(--spacing)*4)_1fr] has-[>svg]:gap-x-3 [&>svg]:text-current [&>svg]:translate-y-0.5 [&>svg]:size-4"
+
+_alert_class_attributes = {
+    variant: tw_merge(AlertVariant[variant], _alert_base_class_attribute)
+    for variant in AlertVariant.__members__
+}
+
+
 class Alert(Div):
     def __init__(
         self,
         variant: Literal["default", "destructive"] = "default",
         **attributes: Unpack[DivAttributes],
     ):
-        base_class_attribute = "grid grid-cols-[0_1fr] relative gap-y-0.5 items-start px-4 py-3 w-full text-sm rounded-lg border has-[>svg]:grid-cols-[calc(var(--spacing)*4)_1fr] has-[>svg]:gap-x-3 [&>svg]:text-current [&>svg]:translate-y-0.5 [&>svg]:size-4"
-        variant_class_attribute = AlertVariant[variant]
+        compiled_class_attribute = _alert_class_attributes[variant]
         class_attribute = attributes.pop("_class", "")
 
         super().__init__(
-            _class=tw_merge(
-                variant_class_attribute, base_class_attribute, class_attribute
-            ),
+            _class=tw_merge(compiled_class_attribute, class_attribute)
+            if class_attribute
+            else compiled_class_attribute,
             data_slot="alert",
             role="alert",
             **attributes,
@@ -0,0 +1,186 @@
+import hashlib
+import warnings
+from collections.abc import Generator, Iterable
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Self
+
+from aether import mark_safe
+from aether.plugins.alpinejs import AlpineJSData, Statement
+from aether.tags.html import Script, ScriptAttributes
+
+try:
+    from typing import Unpack
+except ImportError:
+    from typing_extensions import Unpack  # noqa: UP035
+
+
+_alpine_data_definitions: dict[str, AlpineJSData] = {}
+_alpine_data_registry: ContextVar[set[str] | None] = ContextVar(
+    "_alpine_data_registry", default=None
+)
+_alpine_runtime_constants: ContextVar[dict[str, dict[str, str]] | None] = ContextVar(
+    "_alpine_runtime_constants", default=None
+)
+_alpine_data_runtimes: ContextVar[list["AlpineDataRuntime"] | None] = ContextVar(
+    "_alpine_data_runtimes", default=None
+)
+
+
+def register_alpine_data(name: str, data: AlpineJSData) -> None:
+    if data.directive != "x-data":
+        raise ValueError(
+            f"Only 'x-data' can be registered as an Alpine component, but got '{data.directive}'."
+        )
+
+    # Instance values passed from the markup are spread after the defaults,
+    # so every registered component accepts a single (optional) config object.
+    _alpine_data_definitions[name] = AlpineJSData(
+        data={
+            **{
+                key: value
+                for key, value in data.data.items()
+                if not isinstance(value, Statement) or value.seq_type != "definition"
+            },
+            "...config": Statement("...config", seq_type="instance"),
+            **{
+                key: value
+                for key, value in data.data.items()
+                if isinstance(value, Statement) and value.seq_type == "definition"
+            },
+        },
+        directive="x-data",
+    )
+
+
+@contextmanager
+def alpine_data_registry() -> Generator[set[str]]:
+    used_alpine_data = set()
+    runtime_constants = {}
+    alpine_data_runtimes = []
+    token = _alpine_data_registry.set(used_alpine_data)
+    constants_token = _alpine_runtime_constants.set(runtime_constants)
+    runtimes_token = _alpine_data_runtimes.set(alpine_data_runtimes)
+    try:
+        yield used_alpine_data
+    finally:
+        _alpine_data_runtimes.reset(runtimes_token)
+        _alpine_runtime_constants.reset(constants_token)
+        _alpine_data_registry.reset(token)
+
+    # Elements built inside the registry only refer to their runtime constants
+    # (e.g. form validation specs) by id, so they need a runtime from the same
+    # registry to emit them. Nested registries only collect for the outer one.
+    if (
+        runtime_constants
+        and not alpine_data_runtimes
+        and _alpine_data_registry.get() is None
+    ):
+        warnings.warn(
+            "Runtime constants were used inside `alpine_data_registry()`, but no `AlpineDataRuntime` was created inside it to emit them.",
+            UserWarning,
+            stacklevel=3,
+        )
+
+
+def use_alpine_data(name: str, config: dict[str, Any] | None = None) -> str | None:
+    used_alpine_data = _alpine_data_registry.get()
+    if used_alpine_data is None:
+        return None
+
+    if name not in _alpine_data_definitions:
+        raise ValueError(f"No Alpine component registered under the name '{name}'.")
+
+    used_alpine_data.add(name)
+
+    return f"{name}({AlpineJSData(data=config, directive='x-data') if config else ''})"
+
+
+def use_alpine_runtime_constant(global_name: str, content: str) -> str | None:
+    runtime_constants = _alpine_runtime_constants.get()
+    if runtime_constants is None:
+        return None
+
+    # Constants are keyed by a hash of their content, so identical ones
+    # (e.g. the same validation spec on many fields) are emitted only once.
+    # They end up in a `<script>` element, which must not be closed early.
+    content = content.replace("</", "<\\/")
+    constant_id = hashlib.blake2s(content.encode(), digest_size=6).hexdigest()
+    runtime_constants.setdefault(global_name, {})[constant_id] = content
+
+    return constant_id
+
+
+def _build_alpine_runtime_constants(
+    runtime_constants: dict[str, dict[str, str]],
+) -> str:
+    return "".join(
+        f"window.{global_name} = Object.assign(window.{global_name} || {{}}, {{ "
+        + ", ".join(
+            f"'{constant_id}': {content}" for constant_id, content in contents.items()
+        )
+        + " });"
+        for global_name, contents in sorted(runtime_constants.items())
+    )
+
+
+def _build_alpine_data_runtime(names: Iterable[str]) -> str:
+    registrations = "".join(
+        f"Alpine.data('{name}', (config = {{}}) => ({_alpine_data_definitions[name]}));"
+        for name in sorted(names)
+    )
+
+    return f"document.addEventListener('alpine:init', () => {{ {registrations} }});"
+
+
+class AlpineDataRuntime(Script):
+    def __init__(self, *names: str, **attributes: Unpack[ScriptAttributes]):
+        for name in names:
+            if name not in _alpine_data_definitions:
+                raise ValueError(
+                    f"No Alpine component registered under the name '{name}'."
+                )
+
+        super().__init__(**attributes)
+
+        # With a registry active, only the components constructed inside it are
+        # emitted. They are collected up to the moment this script is rendered,
+        # so it can be placed before the components in the page.
+        self.names = names
+        self.used_alpine_data = _alpine_data_registry.get()
+        self.runtime_constants = _alpine_runtime_constants.get()
+        if (alpine_data_runtimes := _alpine_data_runtimes.get()) is not None:
+            alpine_data_runtimes.append(self)
+
+    def __call__(self, *_children: tuple) -> Self:
+        warnings.warn(
+            f"Trying to add child to a non-child element: {self.__class__.__qualname__}",
+            UserWarning,
+            stacklevel=2,
+        )
+
+        return self
+
+    def render(self, stringify: bool = True) -> Generator[str]:
+        if self.names:
+            names = self.names
+        elif self.used_alpine_data is not None:
+            names = self.used_alpine_data
+        else:
+            names = _alpine_data_definitions
+
+        # The constants are emitted in a `<script>` of their own, so one that
+        # fails to parse cannot take the component registrations down with it.
+        if self.runtime_constants:
+            constants_attributes = (
+                {"nonce": self.attributes["nonce"]}
+                if "nonce" in self.attributes
+                else {}
+            )
+            yield from Script(**constants_attributes)(
+                mark_safe(_build_alpine_runtime_constants(self.runtime_constants))
+            ).render(stringify)
+
+        self.children = [mark_safe(_build_alpine_data_runtime(names))]
+
+        yield from super().render(stringify)
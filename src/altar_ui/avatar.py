@@ -1,7 +1,8 @@
 from aether.plugins.alpinejs import AlpineJSData, Statement, alpine_js_data_merge
-from aether.plugins.tailwindcss import tw_merge
 from aether.tags.html import Img, ImgAttributes, Span, SpanAttributes
 
+from .utils import tw_merge
+
 try:
     from typing import Unpack
 except ImportError:
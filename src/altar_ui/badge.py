@@ -1,9 +1,10 @@
 from enum import StrEnum
 from typing import Literal
 
-from aether.plugins.tailwindcss import tw_merge
 from aether.tags.html import Span, SpanAttributes
 
+from .utils import tw_merge
+
 try:
     from typing import Unpack
 except ImportError:
@@ -19,20 +20,27 @@ class BadgeVariant(StrEnum):
     secondary = "border-transparent bg-secondary text-secondary-foreground [a&]:hover:bg-secondary/90"
 
 
+_badge_base_class_attribute = "inline-flex overflow-hidden gap-1 justify-center items-center px-2 py-0.5 w-fit font-medium text-xs whitespace-nowrap rounded-md border transition-[color,box-shadow] shrink-0 aria-invalid:ring-destructive/20 aria-invalid:border-destructive dark:aria-invalid:ring-destructive/40 focus-visible:border-ring focus-visible:ring-ring/50 focus-visible:ring-[3px] [&>svg]:pointer-events-none [&>svg]:size-3"
+
+_badge_class_attributes = {
+    variant: tw_merge(BadgeVariant[variant], _badge_base_class_attribute)
+    for variant in BadgeVariant.__members__
+}
+
+
 class Badge(Span):
     def __init__(
         self,
         variant: Literal["default", "destructive", "outline", "secondary"] = "default",
         **attributes: Unpack[SpanAttributes],
     ):
-        base_class_attribute = "inline-flex overflow-hidden gap-1 justify-center items-center px-2 py-0.5 w-fit font-medium text-xs whitespace-nowrap rounded-md border transition-[color,box-shadow] shrink-0 aria-invalid:ring-destructive/20 aria-invalid:border-destructive dark:aria-invalid:ring-destructive/40 focus-visible:border-ring focus-visible:ring-ring/50 focus-visible:ring-[3px] [&>svg]:pointer-events-none [&>svg]:size-3"
-        variant_class_attribute = BadgeVariant[variant]
+        compiled_class_attribute = _badge_class_attributes[variant]
         class_attribute = attributes.pop("_class", "")
 
         super().__init__(
-            _class=tw_merge(
-                variant_class_attribute, base_class_attribute, class_attribute
-            ),
+            _class=tw_merge(compiled_class_attribute, class_attribute)
+            if class_attribute
+            else compiled_class_attribute,
             data_slot="badge",
             **attributes,
         )
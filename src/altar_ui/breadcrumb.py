@@ -1,7 +1,6 @@
 import warnings
 from typing import Self
 
-from aether.plugins.tailwindcss import tw_merge
 from aether.tags.html import (
     A,
     AAttributes,
@@ -17,6 +16,7 @@ from aether.tags.html import (
 from altar_icons import BaseSVGIconElement, ChevronRightIcon, EllipsisIcon
 
 from .passthrough import Passthrough
+from .utils import tw_merge
 
 try:
     from typing import Unpack
@@ -1,10 +1,11 @@
 from enum import StrEnum
 from typing import Literal
 
-from aether.plugins.tailwindcss import tw_merge
 from aether.tags.html import Button as PyButton
 from aether.tags.html import ButtonAttributes as PyButtonAttributes
 
+from .utils import tw_merge
+
 try:
     from typing import Unpack
 except ImportError:
@@ -27,6 +28,21 @@ class ButtonSize(StrEnum):
     icon = "size-9"
 
 
+_button_base_class_attribute = "inline-flex gap-2 justify-center items-center font-medium text-sm whitespace-nowrap rounded-md outline-none transition-all [&_svg:not([class*='size-'])]:size-4 shrink-0 aria-invalid:ring-destructive/20 aria-invalid:border-destructive dark:aria-invalid:ring-destructive/40 disabled:opacity-50 disabled:pointer-events-none focus-visible:border-ring focus-visible:ring-ring/50 focus-visible:ring-[3px] [&_svg]:pointer-events-none [&_svg]:shrink-0"
+
+# Every `variant` x `size` combination is merged once at import time, so building
+# a `Button` without a custom `_class` is a dictionary lookup.
+_button_class_attributes = {
+    (variant, size): tw_merge(
+        ButtonVariant[variant] if variant is not None else "",
+        ButtonSize[size],
+        _button_base_class_attribute,
+    )
+    for variant in [*ButtonVariant.__members__, None]
+    for size in ButtonSize.__members__
+}
+
+
 class Button(PyButton):
     def __init__(
         self,
@@ -37,21 +53,15 @@ class Button(PyButton):
         size: Literal["default", "sm", "lg", "icon"] = "default",
         **attributes: Unpack[PyButtonAttributes],
     ):
-        base_class_attribute = "inline-flex gap-2 justify-center items-center font-medium text-sm whitespace-nowrap rounded-md outline-none transition-all [&_svg:not([class*='size-'])]:size-4 shrink-0 aria-invalid:ring-destructive/20 aria-invalid:border-destructive dark:aria-invalid:ring-destructive/40 disabled:opacity-50 disabled:pointer-events-none focus-visible:border-ring focus-visible:ring-ring/50 focus-visible:ring-[3px] [&_svg]:pointer-events-none [&_svg]:shrink-0"
-        size_class_attribute = ButtonSize[size]
-        variant_class_attribute = ButtonVariant[variant] if variant is not None else ""
-
+        compiled_class_attribute = _button_class_attributes[(variant, size)]
         class_attribute = attributes.pop("_class", "")
 
         data_slot = attributes.pop("data_slot", "button")
 
         super().__init__(
-            _class=tw_merge(
-                variant_class_attribute,
-                size_class_attribute,
-                base_class_attribute,
-                class_attribute,
-            ),
+            _class=tw_merge(compiled_class_attribute, class_attribute)
+            if class_attribute
+            else compiled_class_attribute,
             data_slot=data_slot,
             **attributes,
         )
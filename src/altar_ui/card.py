@@ -1,6 +1,7 @@
-from aether.plugins.tailwindcss import tw_merge
 from aether.tags.html import Div, DivAttributes
 
+from .utils import tw_merge
+
 try:
     from typing import Unpack
 except ImportError:
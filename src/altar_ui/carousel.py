@@ -3,12 +3,13 @@ from typing import Literal, Self
 
 from aether import BaseWebElement
 from aether.plugins.alpinejs import AlpineJSData, Statement, alpine_js_data_merge
-from aether.plugins.tailwindcss import tw_merge
 from aether.tags.html import ButtonAttributes as PyButtonAttributes
 from aether.tags.html import Div, DivAttributes, Span
 from altar_icons import ArrowLeftIcon, ArrowRightIcon
 
+from .alpine import register_alpine_data, use_alpine_data
 from .button import Button
+from .utils import LazyChildren, tw_merge
 
 try:
     from typing import Unpack
@@ -16,6 +17,30 @@ except ImportError:
     from typing_extensions import Unpack  # noqa: UP035
 
 
+def _carousel_x_data_attribute(
+    orientation: Literal["horizontal", "vertical"], number_of_slides: int
+) -> AlpineJSData:
+    return AlpineJSData(
+        data={
+            "carouselOrientation": orientation,
+            "slideLength": number_of_slides,
+            "currentSlideIndex": 1,
+            "previousSlide()": Statement(
+                "{ if (this.currentSlideIndex > 1) { this.currentSlideIndex -= 1 } else { this.currentSlideIndex = this.slideLength } }",
+                seq_type="definition",
+            ),
+            "nextSlide()": Statement(
+                "{ if (this.currentSlideIndex < this.slideLength) { this.currentSlideIndex += 1 } else { this.currentSlideIndex = 1 } }",
+                seq_type="definition",
+            ),
+        },
+        directive="x-data",
+    )
+
+
+register_alpine_data("altarCarousel", _carousel_x_data_attribute("horizontal", 1))
+
+
 class Carousel(Div):
     def __init__(
         self,
@@ -24,28 +49,25 @@ class Carousel(Div):
         **attributes: Unpack[DivAttributes],
     ):
         base_class_attribute = "relative"
-        base_x_data_attribute = AlpineJSData(
-            data={
-                "carouselOrientation": orientation,
-                "slideLength": number_of_slides,
-                "currentSlideIndex": 1,
-                "previousSlide()": Statement(
-                    "{ if (this.currentSlideIndex > 1) { this.currentSlideIndex -= 1 } else { this.currentSlideIndex = this.slideLength } }",
-                    seq_type="definition",
-                ),
-                "nextSlide()": Statement(
-                    "{ if (this.currentSlideIndex < this.slideLength) { this.currentSlideIndex += 1 } else { this.currentSlideIndex = 1 } }",
-                    seq_type="definition",
-                ),
-            },
-            directive="x-data",
-        )
         x_data_attribute = attributes.pop("x_data", None)
         class_attribute = attributes.pop("_class", "")
 
+        if x_data_attribute is None and (
+            registered_x_data_attribute := use_alpine_data(
+                "altarCarousel",
+                {"carouselOrientation": orientation, "slideLength": number_of_slides},
+            )
+        ):
+            x_data_attribute = registered_x_data_attribute
+        else:
+            x_data_attribute = alpine_js_data_merge(
+                _carousel_x_data_attribute(orientation, number_of_slides),
+                x_data_attribute,
+            )
+
         super().__init__(
             _class=tw_merge(base_class_attribute, class_attribute),
-            x_data=alpine_js_data_merge(base_x_data_attribute, x_data_attribute),
+            x_data=x_data_attribute,
             role="region",
             aria_roledescription="carousel",
             data_slot="carousel",
@@ -71,7 +93,7 @@ class CarouselContent(Div):
             ):
                 forwarded_children.append(child)
             elif isinstance(child, Generator):
-                forwarded_children.extend(list(child))
+                forwarded_children.append(LazyChildren(child))
             elif isinstance(child, type(None)):
                 continue
             else:
@@ -1,10 +1,28 @@
+import array
+import base64
+import json
+import math
+import re
+import sys
 import warnings
-from typing import Self
+from collections.abc import Mapping, Sequence
+from datetime import date, datetime, timedelta, timezone
+from typing import Any, Literal, NamedTuple, Self
 
+from aether import mark_safe
 from aether.plugins.alpinejs import AlpineJSData, Statement, alpine_js_data_merge
-from aether.plugins.chartjs import build_chart_config_from_attributes
-from aether.plugins.tailwindcss import tw_merge
-from aether.tags.html import Canvas, Div, DivAttributes
+from aether.plugins.chartjs import ChartJSConfig, build_chart_config_from_attributes
+from aether.tags.html import Canvas, Div, DivAttributes, Script, ScriptAttributes
+from pydantic_core import to_json
+
+from .alpine import register_alpine_data, use_alpine_data
+from .utils import (
+    _column_to_list,
+    _escape_script_json,
+    _is_array_like,
+    _is_plottable,
+    tw_merge,
+)
 
 try:
     from typing import Unpack
@@ -12,6 +30,980 @@ except ImportError:
     from typing_extensions import Unpack  # noqa: UP035
 
 
+class ChartDownsampleReport(NamedTuple):
+    label: str
+    original_points: int
+    downsampled_points: int
+
+
+def largest_triangle_three_buckets(
+    x_values: Sequence[float], y_values: Sequence[float], max_points: int
+) -> list[int]:
+    if max_points < 3:
+        raise ValueError(f"'max_points' must be at least 3, got {max_points}.")
+
+    number_of_points = len(y_values)
+    if number_of_points <= max_points:
+        return list(range(number_of_points))
+
+    # The first and last points are always kept; every bucket in between keeps
+    # the point forming the largest triangle with the previously kept point and
+    # the average of the next bucket.
+    bucket_size = (number_of_points - 2) / (max_points - 2)
+    indices = [0]
+    selected_index = 0
+    for bucket in range(max_points - 2):
+        next_bucket_start = int((bucket + 1) * bucket_size) + 1
+        next_bucket_end = min(int((bucket + 2) * bucket_size) + 1, number_of_points)
+        next_bucket_length = next_bucket_end - next_bucket_start
+        average_x = (
+            sum(x_values[next_bucket_start:next_bucket_end]) / next_bucket_length
+        )
+        average_y = (
+            sum(y_values[next_bucket_start:next_bucket_end]) / next_bucket_length
+        )
+
+        selected_x = x_values[selected_index]
+        selected_y = y_values[selected_index]
+        largest_area = -1.0
+        for index in range(int(bucket * bucket_size) + 1, next_bucket_start):
+            area = abs(
+                (selected_x - average_x) * (y_values[index] - selected_y)
+                - (selected_x - x_values[index]) * (average_y - selected_y)
+            )
+            if area > largest_area:
+                largest_area = area
+                next_selected_index = index
+
+        indices.append(next_selected_index)
+        selected_index = next_selected_index
+
+    indices.append(number_of_points - 1)
+
+    return indices
+
+
+def min_max_buckets(y_values: Sequence[float], max_points: int) -> list[int]:
+    if max_points < 4:
+        raise ValueError(f"'max_points' must be at least 4, got {max_points}.")
+
+    number_of_points = len(y_values)
+    if number_of_points <= max_points:
+        return list(range(number_of_points))
+
+    # Each bucket keeps its lowest and highest point, in their original order,
+    # so peaks and troughs survive the reduction.
+    number_of_buckets = (max_points - 2) // 2
+    bucket_size = (number_of_points - 2) / number_of_buckets
+    indices = [0]
+    for bucket in range(number_of_buckets):
+        bucket_indices = range(
+            int(bucket * bucket_size) + 1, int((bucket + 1) * bucket_size) + 1
+        )
+        if not bucket_indices:
+            continue
+
+        minimum_index = min(bucket_indices, key=y_values.__getitem__)
+        maximum_index = max(bucket_indices, key=y_values.__getitem__)
+        indices.extend(sorted({minimum_index, maximum_index}))
+
+    indices.append(number_of_points - 1)
+
+    return indices
+
+
+def _downsample_dataset(
+    data: Sequence[Any], max_points: int, method: Literal["lttb", "minmax"]
+) -> list[int]:
+    # Plain series of finite numbers (the common case) are used as they are,
+    # without copying them point by point.
+    if all(type(point) in (int, float) for point in data) and math.isfinite(sum(data)):
+        match method:
+            case "lttb":
+                return largest_triangle_three_buckets(
+                    range(len(data)), data, max_points
+                )
+            case "minmax":
+                return min_max_buckets(data, max_points)
+
+    plottable_indices = []
+    x_values = []
+    y_values = []
+    for index, point in enumerate(data):
+        if isinstance(point, dict):
+            x_value = point.get("x", index)
+            y_value = point.get("y")
+        else:
+            x_value = index
+            y_value = point
+
+        if _is_plottable(y_value):
+            plottable_indices.append(index)
+            x_values.append(x_value if _is_plottable(x_value) else index)
+            y_values.append(y_value)
+
+    match method:
+        case "lttb":
+            selected_indices = largest_triangle_three_buckets(
+                x_values, y_values, max_points
+            )
+        case "minmax":
+            selected_indices = min_max_buckets(y_values, max_points)
+
+    return [plottable_indices[index] for index in selected_indices]
+
+
+def _serialize_column(values: list[Any]) -> str:
+    return to_json(values, inf_nan_mode="null").decode()
+
+
+def _encode_column(
+    values: list[Any], encoding: Literal["float32", "float64"], delta: bool
+) -> str | None:
+    bits_typecode, bits_mask = (
+        ("I", 0xFFFFFFFF) if encoding == "float32" else ("Q", 2**64 - 1)
+    )
+
+    try:
+        buffer = array.array("d", values)
+    except TypeError:
+        if not all(
+            value is None
+            or (isinstance(value, int | float) and not isinstance(value, bool))
+            for value in values
+        ):
+            return None
+        buffer = array.array(
+            "d", [math.nan if value is None else value for value in values]
+        )
+
+    # The JSON mode writes every non-finite value (and `None`) as `null`, and
+    # the browser decodes NaN as `null`, so infinities are stored as NaN.
+    if not math.isfinite(sum(buffer)):
+        buffer = array.array(
+            "d", [value if math.isfinite(value) else math.nan for value in buffer]
+        )
+
+    if encoding == "float32":
+        buffer = array.array("f", buffer)
+        if any(map(math.isinf, buffer)):
+            warnings.warn(
+                "Some chart values are out of the 'float32' range, serializing the column as JSON instead.",
+                UserWarning,
+                stacklevel=3,
+            )
+            return None
+
+    # Deltas are taken between the raw bit patterns, modulo the word size,
+    # so decoding them restores every value exactly.
+    if delta and buffer:
+        bits = memoryview(buffer).cast("B").cast(bits_typecode)
+        buffer = array.array(
+            bits_typecode,
+            [bits[0]]
+            + [
+                (current - previous) & bits_mask
+                for previous, current in zip(bits, bits[1:], strict=False)
+            ],
+        )
+
+    # Typed arrays use the byte order of the browser, which is little-endian
+    # on every supported platform.
+    if sys.byteorder == "big":
+        buffer.byteswap()
+
+    return json.dumps(
+        {
+            "encoding": encoding,
+            "delta": delta,
+            "data": base64.b64encode(buffer.tobytes()).decode("ascii"),
+        },
+        separators=(",", ":"),
+    )
+
+
+def _defer_chart_column(
+    deferred_columns: dict[str, tuple[list[Any], bool]],
+    values: list[Any],
+    is_label_column: bool = False,
+) -> list[str]:
+    # The column is swapped for a placeholder, so pydantic neither validates
+    # nor serializes it value by value. It is serialized in one go and spliced
+    # back into the dumped config afterwards.
+    placeholder = f"__altar_chart_column_{len(deferred_columns)}__"
+    deferred_columns[json.dumps([placeholder])] = (values, is_label_column)
+
+    return [placeholder]
+
+
+def _extract_chart_columns(
+    chart_attributes: dict[str, Any],
+    precision: int | None,
+    defer: bool,
+    encode: bool,
+) -> dict[str, tuple[list[Any], bool]]:
+    deferred_columns = {}
+
+    def extract(values: Any, is_label_column: bool = False) -> Any:
+        if not _is_array_like(values) and (
+            is_label_column or (precision is None and not (defer and encode))
+        ):
+            return values
+
+        values = _column_to_list(values, None if is_label_column else precision)
+        # Labels are strings in the chart config, whether they are deferred or
+        # (for downsampling) left in the config.
+        if is_label_column:
+            values = [str(value) for value in values]
+        if not defer:
+            return values
+
+        return _defer_chart_column(deferred_columns, values, is_label_column)
+
+    if "chart_labels" in chart_attributes:
+        chart_attributes["chart_labels"] = extract(
+            chart_attributes["chart_labels"], is_label_column=True
+        )
+    if "chart_data" in chart_attributes:
+        chart_attributes["chart_data"] = extract(chart_attributes["chart_data"])
+    if "chart_datasets" in chart_attributes:
+        chart_attributes["chart_datasets"] = [
+            {**dataset, "data": extract(dataset["data"])}
+            if "data" in dataset
+            else dataset
+            for dataset in chart_attributes["chart_datasets"]
+        ]
+
+    return deferred_columns
+
+
+def _downsample_chart_config(
+    chart_config: ChartJSConfig,
+    max_points: int,
+    method: Literal["lttb", "minmax"],
+) -> list[ChartDownsampleReport]:
+    datasets = chart_config.data.datasets
+    labels = chart_config.data.labels
+    reports = [
+        ChartDownsampleReport(
+            label=dataset.label,
+            original_points=len(dataset.data),
+            downsampled_points=len(dataset.data),
+        )
+        for dataset in datasets
+    ]
+
+    # Datasets sharing the label axis have to stay aligned with it, so the
+    # points kept for any of them are kept for all of them. The budget is
+    # split between the datasets, so their union stays within `max_points`.
+    if labels:
+        if len(labels) <= max_points or not datasets:
+            return reports
+        if any(len(dataset.data) != len(labels) for dataset in datasets):
+            warnings.warn(
+                "Skipping downsampling, every dataset must have as many points as there are labels.",
+                UserWarning,
+                stacklevel=3,
+            )
+            return reports
+
+        dataset_max_points = max(
+            max_points // len(datasets), 3 if method == "lttb" else 4
+        )
+        selected_indices = sorted(
+            set().union(
+                *(
+                    _downsample_dataset(dataset.data, dataset_max_points, method)
+                    for dataset in datasets
+                )
+            )
+        )
+
+        # With many datasets and a tiny budget, the smallest per-dataset
+        # selection can still add up to more than `max_points`.
+        if len(selected_indices) > max_points:
+            selected_indices = [
+                selected_indices[
+                    round(index * (len(selected_indices) - 1) / (max_points - 1))
+                ]
+                for index in range(max_points)
+            ]
+        chart_config.data.labels = [labels[index] for index in selected_indices]
+        for dataset in datasets:
+            dataset.data = [dataset.data[index] for index in selected_indices]
+    else:
+        for dataset in datasets:
+            if len(dataset.data) > max_points:
+                dataset.data = [
+                    dataset.data[index]
+                    for index in _downsample_dataset(dataset.data, max_points, method)
+                ]
+
+    return [
+        report._replace(downsampled_points=len(dataset.data))
+        for report, dataset in zip(reports, datasets, strict=True)
+    ]
+
+
+_time_bucket_formats = {
+    "minute": "%Y-%m-%dT%H:%M",
+    "hour": "%Y-%m-%dT%H",
+    "day": "%Y-%m-%d",
+    "week": "%Y-%m-%d",
+    "month": "%Y-%m",
+    "year": "%Y",
+}
+_time_bucket_units = {
+    "minute": "m",
+    "hour": "h",
+    "day": "D",
+    "week": "D",
+    "month": "M",
+    "year": "Y",
+}
+_percentile_statistic_pattern = re.compile(r"p(\d+(?:\.\d+)?)")
+
+
+def _statistic_quantile(statistic: str) -> float | None:
+    match statistic:
+        case "sum" | "count" | "mean":
+            return None
+        case "min":
+            return 0.0
+        case "median":
+            return 0.5
+        case "max":
+            return 1.0
+
+    percentile_match = _percentile_statistic_pattern.fullmatch(statistic)
+    if percentile_match is None or float(percentile_match.group(1)) > 100:
+        raise ValueError(
+            f"'statistic' must be one of 'sum', 'count', 'mean', 'min', 'max', 'median' or a percentile such as 'p95', but got '{statistic}'."
+        )
+
+    return float(percentile_match.group(1)) / 100
+
+
+def _time_bucket_type_error(type_name: str) -> TypeError:
+    return TypeError(
+        f"'time_bucket' can only group dates, datetimes and ISO 8601 strings, but got '{type_name}'."
+    )
+
+
+def _truncate_datetime(value: date | str, time_bucket: str) -> str:
+    # Like the NumPy path, ISO 8601 strings are parsed and aware datetimes are
+    # bucketed in UTC.
+    if isinstance(value, str):
+        value = datetime.fromisoformat(value)
+    elif not isinstance(value, date):
+        raise _time_bucket_type_error(type(value).__qualname__)
+    if isinstance(value, datetime) and value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+
+    if time_bucket == "week":
+        value = value - timedelta(days=value.weekday())
+
+    return value.strftime(_time_bucket_formats[time_bucket])
+
+
+def _quantile_of_sorted(values: list[float], quantile: float) -> float:
+    # Linear interpolation between the closest ranks, as NumPy does by default.
+    position = quantile * (len(values) - 1)
+    lower_index = math.floor(position)
+    upper_index = math.ceil(position)
+    return values[lower_index] + (values[upper_index] - values[lower_index]) * (
+        position - lower_index
+    )
+
+
+def _aggregate_lists(
+    keys: Sequence[Any],
+    values: Sequence[Any] | None,
+    series: Sequence[Any] | None,
+    statistic: str,
+    time_bucket: str | None,
+) -> tuple[list[str], list[str] | None, list[list[float | None]]]:
+    quantile = _statistic_quantile(statistic)
+
+    groups: dict[tuple[Any, Any], list[float]] = {}
+    for index, key in enumerate(keys):
+        if key is None:
+            continue
+        value = values[index] if values is not None else 1
+        if not _is_plottable(value):
+            continue
+        if time_bucket is not None:
+            key = _truncate_datetime(key, time_bucket)
+
+        groups.setdefault(
+            (key, series[index] if series is not None else None), []
+        ).append(value)
+
+    labels = sorted({key for key, _ in groups})
+    series_labels = (
+        sorted({series_key for _, series_key in groups})
+        if series is not None
+        else [None]
+    )
+
+    columns = []
+    for series_key in series_labels:
+        column = []
+        for label in labels:
+            group = groups.get((label, series_key))
+            if not group:
+                column.append(0 if statistic in ("sum", "count") else None)
+            elif statistic == "count":
+                column.append(len(group))
+            elif statistic == "sum":
+                column.append(math.fsum(group))
+            elif statistic == "mean":
+                column.append(math.fsum(group) / len(group))
+            else:
+                column.append(_quantile_of_sorted(sorted(group), quantile))
+        columns.append(column)
+
+    return (
+        [str(label) for label in labels],
+        [str(series_key) for series_key in series_labels]
+        if series is not None
+        else None,
+        columns,
+    )
+
+
+def _aggregate_arrays(
+    keys: Any,
+    values: Any | None,
+    series: Any | None,
+    statistic: str,
+    time_bucket: str | None,
+) -> tuple[list[str], list[str] | None, list[Any]]:
+    import numpy as np
+
+    quantile = _statistic_quantile(statistic)
+
+    keys = np.asarray(keys)
+    if time_bucket is not None:
+        # NumPy would read numbers as offsets from the epoch, so only the keys
+        # the list path accepts are converted.
+        if keys.dtype.kind in "biufc":
+            raise _time_bucket_type_error(keys.dtype.name)
+        if keys.dtype.kind == "O":
+            for key in keys.tolist():
+                if key is not None and not isinstance(key, date | str):
+                    raise _time_bucket_type_error(type(key).__qualname__)
+        keys = keys.astype(f"datetime64[{_time_bucket_units[time_bucket]}]")
+        if time_bucket == "week":
+            # The epoch is a Thursday, so weeks are shifted to start on Monday.
+            keys = keys - (keys.view("int64") + 3) % 7
+
+    mask = np.ones(len(keys), dtype=bool)
+    if keys.dtype.kind in "mM":
+        mask &= ~np.isnat(keys)
+    if values is not None:
+        values = np.asarray(values, dtype=float)
+        mask &= np.isfinite(values)
+    else:
+        values = np.ones(len(keys))
+    if series is not None:
+        series = np.asarray(series)
+    if not mask.all():
+        keys = keys[mask]
+        values = values[mask]
+        if series is not None:
+            series = series[mask]
+
+    labels, key_ids = np.unique(keys, return_inverse=True)
+    if series is not None:
+        series_labels, series_ids = np.unique(series, return_inverse=True)
+        group_ids = key_ids * len(series_labels) + series_ids
+        number_of_series = len(series_labels)
+    else:
+        group_ids = key_ids
+        number_of_series = 1
+    number_of_groups = len(labels) * number_of_series
+
+    counts = np.bincount(group_ids, minlength=number_of_groups)
+    if statistic == "count":
+        result = counts
+    elif statistic in ("sum", "mean"):
+        result = np.bincount(group_ids, weights=values, minlength=number_of_groups)
+        if statistic == "mean":
+            result = np.divide(
+                result,
+                counts,
+                out=np.full(number_of_groups, np.nan),
+                where=counts > 0,
+            )
+    else:
+        # Sorting by group, then by value, lays every group out as a sorted run,
+        # so the quantiles of all groups are interpolated in a single pass.
+        sorted_values = values[np.lexsort((values, group_ids))]
+        starts = np.concatenate(([0], np.cumsum(counts)[:-1]))
+        positions = starts + quantile * np.maximum(counts - 1, 0)
+        lower_indices = np.minimum(np.floor(positions).astype(int), len(values) - 1)
+        upper_indices = np.minimum(np.ceil(positions).astype(int), len(values) - 1)
+        if len(values):
+            result = sorted_values[lower_indices] + (
+                sorted_values[upper_indices] - sorted_values[lower_indices]
+            ) * (positions - lower_indices)
+        else:
+            result = np.full(number_of_groups, np.nan)
+        result[counts == 0] = np.nan
+
+    result = result.reshape(len(labels), number_of_series)
+
+    if time_bucket is not None:
+        labels = np.datetime_as_string(labels, unit=_time_bucket_units[time_bucket])
+
+    return (
+        [str(label) for label in labels.tolist()],
+        [str(label) for label in series_labels.tolist()]
+        if series is not None
+        else None,
+        [result[:, index] for index in range(number_of_series)],
+    )
+
+
+def aggregate_chart_data(
+    data: Mapping[str, Any],
+    by: str,
+    value: str | None = None,
+    statistic: str = "sum",
+    series: str | None = None,
+    time_bucket: Literal["minute", "hour", "day", "week", "month", "year"]
+    | None = None,
+    label: str | None = None,
+) -> dict[str, Any]:
+    if value is None and statistic != "count":
+        raise ValueError(
+            f"A 'value' column is required for the '{statistic}' statistic."
+        )
+    if time_bucket is not None and time_bucket not in _time_bucket_formats:
+        raise ValueError(
+            f"'time_bucket' must be one of {', '.join(repr(unit) for unit in _time_bucket_formats)}, but got '{time_bucket}'."
+        )
+
+    columns = {}
+    for column_name in (by, value, series):
+        if column_name is None:
+            continue
+        if column_name not in data:
+            raise ValueError(f"'{column_name}' is not a column of the chart data.")
+        columns[column_name] = data[column_name]
+
+    if len({len(column) for column in columns.values()}) > 1:
+        raise ValueError("All aggregated columns must have the same length.")
+
+    # Columns coming from NumPy (or pandas) are grouped with vectorized
+    # operations; plain sequences are grouped in a single Python pass.
+    aggregate = (
+        _aggregate_arrays
+        if any(_is_array_like(column) for column in columns.values())
+        else _aggregate_lists
+    )
+    labels, series_labels, aggregated_columns = aggregate(
+        columns[by],
+        columns[value] if value is not None else None,
+        columns[series] if series is not None else None,
+        statistic,
+        time_bucket,
+    )
+
+    if series_labels is None:
+        return {
+            "chart_labels": labels,
+            "chart_data": aggregated_columns[0],
+            "chart_label": label or (f"{value} ({statistic})" if value else statistic),
+        }
+
+    return {
+        "chart_labels": labels,
+        "chart_datasets": [
+            {
+                "label": series_label,
+                "data": aggregated_column,
+                "backgroundColor": f"var(--chart-{index % 5 + 1})",
+                "borderColor": f"var(--chart-{index % 5 + 1})",
+            }
+            for index, (series_label, aggregated_column) in enumerate(
+                zip(series_labels, aggregated_columns, strict=True)
+            )
+        ],
+    }
+
+
+_chart_x_data_attribute = AlpineJSData(
+    data={
+        "chart_instance": None,
+        "chart_config": None,
+        "chart_data_source": None,
+        "chart_colors_resolved": False,
+        "chart_stream": None,
+        "chart_stream_close": None,
+        "__resolveCSSVariablesFromConfig(raw_config)": Statement(
+            r"""{
+                if (typeof raw_config !== 'object' || raw_config === null) return raw_config;
+
+                if (Array.isArray(raw_config)) {
+                  return raw_config.map(item => this.__resolveCSSVariablesFromConfig(item));
+                }
+
+                const resolved_config = {};
+                for (const [key, value] of Object.entries(raw_config)) {
+                    if (typeof value === 'string' && value.includes('var(--')) {
+                        // Match `var(--variable) / opacity` or just `var(--variable)`
+                        const match = value.match(/var\((--[^)]+)\)(?:\s*\/\s*([\d.]+))?/);
+                        if (match) {
+                            const variableName = match[1];
+                            const opacity = match[2] ? parseFloat(match[2]) : 1;
+
+                            let color = getComputedStyle(document.documentElement).getPropertyValue(variableName).trim();
+
+                            if (opacity < 1) {
+                                if (color.includes('oklch')) {
+                                    const oklchMatch = color.match(/oklch\(([\d.]+%?)\s+([\d.]+)\s+([\d.]+)\)/);
+                                    if (oklchMatch) {
+                                        color = `oklch(${oklchMatch[1]} ${oklchMatch[2]} ${oklchMatch[3]} / ${opacity})`;
+                                    }
+                                } else if (color.includes('hsl')) {
+                                    const hslMatch = color.match(/hsl\(([\d.]+)\s+([\d.]+)%\s+([\d.]+)%\)/);
+                                    if (hslMatch) {
+                                        color = `hsla(${hslMatch[1]} ${hslMatch[2]}% ${hslMatch[3]}% / ${opacity})`;
+                                    }
+                                } else if (color.includes('rgb')) {
+                                    const rgbMatch = color.match(/rgb\(([\d.]+)\s+([\d.]+)\s+([\d.]+)\)/);
+                                    if (rgbMatch) {
+                                        color = `rgba(${rgbMatch[1]} ${rgbMatch[2]} ${rgbMatch[3]} / ${opacity})`;
+                                    }
+                                } else if (color.startsWith('#')) {
+                                    const hex = color.slice(1);
+                                    const r = parseInt(hex.slice(0, 2), 16);
+                                    const g = parseInt(hex.slice(2, 4), 16);
+                                    const b = parseInt(hex.slice(4, 6), 16);
+                                    color = `rgba(${r}, ${g}, ${b}, ${opacity})`;
+                                }
+                            }
+                            resolved_config[key] = color;
+                        } else {
+                            resolved_config[key] = value;
+                        }
+                    } else if (typeof value === 'object') {
+                        resolved_config[key] = this.__resolveCSSVariablesFromConfig(value);
+                    } else {
+                        resolved_config[key] = value;
+                    }
+                }
+
+                return resolved_config;
+            }""",
+            seq_type="definition",
+        ),
+        "__decodeChartData(config)": Statement(
+            r"""{
+                for (const dataset of config.data?.datasets ?? []) {
+                    const encoded_data = dataset.data;
+                    if (!encoded_data || Array.isArray(encoded_data) || !encoded_data.encoding) continue;
+
+                    const bytes = Uint8Array.from(atob(encoded_data.data), (character) => character.charCodeAt(0));
+                    const is_float32 = encoded_data.encoding === 'float32';
+                    if (encoded_data.delta) {
+                        const bits = is_float32 ? new Uint32Array(bytes.buffer) : new BigUint64Array(bytes.buffer);
+                        for (let index = 1; index < bits.length; index++) {
+                            bits[index] = bits[index] + bits[index - 1];
+                        }
+                    }
+
+                    const values = is_float32 ? new Float32Array(bytes.buffer) : new Float64Array(bytes.buffer);
+                    dataset.data = Array.from(values, (value) => Number.isNaN(value) ? null : value);
+                }
+
+                return config;
+            }""",
+            seq_type="definition",
+        ),
+        "__loadChartDataSource(config)": Statement(
+            r"""{
+                if (!this.chart_data_source) return config;
+
+                // Each source is parsed once per page and shared by every chart referring to it.
+                const data_sources = window.__altarChartDataSources ??= new Map();
+                if (!data_sources.has(this.chart_data_source.id)) {
+                    const data_source_element = document.getElementById(this.chart_data_source.id);
+                    data_sources.set(this.chart_data_source.id, data_source_element ? JSON.parse(data_source_element.textContent) : null);
+                }
+
+                const data_source = data_sources.get(this.chart_data_source.id);
+                if (!data_source) {
+                    console.warn(`Chart data source '${this.chart_data_source.id}' was not found.`);
+                    return config;
+                }
+
+                if (data_source.labels && !config.data.labels?.length) {
+                    config.data.labels = data_source.labels.slice();
+                }
+                this.chart_data_source.keys.forEach((key, index) => {
+                    if (key !== null && config.data.datasets[index]) {
+                        config.data.datasets[index].data = (data_source.datasets[key] ?? []).slice();
+                    }
+                });
+
+                return config;
+            }""",
+            seq_type="definition",
+        ),
+        "initChart()": Statement(
+            r"""{
+                const canvas = this.$refs.canvas;
+                if (canvas && !this.chart_instance && typeof Chart !== 'undefined') {
+                    const ctx = canvas.getContext('2d');
+                    const resolvedChartConfig = this.chart_colors_resolved ? structuredClone(Alpine.raw(this.chart_config)) : this.__resolveCSSVariablesFromConfig(this.chart_config);
+                    const colorResolvedChartConfig = this.__loadChartDataSource(this.__decodeChartData(resolvedChartConfig));
+                    console.log(colorResolvedChartConfig)
+                    this.chart_instance = new Chart(ctx, colorResolvedChartConfig);
+                    this.__startChartStream();
+                }
+            }""",
+            seq_type="definition",
+        ),
+        "__startChartStream()": Statement(
+            r"""{
+                if (!this.chart_stream || this.chart_stream_close || typeof EventSource === 'undefined') return;
+
+                // Updates received within the same frame are applied together with a single `update('none')`.
+                const pending_updates = [];
+                let animation_frame = null;
+                const flushUpdates = () => {
+                    animation_frame = null;
+                    const chart = Alpine.raw(this.chart_instance);
+                    const updates = pending_updates.splice(0);
+                    if (!chart) return;
+
+                    for (const update of updates) {
+                        for (const label of update.labels ?? []) {
+                            chart.data.labels.push(label);
+                        }
+                        (update.data ?? []).forEach((values, index) => {
+                            const dataset = chart.data.datasets[index];
+                            if (dataset) {
+                                for (const value of values) {
+                                    dataset.data.push(value);
+                                }
+                            }
+                        });
+                    }
+
+                    const window_size = this.chart_stream.window;
+                    if (window_size) {
+                        for (const values of [chart.data.labels, ...chart.data.datasets.map((dataset) => dataset.data)]) {
+                            if (values.length > window_size) {
+                                values.splice(0, values.length - window_size);
+                            }
+                        }
+                    }
+
+                    chart.update('none');
+                };
+
+                const event_source = new EventSource(this.chart_stream.url);
+                event_source.addEventListener(this.chart_stream.event, (event) => {
+                    pending_updates.push(JSON.parse(event.data));
+                    animation_frame ??= requestAnimationFrame(flushUpdates);
+                });
+
+                this.chart_stream_close = () => {
+                    event_source.close();
+                    if (animation_frame !== null) cancelAnimationFrame(animation_frame);
+                    this.chart_stream_close = null;
+                };
+            }""",
+            seq_type="definition",
+        ),
+        "destroyChart()": Statement(
+            r"{ if (this.chart_stream_close) { this.chart_stream_close(); } if (this.chart_instance) { this.chart_instance.destroy(); this.chart_instance = null; } }",
+            seq_type="definition",
+        ),
+        "destroy()": Statement(r"{ this.destroyChart(); }", seq_type="definition"),
+    },
+    directive="x-data",
+)
+
+register_alpine_data("altarChart", _chart_x_data_attribute)
+
+
+_css_variable_pattern = re.compile(r"var\((--[^)]+)\)(?:\s*/\s*([\d.]+))?")
+_json_css_variable_string_pattern = re.compile(r'"([^"\\]*var\(--[^"\\]*)"')
+_oklch_pattern = re.compile(r"oklch\(([\d.]+%?)\s+([\d.]+)\s+([\d.]+)\)")
+_hsl_pattern = re.compile(r"hsl\(([\d.]+)\s+([\d.]+)%\s+([\d.]+)%\)")
+_rgb_pattern = re.compile(r"rgb\(([\d.]+)\s+([\d.]+)\s+([\d.]+)\)")
+
+
+def _format_opacity(opacity: float) -> str:
+    return str(int(opacity)) if opacity.is_integer() else repr(opacity)
+
+
+def _resolve_css_variable(value: str, theme: Mapping[str, str]) -> str | None:
+    # Mirrors `__resolveCSSVariablesFromConfig()`, so a config resolved here
+    # renders exactly like one resolved in the browser.
+    match = _css_variable_pattern.search(value)
+    if match is None:
+        return value
+
+    color = theme.get(match[1])
+    if color is None:
+        return None
+
+    color = color.strip()
+    try:
+        opacity = float(match[2]) if match[2] else 1
+    except ValueError:
+        opacity = 1
+    if opacity < 1:
+        if "oklch" in color:
+            if oklch_match := _oklch_pattern.search(color):
+                color = f"oklch({oklch_match[1]} {oklch_match[2]} {oklch_match[3]} / {_format_opacity(opacity)})"
+        elif "hsl" in color:
+            if hsl_match := _hsl_pattern.search(color):
+                color = f"hsla({hsl_match[1]} {hsl_match[2]}% {hsl_match[3]}% / {_format_opacity(opacity)})"
+        elif "rgb" in color:
+            if rgb_match := _rgb_pattern.search(color):
+                color = f"rgba({rgb_match[1]} {rgb_match[2]} {rgb_match[3]} / {_format_opacity(opacity)})"
+        elif color.startswith("#"):
+            try:
+                red, green, blue = (
+                    int(color[index : index + 2], 16) for index in (1, 3, 5)
+                )
+            except ValueError:
+                return None
+            color = f"rgba({red}, {green}, {blue}, {_format_opacity(opacity)})"
+
+    return color
+
+
+def _resolve_chart_theme(
+    chart_config_json: str, theme: Mapping[str, str]
+) -> tuple[str, bool]:
+    theme = {
+        (key if key.startswith("--") else f"--{key}"): value
+        for key, value in theme.items()
+    }
+    all_resolved = True
+
+    def resolve(match: re.Match) -> str:
+        nonlocal all_resolved
+
+        color = _resolve_css_variable(match[1], theme)
+        if color is None:
+            all_resolved = False
+            return match[0]
+
+        return json.dumps(color)
+
+    return _json_css_variable_string_pattern.sub(
+        resolve, chart_config_json
+    ), all_resolved
+
+
+def _extract_chart_data_source_keys(
+    chart_attributes: dict[str, Any], data_source: str | None
+) -> list[str | None]:
+    data_keys = []
+    if "chart_data_key" in chart_attributes:
+        data_keys.append(chart_attributes.pop("chart_data_key"))
+        chart_attributes["chart_data"] = []
+    elif "chart_datasets" in chart_attributes:
+        datasets = []
+        for dataset in chart_attributes["chart_datasets"]:
+            dataset = dict(dataset)
+            data_key = dataset.pop("data_key", None)
+            if data_key is not None:
+                dataset["data"] = []
+            data_keys.append(data_key)
+            datasets.append(dataset)
+        chart_attributes["chart_datasets"] = datasets
+
+    if data_source is None and any(data_key is not None for data_key in data_keys):
+        raise ValueError(
+            "Data keys can only be used together with a 'chart_data_source'."
+        )
+
+    return data_keys
+
+
+class ChartDataSource(Script):
+    def __init__(
+        self,
+        datasets: Mapping[str, Any],
+        labels: Any | None = None,
+        precision: int | None = None,
+        **attributes: Unpack[ScriptAttributes],
+    ):
+        if not attributes.get("id"):
+            raise ValueError(
+                f"`{self.__class__.__qualname__}` must be created with an 'id', which charts refer to with 'chart_data_source'."
+            )
+
+        super().__init__(
+            type="application/json", data_slot="chart-data-source", **attributes
+        )
+
+        serialized_columns = (
+            [f'"labels":{_serialize_column(_column_to_list(labels, None))}']
+            if labels is not None
+            else []
+        )
+        serialized_datasets = ",".join(
+            f"{json.dumps(key)}:{_serialize_column(_column_to_list(values, precision))}"
+            for key, values in datasets.items()
+        )
+        serialized_columns.append(f'"datasets":{{{serialized_datasets}}}')
+
+        self.children = [
+            mark_safe(_escape_script_json(f"{{{','.join(serialized_columns)}}}"))
+        ]
+
+    def __call__(self, *_children: tuple) -> Self:
+        warnings.warn(
+            f"Trying to add child to a non-child element: {self.__class__.__qualname__}",
+            UserWarning,
+            stacklevel=2,
+        )
+
+        return self
+
+
+def format_chart_stream_event(
+    data: Sequence[Any],
+    labels: Any | None = None,
+    event: str | None = None,
+    event_id: str | None = None,
+    retry: int | None = None,
+) -> str:
+    for field_name, field_value in (("event", event), ("event_id", event_id)):
+        if field_value is not None and any(
+            character in field_value for character in "\r\n"
+        ):
+            raise ValueError(f"'{field_name}' must not contain line breaks.")
+
+    # `data` holds one sequence of new points per dataset, in the order of
+    # the chart's datasets, and `labels` the matching new labels.
+    update = {"data": [_column_to_list(values, None) for values in data]}
+    if labels is not None:
+        update["labels"] = _column_to_list(labels, None)
+
+    lines = []
+    if event_id is not None:
+        lines.append(f"id: {event_id}")
+    if event is not None:
+        lines.append(f"event: {event}")
+    if retry is not None:
+        lines.append(f"retry: {retry}")
+    lines.append(f"data: {to_json(update, inf_nan_mode='null').decode()}")
+
+    return "\n".join(lines) + "\n\n"
+
+
 class Chart(Div):
     def __init__(self, **attributes: Unpack[DivAttributes]):
         base_class_attribute = "relative w-full"
@@ -23,111 +1015,172 @@ class Chart(Div):
             if key.startswith("chart_")
         }
 
+        max_points = chart_attributes.pop("chart_max_points", None)
+        downsample_method = chart_attributes.pop("chart_downsample", "lttb")
+        if max_points is not None and (
+            not isinstance(max_points, int) or max_points < 4
+        ):
+            raise ValueError(
+                f"'chart_max_points' must be an integer of at least 4, but got {max_points}."
+            )
+        if downsample_method not in ("lttb", "minmax"):
+            raise ValueError(
+                f"'chart_downsample' must be either 'lttb' or 'minmax', but got '{downsample_method}'."
+            )
+
+        precision = chart_attributes.pop("chart_precision", None)
+        if precision is not None and not isinstance(precision, int):
+            raise ValueError(
+                f"'chart_precision' must be an integer, but got {precision}."
+            )
+
+        data_encoding = chart_attributes.pop("chart_data_encoding", "json")
+        delta_encoding = chart_attributes.pop("chart_delta_encoding", False)
+        if data_encoding not in ("json", "float32", "float64"):
+            raise ValueError(
+                f"'chart_data_encoding' must be one of 'json', 'float32' or 'float64', but got '{data_encoding}'."
+            )
+
+        # Destroying an off-screen chart implies creating it again once it
+        # scrolls back into view, so it always comes with lazy initialization.
+        lazy = chart_attributes.pop("chart_lazy", False)
+        lazy_margin = chart_attributes.pop("chart_lazy_margin", "200px")
+        destroy_offscreen = chart_attributes.pop("chart_destroy_offscreen", False)
+        destroy_margin = chart_attributes.pop("chart_destroy_margin", "1000px")
+
+        stream_url = chart_attributes.pop("chart_stream_url", None)
+        stream_window = chart_attributes.pop("chart_stream_window", None)
+        stream_event = chart_attributes.pop("chart_stream_event", "message")
+        if stream_window is not None and (
+            not isinstance(stream_window, int) or stream_window < 1
+        ):
+            raise ValueError(
+                f"'chart_stream_window' must be a positive integer, but got {stream_window}."
+            )
+
+        # Aggregated labels and datasets are regular `chart_*` attributes, so
+        # explicitly passed ones (e.g. 'chart_label') take precedence.
+        aggregate = chart_attributes.pop("chart_aggregate", None)
+        if aggregate is not None:
+            chart_attributes = {**aggregate_chart_data(**aggregate), **chart_attributes}
+
+        theme = chart_attributes.pop("chart_theme", None)
+        data_source = chart_attributes.pop("chart_data_source", None)
+        data_source_keys = _extract_chart_data_source_keys(
+            chart_attributes, data_source
+        )
+
+        # Downsampled columns are reduced in Python first, so they are only
+        # converted to lists and deferred once the reduction is done.
+        deferred_columns = _extract_chart_columns(
+            chart_attributes,
+            precision,
+            defer=max_points is None,
+            encode=data_encoding != "json",
+        )
+
         chart_config = build_chart_config_from_attributes(
             chart_attributes=chart_attributes
         )
 
-        base_x_data_attribute = AlpineJSData(
-            data={
-                "chart_instance": None,
-                "chart_config": Statement(
-                    chart_config.model_dump_json(exclude_none=True),
-                    seq_type="assignment",
-                ),
-                "__resolveCSSVariablesFromConfig(raw_config)": Statement(
-                    r"""{
-                        if (typeof raw_config !== 'object' || raw_config === null) return raw_config;
+        self.downsample_reports = (
+            _downsample_chart_config(chart_config, max_points, downsample_method)
+            if max_points is not None
+            else []
+        )
 
-                        if (Array.isArray(raw_config)) {
-                          return raw_config.map(item => this.__resolveCSSVariablesFromConfig(item));
-                        }
+        if data_encoding != "json" and max_points is not None:
+            for dataset in chart_config.data.datasets:
+                dataset.data = _defer_chart_column(deferred_columns, dataset.data)
 
-                        const resolved_config = {};
-                        for (const [key, value] of Object.entries(raw_config)) {
-                            if (typeof value === 'string' && value.includes('var(--')) {
-                                // Match `var(--variable) / opacity` or just `var(--variable)`
-                                const match = value.match(/var\((--[^)]+)\)(?:\s*\/\s*([\d.]+))?/);
-                                if (match) {
-                                    const variableName = match[1];
-                                    const opacity = match[2] ? parseFloat(match[2]) : 1;
-
-                                    let color = getComputedStyle(document.documentElement).getPropertyValue(variableName).trim();
-
-                                    if (opacity < 1) {
-                                        if (color.includes('oklch')) {
-                                            const oklchMatch = color.match(/oklch\(([\d.]+%?)\s+([\d.]+)\s+([\d.]+)\)/);
-                                            if (oklchMatch) {
-                                                color = `oklch(${oklchMatch[1]} ${oklchMatch[2]} ${oklchMatch[3]} / ${opacity})`;
-                                            }
-                                        } else if (color.includes('hsl')) {
-                                            const hslMatch = color.match(/hsl\(([\d.]+)\s+([\d.]+)%\s+([\d.]+)%\)/);
-                                            if (hslMatch) {
-                                                color = `hsla(${hslMatch[1]} ${hslMatch[2]}% ${hslMatch[3]}% / ${opacity})`;
-                                            }
-                                        } else if (color.includes('rgb')) {
-                                            const rgbMatch = color.match(/rgb\(([\d.]+)\s+([\d.]+)\s+([\d.]+)\)/);
-                                            if (rgbMatch) {
-                                                color = `rgba(${rgbMatch[1]} ${rgbMatch[2]} ${rgbMatch[3]} / ${opacity})`;
-                                            }
-                                        } else if (color.startsWith('#')) {
-                                            const hex = color.slice(1);
-                                            const r = parseInt(hex.slice(0, 2), 16);
-                                            const g = parseInt(hex.slice(2, 4), 16);
-                                            const b = parseInt(hex.slice(4, 6), 16);
-                                            color = `rgba(${r}, ${g}, ${b}, ${opacity})`;
-                                        }
-                                    }
-                                    resolved_config[key] = color;
-                                } else {
-                                    resolved_config[key] = value;
-                                }
-                            } else if (typeof value === 'object') {
-                                resolved_config[key] = this.__resolveCSSVariablesFromConfig(value);
-                            } else {
-                                resolved_config[key] = value;
-                            }
-                        }
+        chart_config_json = chart_config.model_dump_json(exclude_none=True)
 
-                        return resolved_config;
-                    }""",
-                    seq_type="definition",
-                ),
-                "initChart()": Statement(
-                    r"""{
-                        const canvas = this.$refs.canvas;
-                        if (canvas && typeof Chart !== 'undefined') {
-                            const ctx = canvas.getContext('2d');
-                            const colorResolvedChartConfig = this.__resolveCSSVariablesFromConfig(this.chart_config);
-                            console.log(colorResolvedChartConfig)
-                            this.chart_instance = new Chart(ctx, colorResolvedChartConfig);
-                        }
-                    }""",
-                    seq_type="definition",
-                ),
-                "destroyChart()": Statement(
-                    r"{ if (this.chart_instance) { this.chart_instance.destroy(); this.chart_instance = null; } }",
-                    seq_type="definition",
+        # Colors are resolved before the data columns are spliced in, so only
+        # the (small) config itself is scanned. If any variable is missing from
+        # the theme, the browser still resolves the remaining ones.
+        colors_resolved = False
+        if theme is not None:
+            chart_config_json, colors_resolved = _resolve_chart_theme(
+                chart_config_json, theme
+            )
+
+        for placeholder, (values, is_label_column) in deferred_columns.items():
+            serialized_column = None
+            if data_encoding != "json" and not is_label_column:
+                serialized_column = _encode_column(
+                    values, data_encoding, delta_encoding
+                )
+
+            chart_config_json = chart_config_json.replace(
+                placeholder,
+                serialized_column or _serialize_column(values),
+                1,
+            )
+
+        chart_x_data = {
+            "chart_config": Statement(chart_config_json, seq_type="assignment")
+        }
+        if colors_resolved:
+            chart_x_data["chart_colors_resolved"] = True
+        if stream_url is not None:
+            chart_x_data["chart_stream"] = Statement(
+                json.dumps(
+                    {"url": stream_url, "window": stream_window, "event": stream_event}
                 ),
-            },
-            directive="x-data",
-        )
+                seq_type="assignment",
+            )
+        if data_source is not None:
+            chart_x_data["chart_data_source"] = Statement(
+                json.dumps({"id": data_source, "keys": data_source_keys}),
+                seq_type="assignment",
+            )
         x_data_attribute = attributes.pop("x_data", None)
 
-        base_x_init_attribute = AlpineJSData(
-            data={
-                "initialize_chart": Statement(
-                    "$nextTick(() => initChart())", seq_type="instance"
-                )
-            },
-            directive="x-init",
+        if x_data_attribute is None and (
+            registered_x_data_attribute := use_alpine_data("altarChart", chart_x_data)
+        ):
+            x_data_attribute = registered_x_data_attribute
+        else:
+            x_data_attribute = alpine_js_data_merge(
+                alpine_js_data_merge(
+                    _chart_x_data_attribute,
+                    AlpineJSData(data=chart_x_data, directive="x-data"),
+                ),
+                x_data_attribute,
+            )
+
+        # Requires Intersect plugin
+        intersect_attributes = {}
+        if destroy_offscreen:
+            intersect_attributes = {
+                f"x-intersect:enter.margin.{lazy_margin}": "initChart()",
+                f"x-intersect:leave.margin.{destroy_margin}": "destroyChart()",
+            }
+        elif lazy:
+            intersect_attributes = {
+                f"x-intersect.once.margin.{lazy_margin}": "initChart()"
+            }
+
+        base_x_init_attribute = (
+            AlpineJSData(
+                data={
+                    "initialize_chart": Statement(
+                        "$nextTick(() => initChart())", seq_type="instance"
+                    )
+                },
+                directive="x-init",
+            )
+            if not intersect_attributes
+            else None
         )
         x_init_attribute = attributes.pop("x_init", None)
 
         super().__init__(
             _class=tw_merge(base_class_attribute, class_attribute),
-            x_data=alpine_js_data_merge(base_x_data_attribute, x_data_attribute),
+            x_data=x_data_attribute,
             x_init=alpine_js_data_merge(base_x_init_attribute, x_init_attribute),
             data_slot="chart",
+            **intersect_attributes,
             **attributes,
         )
 
@@ -1,10 +1,11 @@
 import warnings
 from typing import Self
 
-from aether.plugins.tailwindcss import tw_merge
 from aether.tags.html import Div, Input, InputAttributes
 from altar_icons import CheckIcon
 
+from .utils import tw_merge
+
 try:
     from typing import Unpack
 except ImportError:
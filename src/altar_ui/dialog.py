@@ -3,13 +3,13 @@ from typing import Literal, Self
 
 from aether import BaseWebElement
 from aether.plugins.alpinejs import AlpineJSData, alpine_js_data_merge
-from aether.plugins.tailwindcss import tw_merge
 from aether.tags.html import H2, Div, DivAttributes, HAttributes, P, PAttributes, Span
 from aether.tags.html import Button as PyButton
 from aether.tags.html import ButtonAttributes as PyButtonAttributes
 from altar_icons import CrossIcon
 
 from .button import Button
+from .utils import tw_merge
 
 try:
     from typing import Unpack
@@ -2,7 +2,6 @@ import warnings
 from typing import Literal, Self
 
 from aether.plugins.alpinejs import AlpineJSData, Statement, alpine_js_data_merge
-from aether.plugins.tailwindcss import tw_merge
 from aether.tags.html import (
     ButtonAttributes as PyButtonAttributes,
 )
@@ -10,6 +9,7 @@ from aether.tags.html import Div, DivAttributes
 
 from .button import Button
 from .passthrough import Passthrough
+from .utils import tw_merge
 
 try:
     from typing import Unpack
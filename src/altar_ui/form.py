@@ -1,13 +1,15 @@
+import json
 import warnings
-from typing import Any, Self
+from decimal import Decimal
+from typing import Annotated, Any, Literal, Self
 
 from aether.plugins.alpinejs import (
     AlpineHookForm,
     AlpineJSData,
+    AlpineValidationTrigger,
     Statement,
     alpine_js_data_merge,
 )
-from aether.plugins.tailwindcss import tw_merge
 from aether.tags.html import (
     Div,
     DivAttributes,
@@ -21,12 +23,19 @@ from aether.tags.html import (
     LabelAttributes as PyLabelAttributes,
 )
 from aether.tags.html import Textarea as PyTextarea
+from pydantic import Field, model_validator
 
+from .alpine import (
+    register_alpine_data,
+    use_alpine_data,
+    use_alpine_runtime_constant,
+)
 from .checkbox import Checkbox
 from .input import PasswordInput
 from .label import Label
 from .radio import RadioGroupItem
 from .switch import Switch
+from .utils import tw_merge
 
 try:
     from typing import Unpack
@@ -37,7 +46,7 @@ except ImportError:
 class Form(PyForm):
     def __init__(self, **attributes: Unpack[PyFormAttributes]):
         base_x_data_attribute = AlpineJSData(
-            data={"form_fields": []}, directive="x-data"
+            data={"form_fields": {}, "form_fields_error_count": 0}, directive="x-data"
         )
         x_data_attribute = attributes.pop("x_data", None)
 
@@ -48,26 +57,54 @@ class Form(PyForm):
         )
 
 
-class FormField(Div):
-    def __init__(self, **attributes: Unpack[DivAttributes]):
-        base_x_data_attribute = AlpineJSData(
+# Fields are kept in a map keyed by `field_id` next to a running error count, so
+# updating one field neither scans nor (through the raw lookup) subscribes to
+# the other fields.
+_form_field_x_data_attribute = AlpineJSData(
+    data={
+        "field_id": Statement(content="$id('form-field-id')", seq_type="assignment"),
+        "has_error": None,
+        "updateHasErrorValueInParent(id, value)": Statement(
+            """{
+                const form_fields = Alpine.raw(this.form_fields);
+                if (!(id in form_fields)) {
+                    return;
+                }
+
+                const had_error = form_fields[id] === true;
+                this.form_fields[id] = value;
+                if (had_error !== (value === true)) {
+                    this.form_fields_error_count += had_error ? -1 : 1;
+                }
+            }""",
+            seq_type="definition",
+        ),
+    },
+    directive="x-data",
+)
+
+# Magics are not available while a registered component's data is created, so
+# the field id is assigned on `init()` instead.
+register_alpine_data(
+    "altarFormField",
+    alpine_js_data_merge(
+        _form_field_x_data_attribute,
+        AlpineJSData(
             data={
-                "field_id": Statement(
-                    content="$id('form-field-id')", seq_type="assignment"
-                ),
-                "has_error": None,
-                "updateHasErrorValueInParent(id, value)": Statement(
-                    """{
-                        const field_item = form_fields.find(field => field.id === id);
-                        if (field_item) {
-                            field_item.has_error = value;
-                        }
-                    }""",
+                "field_id": None,
+                "init()": Statement(
+                    "{ this.field_id = this.$id('form-field-id') }",
                     seq_type="definition",
                 ),
             },
             directive="x-data",
-        )
+        ),
+    ),
+)
+
+
+class FormField(Div):
+    def __init__(self, **attributes: Unpack[DivAttributes]):
         base_x_effect_attribute = AlpineJSData(
             data={
                 "update_has_error_value_for_form_field": Statement(
@@ -79,8 +116,8 @@ class FormField(Div):
         )
         base_x_init_attribute = AlpineJSData(
             data={
-                "append_to_form_fields_array": Statement(
-                    "form_fields.push({ id: field_id, has_error: has_error })",
+                "add_to_form_fields": Statement(
+                    "form_fields[field_id] = has_error",
                     seq_type="instance",
                 )
             },
@@ -90,8 +127,17 @@ class FormField(Div):
         x_effect_attribute = attributes.pop("x_effect", None)
         x_init_attribute = attributes.pop("x_init", None)
 
+        if x_data_attribute is None and (
+            registered_x_data_attribute := use_alpine_data("altarFormField")
+        ):
+            x_data_attribute = registered_x_data_attribute
+        else:
+            x_data_attribute = alpine_js_data_merge(
+                _form_field_x_data_attribute, x_data_attribute
+            )
+
         super().__init__(
-            x_data=alpine_js_data_merge(base_x_data_attribute, x_data_attribute),
+            x_data=x_data_attribute,
             x_effect=alpine_js_data_merge(base_x_effect_attribute, x_effect_attribute),
             x_init=alpine_js_data_merge(base_x_init_attribute, x_init_attribute),
             data_slot="form-field",
@@ -99,60 +145,107 @@ class FormField(Div):
         )
 
 
-class FormItem(Div):
-    def __init__(self, **attributes: Unpack[DivAttributes]):
-        base_class_attribute = "grid gap-2"
-        base_x_data_attribute = AlpineJSData(
-            data={
-                "has_error": None,
-                "error_message": "",
-                "form_fields": [],
-                "updateHasErrorValueInParent(value)": Statement(
-                    "{ has_error = value; }",
-                    seq_type="definition",
-                ),
-                "updateErrorMessageValueInParent(value)": Statement(
-                    "{ error_message = value; }",
-                    seq_type="definition",
-                ),
-            },
-            directive="x-data",
-        )
-        base_x_init_attribute = AlpineJSData(
+# The setters write to the enclosing `FormField`, so they look the value up from
+# the parent element rather than from the item's own scope.
+_form_item_x_data_attribute = AlpineJSData(
+    data={
+        "has_error": None,
+        "error_message": "",
+        "form_fields": {},
+        "form_fields_error_count": 0,
+        "updateHasErrorValueInParent(value)": Statement(
+            "{ Alpine.$data(this.$root.parentElement).has_error = value; }",
+            seq_type="definition",
+        ),
+        "updateErrorMessageValueInParent(value)": Statement(
+            "{ Alpine.$data(this.$root.parentElement).error_message = value; }",
+            seq_type="definition",
+        ),
+    },
+    directive="x-data",
+)
+
+register_alpine_data(
+    "altarFormItem",
+    alpine_js_data_merge(
+        _form_item_x_data_attribute,
+        AlpineJSData(
             data={
-                "update_has_error_value_for_form_field": Statement(
-                    """
-                    Alpine.effect(() => {
-                        if (form_fields.length > 0) {
-                            const form_fields_has_error = form_fields.some((field) => field["has_error"] === true);
-                            if (form_fields_has_error) {
-                                has_error = form_fields_has_error;
-                                error_message = "Invalid Value";
-                            } else {
-                                has_error = false;
-                                error_message = null;
+                "init()": Statement(
+                    """{
+                        Alpine.effect(() => {
+                            if (this.form_fields_error_count > 0) {
+                                this.has_error = true;
+                                this.error_message = "Invalid Value";
+                            } else if (Object.keys(this.form_fields).length > 0) {
+                                this.has_error = false;
+                                this.error_message = null;
                             }
-                        }
-                    })
+                        })
 
-                    Alpine.effect(() => {
-                        updateHasErrorValueInParent(has_error);
-                        updateErrorMessageValueInParent(error_message);
-                    })
-                    """,
-                    seq_type="instance",
+                        Alpine.effect(() => {
+                            this.updateHasErrorValueInParent(this.has_error);
+                            this.updateErrorMessageValueInParent(this.error_message);
+                        })
+                    }""",
+                    seq_type="definition",
                 )
             },
-            directive="x-init",
-        )
+            directive="x-data",
+        ),
+    ),
+)
+
+
+class FormItem(Div):
+    def __init__(self, **attributes: Unpack[DivAttributes]):
+        base_class_attribute = "grid gap-2"
         class_attribute = attributes.pop("_class", "")
         x_data_attribute = attributes.pop("x_data", None)
         x_init_attribute = attributes.pop("x_init", None)
 
+        # A registered item sets up its effects on `init()`, so only an explicit
+        # `x_init` is rendered alongside it.
+        if x_data_attribute is None and (
+            registered_x_data_attribute := use_alpine_data("altarFormItem")
+        ):
+            x_data_attribute = registered_x_data_attribute
+        else:
+            x_data_attribute = alpine_js_data_merge(
+                _form_item_x_data_attribute, x_data_attribute
+            )
+            x_init_attribute = alpine_js_data_merge(
+                AlpineJSData(
+                    data={
+                        "update_has_error_value_for_form_field": Statement(
+                            """
+                            Alpine.effect(() => {
+                                if (form_fields_error_count > 0) {
+                                    has_error = true;
+                                    error_message = "Invalid Value";
+                                } else if (Object.keys(form_fields).length > 0) {
+                                    has_error = false;
+                                    error_message = null;
+                                }
+                            })
+
+                            Alpine.effect(() => {
+                                updateHasErrorValueInParent(has_error);
+                                updateErrorMessageValueInParent(error_message);
+                            })
+                            """,
+                            seq_type="instance",
+                        )
+                    },
+                    directive="x-init",
+                ),
+                x_init_attribute,
+            )
+
         super().__init__(
             _class=tw_merge(base_class_attribute, class_attribute),
-            x_data=alpine_js_data_merge(base_x_data_attribute, x_data_attribute),
-            x_init=alpine_js_data_merge(base_x_init_attribute, x_init_attribute),
+            x_data=x_data_attribute,
+            x_init=x_init_attribute,
             x_id="['form-description', 'form-item-id', 'form-message']",
             data_slot="form-item",
             **attributes,
@@ -175,128 +268,330 @@ class FormLabel(Label):
         )
 
 
-class FormControl(Div):
-    def __init__(
-        self, hook_form_item: AlpineHookForm | None, **attributes: Unpack[DivAttributes]
-    ):
-        self.hook_form_item = hook_form_item
-        base_x_data_attribute = AlpineJSData(
-            data={
-                "runValidation(value, { rules = [], constraints = {} } = {})": Statement(
-                    """{
-                        const constraintChecker = (value, constraints) => {
-                            let check_failed = false;
-                            let message = null;
-
-                            for (const type in constraints) {
-                                const constraint = constraints[type];
-
-                                switch (type) {
-                                    case 'min_length':
-                                        if (value && value.length < constraint.value) {
-                                            check_failed = true;
-                                            message = constraint.message || `Must be at least ${constraint.value} characters.`;
-                                        }
-                                        break;
-                                    case 'max_length':
-                                        if (value && value.length > constraint.value) {
-                                            check_failed = true;
-                                            message = constraint.message || `Must be at most ${constraint.value} characters.`;
-                                        }
-                                        break;
-                                    // # TODO: Add other supported cases
+_form_control_x_data_attribute = AlpineJSData(
+    data={
+        "validation_live": False,
+        "runValidation(value, validation = {})": Statement(
+            """{
+                if (typeof validation === 'string' && !window.__altarFormValidationSpecs?.[validation]) {
+                    console.error(`Validation spec '${validation}' is missing; render an AlpineDataRuntime inside the alpine_data_registry() that built the form.`);
+                    return;
+                }
+
+                const { rules = [], constraints = {}, required_message = null } = typeof validation === 'string'
+                    ? window.__altarFormValidationSpecs[validation]
+                    : validation;
+
+                const constraintChecker = (value, constraints) => {
+                    let check_failed = false;
+                    let message = null;
+
+                    for (const type in constraints) {
+                        const constraint = constraints[type];
+
+                        switch (type) {
+                            case 'min_length':
+                                if (value && value.length < constraint.value) {
+                                    check_failed = true;
+                                    message = constraint.message || `Must be at least ${constraint.value} characters.`;
                                 }
-                            }
-
-                            if (check_failed) {
-                                return { failed: true, message: message }
-                            } else {
-                                return { failed: false, message: null }
-                            }
-                        }
-
-                        const ruleChecker = (value, rules) => {
-                            let check_failed = false;
-                            let message = null;
-
-                            for (const rule of rules) {
-                                if (rule.test instanceof RegExp) {
-                                    if (rule.test.test(value) === false) {
-                                        check_failed = true;
-                                        message = rule.message;
-                                        break;
-                                    } else {
-                                        check_failed = false;
-                                        message = null;
-                                    }
-                                } else if (rule.test instanceof Function) {
-                                    if (rule.test(value) === false) {
+                                break;
+                            case 'max_length':
+                                if (value && value.length > constraint.value) {
+                                    check_failed = true;
+                                    message = constraint.message || `Must be at most ${constraint.value} characters.`;
+                                }
+                                break;
+                            case 'min':
+                                if (value && Number(value) < constraint.value) {
+                                    check_failed = true;
+                                    message = constraint.message || `Must be at least ${constraint.value}.`;
+                                }
+                                break;
+                            case 'max':
+                                if (value && Number(value) > constraint.value) {
+                                    check_failed = true;
+                                    message = constraint.message || `Must be at most ${constraint.value}.`;
+                                }
+                                break;
+                            case 'step':
+                                if (value) {
+                                    const steps = (Number(value) - (constraints.min ? constraints.min.value : 0)) / constraint.value;
+                                    if (Math.abs(steps - Math.round(steps)) > 1e-9) {
                                         check_failed = true;
-                                        message = rule.message;
-                                        break;
-                                    } else {
-                                        check_failed = false;
-                                        message = null;
+                                        message = constraint.message || `Must be a multiple of ${constraint.value}.`;
                                     }
                                 }
-                            }
-
-                            if (check_failed) {
-                                return { failed: true, message: message }
+                                break;
+                        }
+                    }
+
+                    if (check_failed) {
+                        return { failed: true, message: message }
+                    } else {
+                        return { failed: false, message: null }
+                    }
+                }
+
+                const ruleChecker = (value, rules) => {
+                    let check_failed = false;
+                    let message = null;
+
+                    for (const rule of rules) {
+                        if (rule.test instanceof RegExp) {
+                            if (rule.test.test(value) === false) {
+                                check_failed = true;
+                                message = rule.message;
+                                break;
                             } else {
-                                return { failed: false, message: null }
+                                check_failed = false;
+                                message = null;
                             }
-                        }
-
-                        if (value) {
-                            const constraintCheck = constraintChecker(value, constraints)
-                            if (constraintCheck.failed) {
-                                has_error = true;
-                                error_message = constraintCheck.message;
+                        } else if (rule.test instanceof Function) {
+                            if (rule.test(value) === false) {
+                                check_failed = true;
+                                message = rule.message;
+                                break;
                             } else {
-                                const ruleCheck = ruleChecker(value, rules)
-                                if (ruleCheck.failed) {
-                                    has_error = true;
-                                    error_message = ruleCheck.message;
-                                } else {
-                                    has_error = false;
-                                    error_message = null;
-                                }
+                                check_failed = false;
+                                message = null;
                             }
+                        }
+                    }
+
+                    if (check_failed) {
+                        return { failed: true, message: message }
+                    } else {
+                        return { failed: false, message: null }
+                    }
+                }
+
+                if (value) {
+                    const constraintCheck = constraintChecker(value, constraints)
+                    if (constraintCheck.failed) {
+                        this.has_error = true;
+                        this.error_message = constraintCheck.message;
+                    } else {
+                        const ruleCheck = ruleChecker(value, rules)
+                        if (ruleCheck.failed) {
+                            this.has_error = true;
+                            this.error_message = ruleCheck.message;
                         } else {
-                            has_error = false;
-                            error_message = null;
+                            this.has_error = false;
+                            this.error_message = null;
                         }
-                    }""",
-                    seq_type="definition",
-                ),
-                "getHasError()": Statement(
-                    "{ if (has_error === null) { return false } else { return has_error } }",
-                    seq_type="definition",
-                ),
-            },
-            directive="x-data",
+                    }
+                } else if (required_message) {
+                    this.has_error = true;
+                    this.error_message = required_message;
+                } else {
+                    this.has_error = false;
+                    this.error_message = null;
+                }
+            }""",
+            seq_type="definition",
+        ),
+        "getHasError()": Statement(
+            "{ if (this.has_error === null) { return false } else { return this.has_error } }",
+            seq_type="definition",
+        ),
+    },
+    directive="x-data",
+)
+
+register_alpine_data("altarFormControl", _form_control_x_data_attribute)
+
+
+_default_required_message = "This field is required."
+
+
+class HookFormItem(AlpineHookForm):
+    required_message: Annotated[str, Field(default=_default_required_message)]
+    validation_debounce: Annotated[int | None, Field(default=None, gt=0)]
+    validation_throttle: Annotated[int | None, Field(default=None, gt=0)]
+    validation_strategy: Annotated[
+        Literal["trigger", "blur_then_live"], Field(default="trigger")
+    ]
+
+    @model_validator(mode="after")
+    def _check_validation_timing(self) -> Self:
+        if self.validation_debounce and self.validation_throttle:
+            raise ValueError(
+                "'validation_debounce' and 'validation_throttle' cannot be used together."
+            )
+        if (
+            (self.validation_debounce or self.validation_throttle)
+            and self.validation_strategy == "trigger"
+            and self.validator["validation_trigger"]
+            == AlpineValidationTrigger.ON_EFFECT
+        ):
+            raise ValueError(
+                f"'{AlpineValidationTrigger.ON_EFFECT}' validation cannot be debounced or throttled."
+            )
+
+        return self
+
+
+_form_control_child_types = (
+    Checkbox,
+    PasswordInput,
+    PyInput,
+    PyTextarea,
+    RadioGroupItem,
+    Switch,
+)
+
+
+def _hook_form_constraint_value(hook_form_item: AlpineHookForm, name: str) -> Any:
+    return hook_form_item.constraints.get(name, {}).get("value")
+
+
+def _required_message(hook_form_item: AlpineHookForm) -> str | None:
+    if not hook_form_item.required:
+        return None
+
+    return getattr(hook_form_item, "required_message", _default_required_message)
+
+
+def _js_literal(value: Any) -> str:
+    if isinstance(value, int | float | Decimal) and not isinstance(value, bool):
+        return str(value)
+
+    return json.dumps(value)
+
+
+def _validation_spec_literal(hook_form_item: AlpineHookForm) -> str:
+    # Rule tests are JavaScript (a regex literal or a function) and are kept
+    # as they are; every other value is a quoted literal.
+    rules = ",".join(
+        f"{{ test: {rule.get('test') or _js_literal('')}, message: {_js_literal(rule.get('message') or None)} }}"
+        for rule in hook_form_item.validator.get("validation_rules", [])
+    )
+    constraints = ",".join(
+        f"{constraint_type}: {{ value: {_js_literal(constraint.get('value', ''))}, message: {_js_literal(constraint.get('message') or None)} }}"
+        for constraint_type, constraint in hook_form_item.constraints.items()
+    )
+
+    # The message of an empty required field is part of the spec, so the
+    # client and `FormValidator` report the same one.
+    required = ""
+    if (required_message := _required_message(hook_form_item)) is not None:
+        required = f", required_message: {_js_literal(required_message)}"
+
+    return f"{{ rules: [{rules}], constraints: {{ {constraints} }}{required} }}"
+
+
+def _hook_form_attributes(
+    hook_form_item: AlpineHookForm | None, child_type: type
+) -> dict[str, Any]:
+    hook_attributes = {
+        ":id": Statement(content="$id('form-item-id')", seq_type="assignment"),
+        ":aria-describedby": "getHasError() ? $id('form-description') : `${$id('form-description')} ${$id('form-message')}`",
+        ":aria-invalid": "getHasError()",
+    }
+
+    if hook_form_item is None:
+        return hook_attributes
+
+    if hook_form_item.name is not None:
+        hook_attributes["name"] = hook_form_item.name
+
+    if hook_form_item.required is not None:
+        hook_attributes["required"] = hook_form_item.required
+
+    # With a registry active, the spec is emitted once per page by the
+    # `AlpineDataRuntime` and the control only refers to it by its id.
+    validation_spec = _validation_spec_literal(hook_form_item)
+    if validation_spec_id := use_alpine_runtime_constant(
+        "__altarFormValidationSpecs", validation_spec
+    ):
+        validation_spec = f"'{validation_spec_id}'"
+
+    value_to_validate = hook_form_item.validator.get(
+        "value_to_validate", "$event.target.value"
+    )
+    validation_call = f"runValidation({value_to_validate}, {validation_spec})"
+
+    modifiers = ""
+    if debounce := getattr(hook_form_item, "validation_debounce", None):
+        modifiers = f".debounce.{debounce}ms"
+    elif throttle := getattr(hook_form_item, "validation_throttle", None):
+        modifiers = f".throttle.{throttle}ms"
+
+    # With 'blur_then_live', a field is first validated when it loses focus,
+    # and on every input once it has shown an error.
+    if getattr(hook_form_item, "validation_strategy", None) == "blur_then_live":
+        hook_attributes[AlpineValidationTrigger.ON_BLUR] = (
+            f"{validation_call}; if (getHasError()) {{ validation_live = true }}"
+        )
+        hook_attributes[f"{AlpineValidationTrigger.ON_INPUT}{modifiers}"] = (
+            f"if (validation_live) {{ {validation_call} }}"
         )
+    else:
+        hook_attributes[
+            f"{hook_form_item.validator['validation_trigger']}{modifiers}"
+        ] = validation_call
+
+    # Only the constraints that are actually set are mirrored as native
+    # attributes, using their values (not the whole `{value, message}` rule).
+    constraint_type = _hook_form_constraint_value(hook_form_item, "type")
+    native_constraints = {}
+    if issubclass(child_type, PyInput | PyTextarea) and constraint_type == "text":
+        native_constraints = {
+            "maxlength": _hook_form_constraint_value(hook_form_item, "max_length"),
+            "minlength": _hook_form_constraint_value(hook_form_item, "min_length"),
+        }
+        if issubclass(child_type, PyInput):
+            hook_attributes["type"] = "text"
+    elif issubclass(child_type, PyInput) and constraint_type == "number":
+        hook_attributes["type"] = "number"
+        native_constraints = {
+            constraint_name: str(constraint_value)
+            for constraint_name in ("max", "min", "step")
+            if (
+                constraint_value := _hook_form_constraint_value(
+                    hook_form_item, constraint_name
+                )
+            )
+            is not None
+        }
+
+    hook_attributes.update(
+        {
+            attribute: value
+            for attribute, value in native_constraints.items()
+            if value is not None
+        }
+    )
+
+    return hook_attributes
+
+
+class FormControl(Div):
+    def __init__(
+        self, hook_form_item: AlpineHookForm | None, **attributes: Unpack[DivAttributes]
+    ):
+        self.hook_form_item = hook_form_item
         class_attribute = attributes.pop("_class", "")
         x_data_attribute = attributes.pop("x_data", None)
 
+        if x_data_attribute is None and (
+            registered_x_data_attribute := use_alpine_data("altarFormControl")
+        ):
+            x_data_attribute = registered_x_data_attribute
+        else:
+            x_data_attribute = alpine_js_data_merge(
+                _form_control_x_data_attribute, x_data_attribute
+            )
+
         super().__init__(
             _class=class_attribute,
             data_slot="form-control",
-            x_data=alpine_js_data_merge(base_x_data_attribute, x_data_attribute),
+            x_data=x_data_attribute,
             **attributes,
         )
 
     def __call__(self, *children: Any) -> Self:
-        allowed_child_types = (
-            Checkbox,
-            PasswordInput,
-            PyInput,
-            PyTextarea,
-            RadioGroupItem,
-            Switch,
-        )
-
         if self.have_children:
             if len(children) != 1:
                 raise ValueError(
@@ -304,9 +599,8 @@ class FormControl(Div):
                 )
             else:
                 child = children[0]
-                if isinstance(child, allowed_child_types):
+                if isinstance(child, _form_control_child_types):
                     current_attributes = {}
-                    update_attributes = {}
 
                     if isinstance(
                         child, Checkbox | PasswordInput | RadioGroupItem | Switch
@@ -322,104 +616,14 @@ class FormControl(Div):
                     else:
                         current_attributes = child.attributes
 
-                    update_attributes[":id"] = Statement(
-                        content="$id('form-item-id')", seq_type="assignment"
-                    )
-                    update_attributes[":aria-describedby"] = (
-                        "getHasError() ? $id('form-description') : `${$id('form-description')} ${$id('form-message')}`"
+                    combined_attributes = current_attributes | _hook_form_attributes(
+                        self.hook_form_item, type(child)
                     )
-                    update_attributes[":aria-invalid"] = "getHasError()"
-
-                    if self.hook_form_item is not None:
-                        if self.hook_form_item.name is not None:
-                            update_attributes["name"] = self.hook_form_item.name
-
-                        if self.hook_form_item.required is not None:
-                            update_attributes["required"] = self.hook_form_item.required
-
-                        validation_config = AlpineJSData(
-                            data={
-                                "rules": Statement(
-                                    f"""[{
-                                        ",".join(
-                                            [
-                                                "{"
-                                                f'''test: {rule.get("test", "''")},'''
-                                                f'''message: {f'"{rule["message"]}"' if rule.get("message") else "null"}'''
-                                                "}"
-                                                for rule in self.hook_form_item.validator.get(
-                                                    "validation_rules", []
-                                                )
-                                            ]
-                                        )
-                                    }]""",
-                                    seq_type="assignment",
-                                ),
-                                "constraints": Statement(
-                                    f"""{{ {
-                                        ",".join(
-                                            [
-                                                f"{constraint_type}: "
-                                                "{"
-                                                f'''value: {constraint.get("value", "''")},'''
-                                                f'''message: {f"'{constraint['message']}'" if constraint.get("message") else "null"}'''
-                                                "}"
-                                                for constraint_type, constraint in self.hook_form_item.constraints.items()
-                                            ]
-                                        )
-                                    } }}""",
-                                    seq_type="assignment",
-                                ),
-                            },
-                            directive="x-data",
-                        )
-
-                        update_attributes[
-                            self.hook_form_item.validator["validation_trigger"]
-                        ] = f"runValidation({
-                            self.hook_form_item.validator.get(
-                                'value_to_validate', '$event.target.value'
-                            )
-                        }, {validation_config})"
-
-                        if isinstance(child, PyInput):
-                            if self.hook_form_item.constraints.get("type") == "text":
-                                update_attributes["type"] = "text"
-                                update_attributes["maxlength"] = (
-                                    self.hook_form_item.constraints.get("max_length")
-                                )
-                                update_attributes["minlength"] = (
-                                    self.hook_form_item.constraints.get("min_length")
-                                )
-                            elif (
-                                self.hook_form_item.constraints.get("type") == "number"
-                            ):
-                                update_attributes["type"] = "number"
-                                update_attributes["max"] = (
-                                    self.hook_form_item.constraints.get("max")
-                                )
-                                update_attributes["min"] = (
-                                    self.hook_form_item.constraints.get("min")
-                                )
-                                update_attributes["step"] = (
-                                    self.hook_form_item.constraints.get("step")
-                                )
-
-                        if isinstance(child, PyTextarea):
-                            if self.hook_form_item.constraints.get("type") == "text":
-                                update_attributes["maxlength"] = (
-                                    self.hook_form_item.constraints.get("max_length")
-                                )
-                                update_attributes["minlength"] = (
-                                    self.hook_form_item.constraints.get("min_length")
-                                )
-
-                    combined_attributes = current_attributes | update_attributes
                     child.__init__(**combined_attributes)
                     self.children.append(child)
                 else:
                     raise ValueError(
-                        f"Invalid child type found. `{self.__class__.__qualname__}` can only have {', '.join([type(allowed_type).__class__.__qualname__ for allowed_type in allowed_child_types])}."
+                        f"Invalid child type found. `{self.__class__.__qualname__}` can only have {', '.join([allowed_type.__qualname__ for allowed_type in _form_control_child_types])}."
                     )
         else:
             warnings.warn(
@@ -429,6 +633,34 @@ class FormControl(Div):
             )
         return self
 
+    def with_child(self, child_type: type, **attributes: Any) -> Self:
+        if not self.have_children:
+            warnings.warn(
+                f"Trying to add child to a non-child element: {self.__class__.__qualname__}",
+                UserWarning,
+                stacklevel=2,
+            )
+            return self
+        if self.children:
+            raise ValueError(
+                f"`{self.__class__.__qualname__}` must have exactly one child, but it already has {len(self.children)}."
+            )
+        if not issubclass(child_type, _form_control_child_types):
+            raise ValueError(
+                f"Invalid child type found. `{self.__class__.__qualname__}` can only have {', '.join([allowed_type.__qualname__ for allowed_type in _form_control_child_types])}."
+            )
+
+        # Unlike calling the control with an already constructed child, the
+        # child (and, for composite controls, its inner subtree) is constructed
+        # only once, with the hook form attributes already applied.
+        self.children.append(
+            child_type(
+                **attributes | _hook_form_attributes(self.hook_form_item, child_type)
+            )
+        )
+
+        return self
+
 
 class FormDescription(P):
     def __init__(self, **attributes: Unpack[PAttributes]):
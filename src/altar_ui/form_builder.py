@@ -0,0 +1,435 @@
+import re
+import types
+import typing
+import warnings
+from collections.abc import Generator, Mapping
+from datetime import date, datetime
+from decimal import Decimal
+from functools import lru_cache
+from html import escape
+from typing import Any, NamedTuple, Self
+
+from aether import mark_safe
+from aether.base import _render_element
+from aether.tags.html import BaseHTMLElement
+from aether.tags.html import FormAttributes as PyFormAttributes
+from pydantic import BaseModel, SecretStr
+from pydantic.fields import FieldInfo
+
+from .alpine import (
+    _alpine_data_registry,
+    _alpine_runtime_constants,
+    alpine_data_registry,
+    use_alpine_data,
+    use_alpine_runtime_constant,
+)
+from .checkbox import Checkbox
+from .form import (
+    Form,
+    FormControl,
+    FormDescription,
+    FormField,
+    FormItem,
+    FormLabel,
+    FormMessage,
+    HookFormItem,
+)
+from .input import Input, PasswordInput
+from .textarea import Textarea
+from .utils import _TEMPLATE_SLOT, _call_cached, _render_template_parts
+
+try:
+    from typing import Unpack
+except ImportError:
+    from typing_extensions import Unpack  # noqa: UP035
+
+
+_hook_form_item_options = (
+    "required_message",
+    "validation_debounce",
+    "validation_throttle",
+    "validation_strategy",
+)
+
+
+class _FieldSpec(NamedTuple):
+    name: str
+    label: str
+    description: str | None
+    widget: str
+    widget_attributes: tuple[tuple[str, Any], ...]
+    hook_form_item: str
+
+
+class _FieldTemplate(NamedTuple):
+    parts: tuple[str, ...]
+    alpine_data_names: frozenset[str]
+    runtime_constants: tuple[tuple[str, str], ...]
+
+
+def _unwrap_annotation(annotation: Any) -> tuple[Any, list[Any]]:
+    metadata = []
+    while True:
+        origin = typing.get_origin(annotation)
+        if origin is typing.Annotated:
+            annotation, *annotation_metadata = typing.get_args(annotation)
+            metadata.extend(annotation_metadata)
+        elif origin in (typing.Union, types.UnionType):
+            arguments = [
+                argument
+                for argument in typing.get_args(annotation)
+                if argument is not type(None)
+            ]
+            if len(arguments) != 1:
+                return annotation, metadata
+            annotation = arguments[0]
+        else:
+            return annotation, metadata
+
+
+_js_regex_flags = frozenset("ims")
+_js_line_terminators = {
+    "\n": "\\n",
+    "\r": "\\r",
+    "\u2028": "\\u2028",
+    "\u2029": "\\u2029",
+}
+_js_group_prefixes = ("(?:", "(?=", "(?!", "(?<=", "(?<!", "(?<")
+# Escapes whose meaning differs in (or is missing from) JavaScript regexes
+# without the `u` flag.
+_js_unsupported_escapes = frozenset("pPNXhHRKQEGLlUz")
+
+
+def _js_regex_literal(pattern: str) -> str | None:
+    # pydantic patterns use the Python/Rust syntax, only the subset that has a
+    # JavaScript equivalent is translated, anything else returns `None`.
+    flags = ""
+    if leading_flags := re.match(r"\(\?([a-zA-Z]+)\)", pattern):
+        if not set(leading_flags[1]) <= _js_regex_flags:
+            return None
+        flags = "".join(sorted(set(leading_flags[1])))
+        pattern = pattern[leading_flags.end() :]
+
+    translated = []
+    in_class = False
+    index = 0
+    while index < len(pattern):
+        character = pattern[index]
+        if character == "\\":
+            escape_sequence = pattern[index : index + 2]
+            if len(escape_sequence) < 2 or pattern.startswith(("\\x{", "\\u{"), index):
+                return None
+            if escape_sequence[1] in "AZz" and not in_class:
+                if "m" in flags:
+                    return None
+                translated.append("^" if escape_sequence[1] == "A" else "$")
+            elif escape_sequence[1] in _js_unsupported_escapes:
+                return None
+            elif escape_sequence[1] in _js_line_terminators:
+                translated.append(_js_line_terminators[escape_sequence[1]])
+            else:
+                translated.append(escape_sequence)
+            index += 2
+            continue
+
+        if in_class:
+            if character == "[" or pattern.startswith(("&&", "--", "~~"), index):
+                return None
+            if character == "]":
+                in_class = False
+        elif character == "[":
+            in_class = True
+            # A `]` right after the opening bracket is a literal in Python,
+            # JavaScript reads `[]` as an empty class.
+            negation = "^" if pattern.startswith("[^", index) else ""
+            index += 1 + len(negation)
+            translated.append("[" + negation)
+            if pattern.startswith("]", index):
+                translated.append("\\]")
+                index += 1
+            continue
+        elif pattern.startswith("(?P<", index):
+            translated.append("(?<")
+            index += 4
+            continue
+        elif pattern.startswith("(?P=", index):
+            end = pattern.find(")", index)
+            if end == -1:
+                return None
+            translated.append(f"\\k<{pattern[index + 4 : end]}>")
+            index = end + 1
+            continue
+        elif pattern.startswith("(?#", index):
+            end = pattern.find(")", index)
+            if end == -1:
+                return None
+            index = end + 1
+            continue
+        elif pattern.startswith("(?", index) and not pattern.startswith(
+            _js_group_prefixes, index
+        ):
+            return None
+        elif character in "*+?}" and pattern.startswith("+", index + 1):
+            return None
+        elif pattern.startswith("{,", index):
+            return None
+
+        if character == "/":
+            translated.append("\\/")
+        else:
+            translated.append(_js_line_terminators.get(character, character))
+        index += 1
+
+    return "/" + ("".join(translated) or "(?:)") + "/" + flags
+
+
+def _field_spec(name: str, field: FieldInfo) -> _FieldSpec:
+    annotation, metadata = _unwrap_annotation(field.annotation)
+    metadata = [*field.metadata, *metadata]
+    extra = field.json_schema_extra if isinstance(field.json_schema_extra, dict) else {}
+
+    # `annotated_types` (`MinLen`, `Ge`, ...) and pydantic's own constraint
+    # metadata (`StringConstraints`, `pattern=...`) share the attribute names.
+    constraints = {}
+    validation_rules = []
+    for constraint in metadata:
+        for attribute, constraint_type in (
+            ("min_length", "min_length"),
+            ("max_length", "max_length"),
+            ("ge", "min"),
+            ("gt", "min"),
+            ("le", "max"),
+            ("lt", "max"),
+            ("multiple_of", "step"),
+        ):
+            if (value := getattr(constraint, attribute, None)) is not None:
+                constraints[constraint_type] = {"value": value}
+        if pattern := getattr(constraint, "pattern", None):
+            if (regex_literal := _js_regex_literal(pattern)) is None:
+                # The pattern is still enforced by pydantic on the server.
+                warnings.warn(
+                    f"The pattern {pattern!r} of '{name}' has no JavaScript "
+                    "equivalent, skipping its client-side validation.",
+                    UserWarning,
+                    stacklevel=2,
+                )
+                continue
+            validation_rules.append(
+                {
+                    "test": regex_literal,
+                    "message": extra.get("pattern_message", "Invalid format."),
+                }
+            )
+
+    widget_attributes = {}
+    if extra.get("placeholder"):
+        widget_attributes["placeholder"] = extra["placeholder"]
+
+    if annotation is bool:
+        widget = "checkbox"
+        constraints = {}
+    elif annotation is SecretStr:
+        widget = "password"
+        constraints["type"] = {"value": "text"}
+    elif isinstance(annotation, type) and issubclass(annotation, int | float | Decimal):
+        widget = "input"
+        constraints["type"] = {"value": "number"}
+        # The browser only knows inclusive bounds; for integers the exclusive
+        # ones (`gt`/`lt`) translate exactly.
+        if issubclass(annotation, int):
+            for constraint in metadata:
+                if (value := getattr(constraint, "gt", None)) is not None:
+                    constraints["min"] = {"value": value + 1}
+                if (value := getattr(constraint, "lt", None)) is not None:
+                    constraints["max"] = {"value": value - 1}
+        if "step" not in constraints and not issubclass(annotation, int):
+            widget_attributes["step"] = "any"
+    elif annotation is datetime:
+        widget = "input"
+        widget_attributes["type"] = "datetime-local"
+    elif annotation is date:
+        widget = "input"
+        widget_attributes["type"] = "date"
+    else:
+        widget = "textarea" if extra.get("form_widget") == "textarea" else "input"
+        constraints["type"] = {"value": "text"}
+
+    validator = {"validation_rules": validation_rules}
+    if extra.get("validation_trigger"):
+        validator["validation_trigger"] = extra["validation_trigger"]
+
+    hook_form_item = HookFormItem(
+        name=name,
+        required=field.is_required() and widget != "checkbox",
+        validator=validator,
+        constraints=constraints,
+        **{
+            option: extra[option]
+            for option in _hook_form_item_options
+            if option in extra
+        },
+    )
+
+    return _FieldSpec(
+        name=name,
+        label=field.title or name.replace("_", " ").capitalize(),
+        description=field.description,
+        widget=widget,
+        widget_attributes=tuple(sorted(widget_attributes.items())),
+        hook_form_item=hook_form_item.model_dump_json(exclude_unset=True),
+    )
+
+
+@lru_cache(maxsize=64)
+def _schema_field_specs(schema: type[BaseModel]) -> tuple[_FieldSpec, ...]:
+    return tuple(
+        _field_spec(name, field) for name, field in schema.model_fields.items()
+    )
+
+
+def _build_field(field_spec: _FieldSpec, checked: bool) -> FormField:
+    widget_attributes = dict(field_spec.widget_attributes)
+    control = FormControl(
+        hook_form_item=HookFormItem.model_validate_json(field_spec.hook_form_item)
+    )
+    match field_spec.widget:
+        case "checkbox":
+            control.with_child(Checkbox, checked=checked, **widget_attributes)
+        case "password":
+            control.with_child(PasswordInput, **widget_attributes)
+        case "textarea":
+            control.with_child(Textarea, **widget_attributes)
+            control.children[-1].children.append(_TEMPLATE_SLOT)
+        case _:
+            control.with_child(Input, value=_TEMPLATE_SLOT, **widget_attributes)
+
+    return FormField()(
+        FormItem()(
+            FormLabel()(field_spec.label),
+            control,
+            FormDescription()(field_spec.description)
+            if field_spec.description
+            else None,
+            FormMessage(),
+        )
+    )
+
+
+@lru_cache(maxsize=1024)
+def _compile_field_template(
+    field_spec: _FieldSpec, registry_active: bool, checked: bool = False
+) -> _FieldTemplate:
+    if not registry_active:
+        return _FieldTemplate(
+            parts=_render_template_parts(_build_field(field_spec, checked)),
+            alpine_data_names=frozenset(),
+            runtime_constants=(),
+        )
+
+    # The Alpine components and runtime constants a field uses are recorded
+    # while it is compiled, so they can be replayed into the page's registry
+    # every time the cached markup is used.
+    with alpine_data_registry() as alpine_data_names:
+        parts = _render_template_parts(_build_field(field_spec, checked))
+        runtime_constants = tuple(
+            (global_name, content)
+            for global_name, contents in _alpine_runtime_constants.get().items()
+            for content in contents.values()
+        )
+
+    return _FieldTemplate(
+        parts=parts,
+        alpine_data_names=frozenset(alpine_data_names),
+        runtime_constants=runtime_constants,
+    )
+
+
+@lru_cache(maxsize=256)
+def _compile_form_template(
+    attributes: tuple[tuple[str, Any], ...],
+) -> tuple[str, str]:
+    opening_tag, closing_tag = _render_template_parts(
+        Form(**dict(attributes))(_TEMPLATE_SLOT)
+    )
+    return opening_tag, closing_tag
+
+
+def _format_field_value(value: Any) -> str:
+    if value is None or isinstance(value, SecretStr):
+        return ""
+    if isinstance(value, datetime):
+        # `datetime-local` inputs reject an UTC offset, the wall time is kept.
+        return value.replace(tzinfo=None).isoformat(timespec="minutes")
+    if isinstance(value, date):
+        return value.isoformat()
+
+    return escape(str(value))
+
+
+class SchemaForm(BaseHTMLElement):
+    tag_name = "passthrough"
+    have_children = True
+    content_category = None
+
+    def __init__(
+        self,
+        schema: type[BaseModel] | Mapping[str, FieldInfo],
+        values: BaseModel | Mapping[str, Any] | None = None,
+        **attributes: Unpack[PyFormAttributes],
+    ):
+        super().__init__()
+
+        field_specs = (
+            _schema_field_specs(schema)
+            if isinstance(schema, type)
+            else tuple(_field_spec(name, field) for name, field in schema.items())
+        )
+        if isinstance(values, BaseModel):
+            values = {
+                field_spec.name: getattr(values, field_spec.name, None)
+                for field_spec in field_specs
+            }
+        values = values or {}
+
+        # The markup of every distinct field is compiled once (per registry
+        # mode) and cached, so building a form fills in the current values
+        # instead of constructing the component tree again.
+        registry_active = _alpine_data_registry.get() is not None
+        self.fields_markup = []
+        for field_spec in field_specs:
+            value = values.get(field_spec.name)
+            field_template = _compile_field_template(
+                field_spec,
+                registry_active,
+                field_spec.widget == "checkbox" and bool(value),
+            )
+            for name in field_template.alpine_data_names:
+                use_alpine_data(name)
+            for global_name, content in field_template.runtime_constants:
+                use_alpine_runtime_constant(global_name, content)
+
+            self.fields_markup.append(
+                _format_field_value(value).join(field_template.parts)
+            )
+
+        self.form_template = _call_cached(
+            _compile_form_template, tuple(sorted(attributes.items()))
+        )
+
+    def __call__(self, *children: Any) -> Self:
+        if not children:
+            warnings.warn(
+                f"`{self.__class__.__qualname__}` was called without children.",
+                UserWarning,
+                stacklevel=2,
+            )
+
+        self.children.extend(children)
+        return self
+
+    def render(self, stringify: bool = True) -> Generator[str]:
+        opening_tag, closing_tag = self.form_template
+        yield mark_safe(opening_tag + "".join(self.fields_markup))
+        for child in self.children:
+            yield from _render_element(child, stringify, self.escape_quote)
+        yield mark_safe(closing_tag)
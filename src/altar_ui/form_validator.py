@@ -0,0 +1,422 @@
+import math
+import operator
+import re
+import warnings
+from collections.abc import Callable, Iterable, Mapping, Sequence
+from decimal import Decimal
+from functools import partial
+from typing import Any, Literal, NamedTuple
+
+from aether.plugins.alpinejs import AlpineHookForm
+
+from .form import _required_message
+
+_js_regex_literal_pattern = re.compile(r"/(.+)/([a-z]*)", re.DOTALL)
+_js_regex_flags = {"i": re.IGNORECASE, "m": re.MULTILINE, "s": re.DOTALL}
+
+# JavaScript's character classes are ASCII-only for digits and word
+# characters, but have their own set of whitespace characters. Their
+# complements are spelled out as ranges, so they also work inside a class.
+_js_whitespace = (
+    r"\t\n\x0b\x0c\r\x20\xa0\u1680\u2000-\u200a\u2028\u2029\u202f\u205f\u3000\ufeff"
+)
+_js_whitespace_characters = (
+    "\t\n\x0b\x0c\r \xa0\u1680\u2000\u2001\u2002\u2003\u2004\u2005\u2006"
+    "\u2007\u2008\u2009\u200a\u2028\u2029\u202f\u205f\u3000\ufeff"
+)
+_js_class_escapes = {
+    "d": r"0-9",
+    "D": r"\x00-\x2f\x3a-\U0010ffff",
+    "w": r"A-Za-z0-9_",
+    "W": r"\x00-\x2f\x3a-\x40\x5b-\x5e\x60\x7b-\U0010ffff",
+    "s": _js_whitespace,
+    "S": (
+        r"\x00-\x08\x0e-\x1f\x21-\x9f\xa1-\u167f\u1681-\u1fff\u200b-\u2027"
+        r"\u202a-\u202e\u2030-\u205e\u2060-\u2fff\u3001-\ufefe\uff00-\U0010ffff"
+    ),
+}
+_js_word_character = r"[A-Za-z0-9_]"
+_js_escapes = {
+    **{
+        character: f"[{character_class}]"
+        for character, character_class in _js_class_escapes.items()
+    },
+    "b": f"(?:(?<={_js_word_character})(?!{_js_word_character})|(?<!{_js_word_character})(?={_js_word_character}))",
+    "B": f"(?:(?<={_js_word_character})(?={_js_word_character})|(?<!{_js_word_character})(?!{_js_word_character}))",
+}
+
+
+def _translate_js_regex(pattern: str, multiline: bool, dotall: bool) -> str:
+    # Python differs from JavaScript in the syntax of named groups, in the
+    # meaning of the character class escapes and `.`, and, without the `m`
+    # flag, in `$` also matching before a trailing newline.
+    translated = []
+    index = 0
+    in_character_class = False
+    while index < len(pattern):
+        character = pattern[index]
+        if character == "\\":
+            escape = pattern[index : index + 2]
+            if in_character_class:
+                translated.append(_js_class_escapes.get(escape[1:], escape))
+            else:
+                translated.append(_js_escapes.get(escape[1:], escape))
+            index += 2
+            continue
+
+        if in_character_class:
+            in_character_class = character != "]"
+        elif character == "[":
+            in_character_class = True
+        elif character == "." and not dotall:
+            character = r"[^\n\r\u2028\u2029]"
+        elif character == "$" and not multiline:
+            character = r"\Z"
+        elif pattern.startswith("(?<", index) and not pattern.startswith(
+            ("(?<=", "(?<!"), index
+        ):
+            character = "(?P<"
+            index += 2
+        translated.append(character)
+        index += 1
+
+    return "".join(translated)
+
+
+def _compile_js_regex(test: str) -> re.Pattern[str] | None:
+    regex_match = _js_regex_literal_pattern.fullmatch(test.strip())
+    if regex_match is None:
+        return None
+
+    pattern, flags = regex_match.groups()
+    compile_flags = 0
+    for flag in flags:
+        compile_flags |= _js_regex_flags.get(flag, 0)
+
+    try:
+        return re.compile(
+            _translate_js_regex(
+                _split_surrogate_pairs(pattern), "m" in flags, "s" in flags
+            ),
+            compile_flags,
+        )
+    except re.error as err:
+        raise ValueError(f"Invalid validation rule {test}: {err}.")
+
+
+def _format_js_number(value: Any) -> str:
+    # Mirrors how JavaScript prints a number in a template literal: the
+    # shortest round-tripping digits, in positional notation for decimal
+    # exponents from -7 to 20 and in scientific notation (`1e-7`) otherwise.
+    number = float(value)
+    if math.isnan(number):
+        return "NaN"
+    if math.isinf(number):
+        return "Infinity" if number > 0 else "-Infinity"
+    if number == 0:
+        return "0"
+
+    sign = "-" if number < 0 else ""
+    _, digits, exponent = Decimal(repr(abs(number))).normalize().as_tuple()
+    digits = "".join(map(str, digits))
+    point_position = exponent + len(digits)
+
+    if len(digits) <= point_position <= 21:
+        formatted_number = digits + "0" * (point_position - len(digits))
+    elif 0 < point_position <= 21:
+        formatted_number = f"{digits[:point_position]}.{digits[point_position:]}"
+    elif -6 < point_position <= 0:
+        formatted_number = f"0.{'0' * -point_position}{digits}"
+    else:
+        scientific_exponent = point_position - 1
+        formatted_number = (
+            (f"{digits[0]}.{digits[1:]}" if len(digits) > 1 else digits)
+            + ("e+" if scientific_exponent >= 0 else "e-")
+            + str(abs(scientific_exponent))
+        )
+
+    return sign + formatted_number
+
+
+def _to_js_number(value: str) -> float:
+    # Mirrors `Number(value)` for the strings a form can submit.
+    stripped_value = value.strip(_js_whitespace_characters)
+    if not stripped_value:
+        return 0.0
+    if stripped_value.lstrip("+-") == "Infinity":
+        return float(stripped_value.replace("Infinity", "inf"))
+    if "_" in stripped_value or stripped_value.lstrip("+-").lower() in (
+        "inf",
+        "infinity",
+        "nan",
+    ):
+        return math.nan
+
+    try:
+        if stripped_value[:2].lower() in ("0x", "0o", "0b"):
+            return float(int(stripped_value, 0))
+        return float(stripped_value)
+    except ValueError:
+        return math.nan
+
+
+_astral_character_pattern = re.compile("[\U00010000-\U0010ffff]")
+
+
+def _split_surrogate_pairs(value: str) -> str:
+    # Without the `u` flag, JavaScript regular expressions see characters
+    # outside the Basic Multilingual Plane as two UTF-16 code units, so both
+    # the patterns and the values are matched as code units.
+    def split(character_match: re.Match[str]) -> str:
+        code_point = ord(character_match.group()) - 0x10000
+        return chr(0xD800 + (code_point >> 10)) + chr(0xDC00 + (code_point & 0x3FF))
+
+    return _astral_character_pattern.sub(split, value)
+
+
+def _utf16_length(value: str) -> int:
+    # JavaScript counts UTF-16 code units, so characters outside the Basic
+    # Multilingual Plane (e.g. emoji) count twice.
+    return len(value.encode("utf-16-le")) // 2
+
+
+class _CompiledConstraint(NamedTuple):
+    operand: Literal["length", "number"]
+    check: Callable[[Any], Sequence[bool]]
+    message: str
+
+
+class _CompiledRule(NamedTuple):
+    pattern: re.Pattern[str]
+    message: str | None
+
+
+def _compare(operands: Any, compare: Callable[[Any, Any], Any], limit: Any) -> Any:
+    # NumPy arrays are compared in one vectorized operation.
+    if hasattr(operands, "dtype"):
+        return compare(operands, limit)
+
+    return [compare(operand, limit) for operand in operands]
+
+
+def _check_step(numbers: Any, step: float, base: float) -> Any:
+    if hasattr(numbers, "dtype"):
+        import numpy as np
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            steps = (numbers - base) / step
+            return np.isfinite(steps) & (np.abs(steps - np.round(steps)) > 1e-9)
+
+    if step == 0:
+        return [False] * len(numbers)
+
+    steps = [(number - base) / step for number in numbers]
+    return [math.isfinite(step) and abs(step - round(step)) > 1e-9 for step in steps]
+
+
+def _compile_constraints(hook_form_item: AlpineHookForm) -> list[_CompiledConstraint]:
+    constraints = hook_form_item.constraints
+    compiled_constraints = []
+    for constraint_type, constraint in constraints.items():
+        limit = constraint.get("value")
+        message = constraint.get("message")
+
+        # Each check runs over a whole column of the (non-empty) values' lengths
+        # or numbers, which are computed once per column, not once per rule.
+        match constraint_type:
+            case "min_length":
+                operand = "length"
+                check = partial(_compare, compare=operator.lt, limit=limit)
+                default_message = f"Must be at least {limit} characters."
+            case "max_length":
+                operand = "length"
+                check = partial(_compare, compare=operator.gt, limit=limit)
+                default_message = f"Must be at most {limit} characters."
+            case "min":
+                operand = "number"
+                check = partial(_compare, compare=operator.lt, limit=float(limit))
+                default_message = f"Must be at least {_format_js_number(limit)}."
+            case "max":
+                operand = "number"
+                check = partial(_compare, compare=operator.gt, limit=float(limit))
+                default_message = f"Must be at most {_format_js_number(limit)}."
+            case "step":
+                operand = "number"
+                check = partial(
+                    _check_step,
+                    step=float(limit),
+                    base=float(constraints["min"]["value"])
+                    if "min" in constraints
+                    else 0.0,
+                )
+                default_message = f"Must be a multiple of {_format_js_number(limit)}."
+            case _:
+                continue
+
+        compiled_constraints.append(
+            _CompiledConstraint(
+                operand=operand, check=check, message=message or default_message
+            )
+        )
+
+    return compiled_constraints
+
+
+def _compile_rules(hook_form_item: AlpineHookForm) -> list[_CompiledRule]:
+    compiled_rules = []
+    for rule in hook_form_item.validator.get("validation_rules", []):
+        pattern = _compile_js_regex(rule.get("test", ""))
+        if pattern is None:
+            warnings.warn(
+                f"Only regular expression rules can be validated in Python, skipping {rule.get('test')!r} of '{hook_form_item.name}'.",
+                UserWarning,
+                stacklevel=3,
+            )
+            continue
+
+        compiled_rules.append(
+            _CompiledRule(pattern=pattern, message=rule.get("message") or None)
+        )
+
+    return compiled_rules
+
+
+def _compute_operands(
+    values: list[str], operand: Literal["length", "number"], is_array: bool
+) -> Any:
+    if operand == "length":
+        operands = [_utf16_length(value) for value in values]
+    else:
+        operands = [_to_js_number(value) for value in values]
+
+    # Columns passed as NumPy arrays are checked with vectorized comparisons.
+    if is_array:
+        import numpy as np
+
+        return np.array(operands, dtype="float64")
+
+    return operands
+
+
+class _CompiledField(NamedTuple):
+    name: str
+    required_message: str | None
+    constraints: list[_CompiledConstraint]
+    rules: list[_CompiledRule]
+
+
+class FormValidator:
+    def __init__(self, *hook_form_items: AlpineHookForm):
+        self.fields = []
+        for hook_form_item in hook_form_items:
+            if hook_form_item.name is None:
+                raise ValueError(
+                    f"`{self.__class__.__qualname__}` can only validate hook form items with a 'name'."
+                )
+
+            self.fields.append(
+                _CompiledField(
+                    name=hook_form_item.name,
+                    required_message=_required_message(hook_form_item),
+                    constraints=_compile_constraints(hook_form_item),
+                    rules=_compile_rules(hook_form_item),
+                )
+            )
+
+    def validate(self, data: Mapping[str, Any]) -> dict[str, str | None]:
+        return self.validate_columns(
+            {field.name: [data.get(field.name)] for field in self.fields}
+        )[0]
+
+    def validate_batch(
+        self, rows: Iterable[Mapping[str, Any]]
+    ) -> list[dict[str, str | None]]:
+        rows = list(rows)
+        return self.validate_columns(
+            {field.name: [row.get(field.name) for row in rows] for field in self.fields}
+        )
+
+    def validate_columns(
+        self, columns: Mapping[str, Sequence[Any]]
+    ) -> list[dict[str, str | None]]:
+        number_of_rows = max((len(column) for column in columns.values()), default=0)
+        errors = [{} for _ in range(number_of_rows)]
+
+        for field in self.fields:
+            column = columns.get(field.name)
+            operands = {}
+            if column is None:
+                column = [None] * number_of_rows
+            elif hasattr(column, "dtype") and column.dtype.kind in "iuf":
+                # A numeric NumPy column has no empty values, and its numbers are
+                # what `Number()` would parse, so they are checked as they are
+                # (infinities print as 'inf', which `Number()` parses as NaN).
+                numbers = column.astype("float64")
+                numbers[abs(numbers) == math.inf] = math.nan
+                operands["number"] = numbers
+
+            messages: dict[int, str | None] = {}
+            is_array = hasattr(column, "dtype")
+            if (
+                "number" in operands
+                and not field.rules
+                and all(
+                    constraint.operand == "number" for constraint in field.constraints
+                )
+            ):
+                # Only the numbers are needed, so no value is turned into text.
+                values = None
+                indices = range(number_of_rows)
+            else:
+                if hasattr(column, "tolist"):
+                    column = column.tolist()
+
+                values = ["" if value is None else str(value) for value in column]
+                if field.required_message is not None:
+                    messages.update(
+                        (index, field.required_message)
+                        for index, value in enumerate(values)
+                        if not value
+                    )
+
+                # Like the browser, empty values are not checked any further.
+                indices = [index for index, value in enumerate(values) if value]
+
+            # Every failing constraint overrides the previous one, and the rules
+            # only run (until the first failing one) when all constraints pass.
+            for constraint in field.constraints:
+                if constraint.operand not in operands:
+                    operands[constraint.operand] = _compute_operands(
+                        [values[index] for index in indices],
+                        constraint.operand,
+                        is_array,
+                    )
+
+                failed = constraint.check(operands[constraint.operand])
+                if hasattr(failed, "nonzero"):
+                    failed_positions = failed.nonzero()[0].tolist()
+                else:
+                    failed_positions = [
+                        position
+                        for position, is_failed in enumerate(failed)
+                        if is_failed
+                    ]
+                for position in failed_positions:
+                    messages[indices[position]] = constraint.message
+
+            indices = [index for index in indices if index not in messages]
+            if field.rules:
+                values = [_split_surrogate_pairs(value) for value in values]
+            for rule in field.rules:
+                remaining_indices = []
+                for index in indices:
+                    if rule.pattern.search(values[index]) is None:
+                        messages[index] = rule.message
+                    else:
+                        remaining_indices.append(index)
+                indices = remaining_indices
+
+            for index, message in messages.items():
+                errors[index][field.name] = message
+
+        return errors
@@ -2,7 +2,6 @@ import warnings
 from typing import Self
 
 from aether.plugins.alpinejs import AlpineJSData, alpine_js_data_merge
-from aether.plugins.tailwindcss import tw_merge
 from aether.tags.html import (
     Div,
     DivAttributes,
@@ -16,6 +15,7 @@ from aether.tags.html import (
 from altar_icons import EyeIcon, EyeOffIcon
 
 from .button import Button
+from .utils import tw_merge
 
 try:
     from typing import Unpack
@@ -1,7 +1,8 @@
-from aether.plugins.tailwindcss import tw_merge
 from aether.tags.html import Label as PyLabel
 from aether.tags.html import LabelAttributes as PyLabelAttributes
 
+from .utils import tw_merge
+
 try:
     from typing import Unpack
 except ImportError:
@@ -1,12 +1,13 @@
 from typing import Self
 
 from aether.plugins.alpinejs import AlpineJSData, Statement, alpine_js_data_merge
-from aether.plugins.tailwindcss import tw_merge
 from aether.tags.html import A, AAttributes, Div, DivAttributes, Nav, NavAttributes
 from aether.tags.html import Button as PyButton
 from aether.tags.html import ButtonAttributes as PyButtonAttributes
 from altar_icons import ChevronDownIcon
 
+from .utils import tw_merge
+
 try:
     from typing import Unpack
 except ImportError:
@@ -1,8 +1,8 @@
 import warnings
-from typing import Literal, Self
+from typing import Any, Literal, Self
 
+from aether import BaseWebElement
 from aether.plugins.alpinejs import AlpineJSData, Statement, alpine_js_data_merge
-from aether.plugins.tailwindcss import tw_merge
 from aether.tags.html import (
     ButtonAttributes as PyButtonAttributes,
 )
@@ -13,12 +13,15 @@ from aether.tags.html import (
     NavAttributes,
     Span,
     SpanAttributes,
+    Template,
     Ul,
     UlAttributes,
 )
 from altar_icons import ChevronLeftIcon, ChevronRightIcon, EllipsisIcon
 
+from .alpine import register_alpine_data, use_alpine_data
 from .button import Button, ButtonVariant
+from .utils import LazyChildren, tw_merge
 
 try:
     from typing import Unpack
@@ -26,11 +29,37 @@ except ImportError:
     from typing_extensions import Unpack  # noqa: UP035
 
 
+# The visible pages of a `PaginationWindow` are derived from the scope of its
+# `Pagination`, so the rendered markup stays the same size whatever
+# `numberOfPages` is.
+_page_window_statement = Statement(
+    "{ const lastPage = this.numberOfPages; const start = Math.max(2, this.currentPageIndex - this.siblingCount); const end = Math.min(lastPage - 1, this.currentPageIndex + this.siblingCount); const pages = [1]; if (start === 3) { pages.push(2) } else if (start > 3) { pages.push(null) } for (let page = start; page <= end; page++) { pages.push(page) } if (end === lastPage - 2) { pages.push(lastPage - 1) } else if (end < lastPage - 2) { pages.push(null) } if (lastPage > 1) { pages.push(lastPage) } return pages }",
+    seq_type="definition",
+)
+
+
+def _has_pagination_window(children: list[Any]) -> bool:
+    for child in children:
+        if isinstance(child, PaginationWindow):
+            return True
+        # Lazy children are never consumed ahead of the render.
+        if (
+            isinstance(child, BaseWebElement)
+            and not isinstance(child, LazyChildren)
+            and isinstance(getattr(child, "children", None), list)
+            and _has_pagination_window(child.children)
+        ):
+            return True
+
+    return False
+
+
 class Pagination(Nav):
     def __init__(
         self,
         number_of_pages: int | Statement,
         current_page_index: int | Statement = 1,
+        sibling_count: int = 1,
         **attributes: Unpack[NavAttributes],
     ):
         if not isinstance(number_of_pages, int | Statement):
@@ -49,6 +78,14 @@ class Pagination(Nav):
             )
             current_page_index = 1
 
+        if not isinstance(sibling_count, int) or sibling_count < 0:
+            warnings.warn(
+                "'sibling_count' expected to be a non-negative 'int'. Defaulting to 1.",
+                UserWarning,
+                stacklevel=2,
+            )
+            sibling_count = 1
+
         base_class_attribute = "flex justify-center mx-auto w-full"
         base_x_data_attribute = AlpineJSData(
             data={
@@ -77,6 +114,30 @@ class Pagination(Nav):
             **attributes,
         )
 
+        self.sibling_count = sibling_count
+
+    def __call__(self, *children: Any) -> Self:
+        super().__call__(*children)
+
+        # Only a `Pagination` with a `PaginationWindow` carries the window
+        # helpers; values from the user's `x_data` still take precedence.
+        x_data_attribute = self.attributes["x-data"]
+        if "getPageWindow()" not in x_data_attribute.data and _has_pagination_window(
+            self.children
+        ):
+            self.attributes["x-data"] = alpine_js_data_merge(
+                AlpineJSData(
+                    data={
+                        "siblingCount": self.sibling_count,
+                        "getPageWindow()": _page_window_statement,
+                    },
+                    directive="x-data",
+                ),
+                x_data_attribute,
+            )
+
+        return self
+
 
 class PaginationContent(Ul):
     def __init__(self, **attributes: Unpack[UlAttributes]):
@@ -90,29 +151,50 @@ class PaginationContent(Ul):
         )
 
 
+_pagination_item_x_data_attribute = AlpineJSData(
+    data={
+        "pageIndex": 1,
+        "isActive()": Statement(
+            "{ return this.currentPageIndex === this.pageIndex }",
+            seq_type="definition",
+        ),
+        "setActive()": Statement(
+            "{ this.currentPageIndex = this.pageIndex }",
+            seq_type="definition",
+        ),
+    },
+    directive="x-data",
+)
+
+register_alpine_data("altarPaginationItem", _pagination_item_x_data_attribute)
+
+
 class PaginationItem(Li):
     def __init__(
         self, item_index: int | None = None, **attributes: Unpack[LiAttributes]
     ):
         if item_index is not None:
-            base_x_data_attribute = AlpineJSData(
-                data={
-                    "pageIndex": item_index + 1,
-                    "isActive()": Statement(
-                        "{ if (currentPageIndex === this.pageIndex) { return true } else { return false } }",
-                        seq_type="definition",
-                    ),
-                    "setActive()": Statement(
-                        "{ currentPageIndex = this.pageIndex }",
-                        seq_type="definition",
-                    ),
-                },
-                directive="x-data",
-            )
             x_data_attribute = attributes.pop("x_data", None)
 
+            if x_data_attribute is None and (
+                registered_x_data_attribute := use_alpine_data(
+                    "altarPaginationItem", {"pageIndex": item_index + 1}
+                )
+            ):
+                x_data_attribute = registered_x_data_attribute
+            else:
+                x_data_attribute = alpine_js_data_merge(
+                    alpine_js_data_merge(
+                        _pagination_item_x_data_attribute,
+                        AlpineJSData(
+                            data={"pageIndex": item_index + 1}, directive="x-data"
+                        ),
+                    ),
+                    x_data_attribute,
+                )
+
             super().__init__(
-                x_data=alpine_js_data_merge(base_x_data_attribute, x_data_attribute),
+                x_data=x_data_attribute,
                 data_slot="pagination-item",
                 **attributes,
             )
@@ -241,3 +323,45 @@ class PaginationEllipsis(Span):
         )
 
         return self
+
+
+class PaginationWindow(Template):
+    def __init__(self, **attributes: Unpack[LiAttributes]):
+        # Items are keyed by their position in the window, so changing page
+        # only updates the text of the existing links.
+        super().__init__(
+            **{
+                "x-for": "(page, index) in getPageWindow()",
+                ":key": "index",
+            },
+        )
+
+        self.children = [
+            Li(data_slot="pagination-item", **attributes)(
+                Template(x_if="page !== null")(
+                    Button(
+                        size="icon",
+                        variant=None,
+                        type="button",
+                        data_slot="pagination-link",
+                        x_text="page",
+                        **{
+                            "@click": "currentPageIndex = page",
+                            ":aria-current": "currentPageIndex === page ? 'page' : undefined",
+                            ":data-active": "currentPageIndex === page",
+                            ":class": f"currentPageIndex === page ? '{ButtonVariant.outline}' : '{ButtonVariant.ghost}'",
+                        },
+                    )
+                ),
+                Template(x_if="page === null")(PaginationEllipsis()),
+            )
+        ]
+
+    def __call__(self, *_children: tuple) -> Self:
+        warnings.warn(
+            f"Trying to add child to a non-child element: {self.__class__.__qualname__}",
+            UserWarning,
+            stacklevel=2,
+        )
+
+        return self
@@ -2,9 +2,10 @@ import warnings
 from typing import Self
 
 from aether.plugins.alpinejs import AlpineJSData, Statement, alpine_js_data_merge
-from aether.plugins.tailwindcss import tw_merge
 from aether.tags.html import Div, DivAttributes
 
+from .utils import tw_merge
+
 try:
     from typing import Unpack
 except ImportError:
@@ -2,10 +2,11 @@ import warnings
 from typing import Self
 
 from aether.plugins.alpinejs import AlpineJSData, alpine_js_data_merge
-from aether.plugins.tailwindcss import tw_merge
 from aether.tags.html import Div, DivAttributes, Input
 from altar_icons import CircleIcon
 
+from .utils import tw_merge
+
 try:
     from typing import Unpack
 except ImportError:
@@ -1,9 +1,10 @@
 import warnings
 from typing import Literal, Self
 
-from aether.plugins.tailwindcss import tw_merge
 from aether.tags.html import Div, DivAttributes
 
+from .utils import tw_merge
+
 try:
     from typing import Unpack
 except ImportError:
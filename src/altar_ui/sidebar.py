@@ -5,7 +5,6 @@ from typing import Literal, Self
 
 from aether import BaseWebElement
 from aether.plugins.alpinejs import AlpineJSData, Statement, alpine_js_data_merge
-from aether.plugins.tailwindcss import tw_merge
 from aether.tags.html import (
     Aside,
     AsideAttributes,
@@ -25,56 +24,69 @@ from aether.tags.html import (
 )
 from altar_icons import PanelLeftIcon
 
+from .alpine import register_alpine_data, use_alpine_data
 from .button import Button
 from .passthrough import Passthrough
+from .utils import tw_merge
 
 try:
     from typing import Unpack
 except ImportError:
     from typing_extensions import Unpack  # noqa: UP035
 
-# Requires Resize plugin
+_sidebar_provider_x_data_attribute = AlpineJSData(
+    data={
+        "smallScreenViewport": Statement(
+            "window.innerWidth < 768", seq_type="assignment"
+        ),
+        "isSidebarOpen": True,
+        "isSidebarForSmallScreenViewportOpen": False,
+        "closeSidebarForSmallScreenViewport()": Statement(
+            "{ this.isSidebarForSmallScreenViewportOpen = false }",
+            seq_type="definition",
+        ),
+        "getSidebarState()": Statement(
+            "{ return this.isSidebarOpen ? 'expended' : 'collapsed' }",
+            seq_type="definition",
+        ),
+        "toggleSidebarState()": Statement(
+            """{
+                if (this.smallScreenViewport) {
+                    this.isSidebarForSmallScreenViewportOpen = !this.isSidebarForSmallScreenViewportOpen
+                } else {
+                    this.isSidebarOpen = !this.isSidebarOpen
+                }
+            }""",
+            seq_type="definition",
+        ),
+    },
+    directive="x-data",
+)
 
+register_alpine_data("altarSidebarProvider", _sidebar_provider_x_data_attribute)
 
+
+# Requires Resize plugin
 class SidebarProvider(Div):
     def __init__(self, **attributes: Unpack[DivAttributes]):
-        base_x_data_attribute = AlpineJSData(
-            data={
-                "smallScreenViewport": Statement(
-                    "window.innerWidth < 768", seq_type="assignment"
-                ),
-                "isSidebarOpen": True,
-                "isSidebarForSmallScreenViewportOpen": False,
-                "closeSidebarForSmallScreenViewport()": Statement(
-                    "{ this.isSidebarForSmallScreenViewportOpen = false }",
-                    seq_type="definition",
-                ),
-                "getSidebarState()": Statement(
-                    "{ return this.isSidebarOpen ? 'expended' : 'collapsed' }",
-                    seq_type="definition",
-                ),
-                "toggleSidebarState()": Statement(
-                    """{
-                        if (this.smallScreenViewport) {
-                            this.isSidebarForSmallScreenViewportOpen = !this.isSidebarForSmallScreenViewportOpen
-                        } else {
-                            this.isSidebarOpen = !this.isSidebarOpen
-                        }
-                    }""",
-                    seq_type="definition",
-                ),
-            },
-            directive="x-data",
-        )
         base_class_attribute = "flex w-full min-h-svh group/sidebar-wrapper has-data-[variant=inset]:bg-sidebar"
 
         x_data_attribute = attributes.pop("x_data", None)
         class_attribute = attributes.pop("_class", "")
 
+        if x_data_attribute is None and (
+            registered_x_data_attribute := use_alpine_data("altarSidebarProvider")
+        ):
+            x_data_attribute = registered_x_data_attribute
+        else:
+            x_data_attribute = alpine_js_data_merge(
+                _sidebar_provider_x_data_attribute, x_data_attribute
+            )
+
         super().__init__(
             data_slot="sidebar-wrapper",
             _class=tw_merge(base_class_attribute, class_attribute),
-            x_data=alpine_js_data_merge(base_x_data_attribute, x_data_attribute),
+            x_data=x_data_attribute,
             **{"x-resize.window": "smallScreenViewport = window.innerWidth < 768"},
             **attributes,
         )
@@ -181,6 +193,9 @@ class Sidebar(Div):
             ):
                 forwarded_children.append(child)
             elif isinstance(child, Generator):
+                # Children are rendered in both the small screen and the desktop
+                # container, the small screen one first, so a generator is
+                # materialized: splitting it would buffer every item all the same.
                 forwarded_children.extend(list(child))
             elif isinstance(child, type(None)):
                 continue
@@ -386,6 +401,19 @@ class SidebarMenuButtonSize(StrEnum):
     lg = "h-12 text-sm group-data-[collapsible=icon]:p-0!"
 
 
+_sidebar_menu_button_base_class_attribute = "flex overflow-hidden gap-2 items-center p-2 w-full text-left text-sm rounded-md outline-hidden ring-sidebar-ring transition-[width,height,padding] peer/menu-button group-has-data-[sidebar=menu-action]/menu-item:pr-8 aria-disabled:pointer-events-none aria-disabled:opacity-50 data-[active]:bg-sidebar-accent data-[active]:font-medium data-[active]:text-sidebar-accent-foreground data-[state=open]:hover:bg-sidebar-accent data-[state=open]:hover:text-sidebar-accent-foreground group-data-[collapsible=icon]:size-8! [&>span:last-child]:truncate disabled:opacity-50 disabled:pointer-events-none hover:text-sidebar-accent-foreground hover:bg-sidebar-accent focus-visible:ring-2 active:text-sidebar-accent-foreground active:bg-sidebar-accent [&>svg]:size-4 [&>svg]:shrink-0"
+
+_sidebar_menu_button_class_attributes = {
+    (variant, size): tw_merge(
+        SidebarMenuButtonVariant[variant],
+        SidebarMenuButtonSize[size],
+        _sidebar_menu_button_base_class_attribute,
+    )
+    for variant in SidebarMenuButtonVariant.__members__
+    for size in SidebarMenuButtonSize.__members__
+}
+
+
 class SidebarMenu(Nav):
     def __init__(self, **attributes: Unpack[UlAttributes]):
         self.forwarded_base_class_attribute = "flex flex-col gap-1 w-full min-w-0"
@@ -486,21 +514,17 @@ class SidebarMenuButton(PyButton):
         size: Literal["default", "sm", "lg"] = "default",
         **attributes: Unpack[PyButtonAttributes],
     ):
-        base_class_attribute = "flex overflow-hidden gap-2 items-center p-2 w-full text-left text-sm rounded-md outline-hidden ring-sidebar-ring transition-[width,height,padding] peer/menu-button group-has-data-[sidebar=menu-action]/menu-item:pr-8 aria-disabled:pointer-events-none aria-disabled:opacity-50 data-[active]:bg-sidebar-accent data-[active]:font-medium data-[active]:text-sidebar-accent-foreground data-[state=open]:hover:bg-sidebar-accent data-[state=open]:hover:text-sidebar-accent-foreground group-data-[collapsible=icon]:size-8! [&>span:last-child]:truncate disabled:opacity-50 disabled:pointer-events-none hover:text-sidebar-accent-foreground hover:bg-sidebar-accent focus-visible:ring-2 active:text-sidebar-accent-foreground active:bg-sidebar-accent [&>svg]:size-4 [&>svg]:shrink-0"
-
-        variant_class_attribute = SidebarMenuButtonVariant[variant]
-        size_class_attribute = SidebarMenuButtonSize[size]
+        compiled_class_attribute = _sidebar_menu_button_class_attributes[
+            (variant, size)
+        ]
         class_attribute = attributes.pop("_class", "")
 
         data_slot = attributes.pop("data_slot", "sidebar-menu-button")
 
         super().__init__(
-            _class=tw_merge(
-                variant_class_attribute,
-                size_class_attribute,
-                base_class_attribute,
-                class_attribute,
-            ),
+            _class=tw_merge(compiled_class_attribute, class_attribute)
+            if class_attribute
+            else compiled_class_attribute,
             data_slot=data_slot,
             data_size=size,
             data_sidebar="menu-button",
@@ -0,0 +1,196 @@
+import math
+import warnings
+from collections.abc import Generator, Sequence
+from functools import lru_cache
+from typing import Any, Self
+
+from aether import mark_safe
+from aether.tags.html import BaseHTMLElement
+from aether.tags.svg import Path, Svg, SvgAttributes
+
+from .utils import (
+    _TEMPLATE_SLOT,
+    _call_cached,
+    _column_to_list,
+    _is_plottable,
+    _render_template_parts,
+    tw_merge,
+)
+
+try:
+    from typing import Unpack
+except ImportError:
+    from typing_extensions import Unpack  # noqa: UP035
+
+
+@lru_cache(maxsize=256)
+def _sparkline_template(
+    width: int,
+    height: int,
+    stroke_width: float,
+    color: str,
+    attributes: tuple[tuple[str, Any], ...],
+) -> tuple[str, str]:
+    attributes = dict(attributes)
+    if "aria_label" in attributes:
+        attributes.setdefault("role", "img")
+    else:
+        attributes.setdefault("aria_hidden", "true")
+
+    path = Path(
+        d=_TEMPLATE_SLOT,
+        stroke_width=str(stroke_width),
+        stroke_linecap="round",
+        stroke_linejoin="round",
+        vector_effect="non-scaling-stroke",
+        style=f"stroke: {color}",
+    )
+    # `Path` defaults `pathLength` to an empty string, which is not a valid
+    # length, so the attribute is left out.
+    path.attributes.pop("pathLength", None)
+
+    opening_tag, closing_tag = _render_template_parts(
+        Svg(
+            width=str(width),
+            height=str(height),
+            viewBox=f"0 0 {width} {height}",
+            fill="none",
+            data_slot="sparkline",
+            **attributes,
+        )(path)
+    )
+    return opening_tag, closing_tag
+
+
+def _pixel_column_extremes(
+    values: list[float], start: int, stop: int, number_of_columns: int
+) -> list[int]:
+    if stop - start <= 2 * number_of_columns + 2:
+        return list(range(start, stop))
+
+    # A pixel column can show at most its lowest and highest point, so only
+    # those are kept (in their original order), plus both ends of the segment.
+    indices = [start]
+    step = (stop - start) / number_of_columns
+    for column in range(number_of_columns):
+        column_start = start + int(column * step)
+        column_values = values[column_start : start + int((column + 1) * step)]
+        if not column_values:
+            continue
+
+        minimum_index = column_start + column_values.index(min(column_values))
+        maximum_index = column_start + column_values.index(max(column_values))
+        indices.extend(sorted({minimum_index, maximum_index}))
+    indices.append(stop - 1)
+
+    return list(dict.fromkeys(indices))
+
+
+def build_sparkline_path(
+    values: Sequence[Any], width: int, height: int, stroke_width: float = 1.5
+) -> str:
+    values = _column_to_list(values, None)
+    number_of_points = len(values)
+
+    # Gaps (`None`, NaN, infinity) split the line into separate segments;
+    # plain series of finite numbers are a single segment.
+    if set(map(type, values)) <= {int, float} and math.isfinite(sum(values)):
+        segments = [(0, number_of_points)] if values else []
+    else:
+        segments = []
+        segment_start = None
+        for index, value in enumerate(values):
+            if _is_plottable(value):
+                if segment_start is None:
+                    segment_start = index
+            elif segment_start is not None:
+                segments.append((segment_start, index))
+                segment_start = None
+        if segment_start is not None:
+            segments.append((segment_start, number_of_points))
+
+    if not segments:
+        return ""
+
+    segments = [
+        _pixel_column_extremes(
+            values, start, stop, math.ceil((stop - start) * width / number_of_points)
+        )
+        for start, stop in segments
+    ]
+
+    plotted_values = [values[index] for segment in segments for index in segment]
+    minimum = min(plotted_values)
+    maximum = max(plotted_values)
+    x_scale = width / (number_of_points - 1) if number_of_points > 1 else 0
+    y_scale = (height - stroke_width) / (maximum - minimum) if maximum > minimum else 0
+    y_offset = stroke_width / 2 if maximum > minimum else height / 2
+
+    commands = []
+    for segment in segments:
+        commands.append("M")
+        commands.append(
+            "L".join(
+                f"{index * x_scale if x_scale else width / 2:.1f} "
+                f"{y_offset + (maximum - values[index]) * y_scale:.1f}"
+                for index in segment
+            )
+        )
+
+        # A lone point is drawn as a dot by the round line cap.
+        if len(segment) == 1:
+            commands.append("h0")
+
+    return "".join(commands)
+
+
+class Sparkline(BaseHTMLElement):
+    tag_name = "passthrough"
+    have_children = False
+    content_category = None
+
+    def __init__(
+        self,
+        values: Sequence[Any],
+        width: int = 100,
+        height: int = 24,
+        stroke_width: float = 1.5,
+        color: str = "var(--chart-1)",
+        **attributes: Unpack[SvgAttributes],
+    ):
+        if width <= 0 or height <= 0:
+            raise ValueError(
+                f"'width' and 'height' must be positive, got {width} and {height}."
+            )
+
+        super().__init__()
+
+        attributes["_class"] = tw_merge(
+            "shrink-0 overflow-visible", attributes.get("_class", "")
+        )
+
+        # The `<svg>`/`<path>` markup only depends on the options, so it is
+        # rendered once per combination and the path data is filled in per
+        # sparkline; a table with thousands of rows builds no elements at all.
+        self.template = _call_cached(
+            _sparkline_template,
+            width,
+            height,
+            stroke_width,
+            color,
+            tuple(sorted(attributes.items())),
+        )
+        self.path = build_sparkline_path(values, width, height, stroke_width)
+
+    def __call__(self, *_children: tuple) -> Self:
+        warnings.warn(
+            f"Trying to add child to a non-child element: {self.__class__.__qualname__}",
+            UserWarning,
+            stacklevel=2,
+        )
+
+        return self
+
+    def render(self, stringify: bool = True) -> Generator[str]:
+        opening_tag, closing_tag = self.template
+        yield mark_safe(f"{opening_tag}{self.path}{closing_tag}")
@@ -0,0 +1,158 @@
+import asyncio
+import contextvars
+from collections.abc import Awaitable, Callable, Generator, Iterable, Mapping
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+from aether import BaseWebElement
+from aether.base import _render_element
+
+DEFAULT_CHUNK_SIZE = 16 * 1024
+
+
+def render_chunks(
+    *elements: BaseWebElement | str,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    encoding: str = "utf-8",
+) -> Generator[bytes]:
+    if chunk_size <= 0:
+        raise ValueError(f"'chunk_size' must be a positive integer, got {chunk_size}.")
+
+    buffer = bytearray()
+    for element in elements:
+        for fragment in _render_element(element):
+            buffer += fragment.encode(encoding)
+
+            # Flush every full chunk as soon as it is available, so the first
+            # bytes go out before the rest of the tree has been rendered.
+            if len(buffer) >= chunk_size:
+                offset = 0
+                while len(buffer) - offset >= chunk_size:
+                    yield bytes(buffer[offset : offset + chunk_size])
+                    offset += chunk_size
+                del buffer[:offset]
+
+    if buffer:
+        yield bytes(buffer)
+
+
+def _build_response_headers(
+    headers: Mapping[str, str] | None, encoding: str
+) -> list[tuple[str, str]]:
+    response_headers = {"content-type": f"text/html; charset={encoding}"}
+    if headers:
+        response_headers.update({key.lower(): value for key, value in headers.items()})
+
+    return list(response_headers.items())
+
+
+async def _listen_for_disconnect(
+    receive: Callable[[], Awaitable[dict[str, Any]]], disconnected: asyncio.Event
+) -> None:
+    while (await receive())["type"] != "http.disconnect":
+        pass
+
+    disconnected.set()
+
+
+class ASGIStreamingResponse:
+    def __init__(
+        self,
+        *elements: BaseWebElement | str,
+        status_code: int = 200,
+        headers: Mapping[str, str] | None = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        encoding: str = "utf-8",
+    ):
+        self.elements = elements
+        self.status_code = status_code
+        self.headers = _build_response_headers(headers, encoding)
+        self.chunk_size = chunk_size
+        self.encoding = encoding
+
+    async def __call__(
+        self,
+        scope: dict[str, Any],
+        receive: Callable[[], Awaitable[dict[str, Any]]],
+        send: Callable[[dict[str, Any]], Awaitable[None]],
+    ) -> None:
+        if scope["type"] != "http":
+            raise ValueError(
+                f"`{self.__class__.__qualname__}` can only handle 'http' scopes, but got '{scope['type']}'."
+            )
+
+        await send(
+            {
+                "type": "http.response.start",
+                "status": self.status_code,
+                "headers": [
+                    (key.encode("latin-1"), value.encode("latin-1"))
+                    for key, value in self.headers
+                ],
+            }
+        )
+
+        # Rendering is CPU bound, so each chunk is rendered in a worker thread
+        # (in the caller's context, for the Alpine registry) to keep the event
+        # loop serving other requests. Rendering stops once the client is gone.
+        # Lazy children can hold thread-bound resources (e.g. a sqlite3
+        # cursor), so every chunk of a response is rendered on the same thread.
+        loop = asyncio.get_running_loop()
+        context = contextvars.copy_context()
+        executor = ThreadPoolExecutor(max_workers=1)
+        chunks = render_chunks(
+            *self.elements, chunk_size=self.chunk_size, encoding=self.encoding
+        )
+        disconnected = asyncio.Event()
+        disconnect_listener = asyncio.ensure_future(
+            _listen_for_disconnect(receive, disconnected)
+        )
+        try:
+            while not disconnected.is_set():
+                chunk = await loop.run_in_executor(
+                    executor, context.run, next, chunks, None
+                )
+                if disconnected.is_set():
+                    break
+                if chunk is None:
+                    await send(
+                        {"type": "http.response.body", "body": b"", "more_body": False}
+                    )
+                    break
+
+                await send(
+                    {"type": "http.response.body", "body": chunk, "more_body": True}
+                )
+        finally:
+            disconnect_listener.cancel()
+            # Closing runs the generators' cleanup, after any chunk still being
+            # rendered and on the same thread.
+            executor.submit(context.run, chunks.close)
+            executor.shutdown(wait=False)
+
+
+class WSGIStreamingResponse:
+    def __init__(
+        self,
+        *elements: BaseWebElement | str,
+        status: str = "200 OK",
+        headers: Mapping[str, str] | None = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        encoding: str = "utf-8",
+    ):
+        self.elements = elements
+        self.status = status
+        self.headers = _build_response_headers(headers, encoding)
+        self.chunk_size = chunk_size
+        self.encoding = encoding
+
+    def __call__(
+        self,
+        environ: dict[str, Any],
+        start_response: Callable[[str, list[tuple[str, str]]], Any],
+    ) -> Iterable[bytes]:
+        start_response(self.status, self.headers)
+
+        return render_chunks(
+            *self.elements, chunk_size=self.chunk_size, encoding=self.encoding
+        )
@@ -2,9 +2,10 @@ import warnings
 from typing import Self
 
 from aether.plugins.alpinejs import AlpineJSData, alpine_js_data_merge
-from aether.plugins.tailwindcss import tw_merge
 from aether.tags.html import Button, Div, DivAttributes, Input, Span
 
+from .utils import tw_merge
+
 try:
     from typing import Unpack
 except ImportError:
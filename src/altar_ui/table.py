@@ -1,16 +1,25 @@
-from collections.abc import Generator, Iterable
-from typing import Self
-
-from aether import BaseWebElement
-from aether.plugins.tailwindcss import tw_merge
+import json
+import warnings
+from collections.abc import Callable, Generator, Iterable, Mapping, Sequence
+from html import escape
+from typing import Any, NotRequired, Self, TypedDict
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+from aether import BaseWebElement, mark_safe
+from aether.base import _render_element
+from aether.plugins.alpinejs import AlpineJSData, Statement, alpine_js_data_merge
 from aether.tags.html import (
+    BaseHTMLElement,
     Caption,
     CaptionAttributes,
     Div,
+    Script,
+    Span,
     Tbody,
     TbodyAttributes,
     Td,
     TdAttributes,
+    Template,
     Tfoot,
     TfootAttributes,
     Th,
@@ -23,6 +32,15 @@ from aether.tags.html import (
 from aether.tags.html import Table as PyTable
 from aether.tags.html import TableAttributes as PyTableAttributes
 
+from .button import Button
+from .utils import (
+    _TEMPLATE_SLOT,
+    LazyChildren,
+    _escape_script_json,
+    _render_template_parts,
+    tw_merge,
+)
+
 try:
     from typing import Unpack
 except ImportError:
@@ -51,7 +69,7 @@ class Table(Div):
             ):
                 forwarded_children.append(child)
             elif isinstance(child, Generator):
-                forwarded_children.extend(list(child))
+                forwarded_children.append(LazyChildren(child))
             elif isinstance(child, type(None)):
                 continue
             else:
@@ -94,6 +112,23 @@ class TableBody(Tbody):
             **attributes,
         )
 
+    def __call__(self, *children: tuple) -> Self:
+        for child in children:
+            if (
+                isinstance(child, str)
+                or isinstance(child, BaseWebElement)
+                or not isinstance(child, Iterable)
+            ):
+                self.children.append(child)
+            elif isinstance(child, Generator):
+                self.children.append(LazyChildren(child))
+            elif isinstance(child, type(None)):
+                continue
+            else:
+                self.children.extend(child)
+
+        return self
+
 
 class TableFooter(Tfoot):
     def __init__(self, **attributes: Unpack[TfootAttributes]):
@@ -158,3 +193,398 @@ class TableCaption(Caption):
             data_slot="table-caption",
             **attributes,
         )
+
+
+class TableColumn(TypedDict):
+    key: str | int
+    header: NotRequired[str]
+    head_attributes: NotRequired[ThAttributes]
+    cell_attributes: NotRequired[TdAttributes]
+
+
+def _render_cell_value(value: Any) -> str:
+    if isinstance(value, str) and not hasattr(value, "__html__"):
+        return escape(value)
+    if value is None:
+        return ""
+    if isinstance(value, int | float) and not isinstance(value, bool):
+        return str(value)
+
+    return "".join(_render_element(value))
+
+
+class TableRowTemplate:
+    def __init__(
+        self, columns: Sequence[TableColumn], **row_attributes: Unpack[TrAttributes]
+    ):
+        if not columns:
+            raise ValueError(
+                f"`{self.__class__.__qualname__}` must be created with at least one column."
+            )
+
+        self.columns = list(columns)
+        self.keys = [column["key"] for column in self.columns]
+
+        # The `TableRow`/`TableCell` markup (merged classes, `data_slot`, default
+        # attributes) is rendered once and reused as a `str.format` template, so
+        # filling a row is a single format call over the escaped cell values.
+        row_opening_tag, row_closing_tag = _render_template_parts(
+            TableRow(**row_attributes)(_TEMPLATE_SLOT)
+        )
+        row_template_parts = [row_opening_tag.replace("{", "{{").replace("}", "}}")]
+        for index, column in enumerate(self.columns):
+            cell_opening_tag, cell_closing_tag = _render_template_parts(
+                TableCell(**column.get("cell_attributes", {}))(_TEMPLATE_SLOT)
+            )
+            row_template_parts.append(
+                cell_opening_tag.replace("{", "{{").replace("}", "}}")
+                + f"{{{index}}}"
+                + cell_closing_tag
+            )
+        row_template_parts.append(row_closing_tag)
+        self.row_template = "".join(row_template_parts)
+
+        self.header_row = "".join(
+            TableRow()(
+                TableHead(**column.get("head_attributes", {}))(
+                    column.get("header", str(column["key"]))
+                )
+                for column in self.columns
+            ).render()
+        )
+
+    def render_row(self, row: Mapping[str, Any] | Sequence[Any]) -> str:
+        return self.row_template.format(
+            *[_render_cell_value(row[key]) for key in self.keys]
+        )
+
+    def render_rows(
+        self, rows: Iterable[Mapping[str, Any] | Sequence[Any]]
+    ) -> Generator[str]:
+        row_template = self.row_template
+        keys = self.keys
+        for row in rows:
+            yield row_template.format(*[_render_cell_value(row[key]) for key in keys])
+
+
+class TableTemplateRows(BaseHTMLElement):
+    tag_name = "passthrough"
+    have_children = False
+    content_category = None
+
+    def __init__(
+        self,
+        template: TableRowTemplate,
+        rows: Iterable[Mapping[str, Any] | Sequence[Any]],
+    ):
+        super().__init__()
+
+        self.template = template
+        self.rows = rows
+
+    def render(self, stringify: bool = True) -> Generator[str]:
+        yield from self.template.render_rows(self.rows)
+
+
+class TableTemplateHeaderRow(BaseHTMLElement):
+    tag_name = "passthrough"
+    have_children = False
+    content_category = None
+
+    def __init__(self, template: TableRowTemplate):
+        super().__init__()
+
+        self.template = template
+
+    def render(self, stringify: bool = True) -> Generator[str]:
+        yield self.template.header_row
+
+
+class DataTable(Table):
+    def __init__(
+        self,
+        columns: Sequence[TableColumn] | TableRowTemplate,
+        rows: Iterable[Mapping[str, Any] | Sequence[Any]],
+        **attributes: Unpack[PyTableAttributes],
+    ):
+        super().__init__(**attributes)
+
+        self.template = (
+            columns
+            if isinstance(columns, TableRowTemplate)
+            else TableRowTemplate(columns)
+        )
+
+        self.table_body = TableBody()(TableTemplateRows(self.template, rows))
+
+        super().__call__(
+            TableHeader()(TableTemplateHeaderRow(self.template)), self.table_body
+        )
+
+    def __call__(self, *children: tuple) -> Self:
+        table = self.children[-1]
+        for child in children:
+            if isinstance(child, Caption):
+                table.children.insert(0, child)
+            elif child is not None:
+                table(child)
+
+        return self
+
+
+class TableRowChunkRenderer:
+    def __init__(
+        self,
+        template: TableRowTemplate,
+        load_rows: Callable[[int, int], Iterable[Mapping[str, Any] | Sequence[Any]]],
+        endpoint: str,
+        chunk_size: int = 100,
+        offset_parameter: str = "offset",
+    ):
+        if chunk_size <= 0:
+            raise ValueError(
+                f"'chunk_size' must be a positive integer, got {chunk_size}."
+            )
+
+        self.template = template
+        self.load_rows = load_rows
+        self.endpoint = endpoint
+        self.chunk_size = chunk_size
+        self.offset_parameter = offset_parameter
+
+        # Requires Intersect plugin
+        # The sentinel row only differs by the URL of the next chunk, so it is
+        # rendered once with a slot for the URL.
+        # The chunk replaces `$root` (the sentinel row), since `$el` is the retry
+        # button when the request is triggered from it.
+        self.sentinel_opening_tag, self.sentinel_closing_tag = _render_template_parts(
+            TableRow(
+                data_table_sentinel=True,
+                x_data=AlpineJSData(
+                    data={
+                        "chunk_url": Statement(_TEMPLATE_SLOT, seq_type="assignment"),
+                        "chunk_failed": False,
+                        "loadNextChunk()": Statement(
+                            """{
+                                this.chunk_failed = false;
+                                fetch(this.chunk_url, { headers: { 'Accept': 'text/html' } })
+                                    .then((response) => {
+                                        if (!response.ok || response.redirected) {
+                                            throw new Error(`Loading rows failed with status ${response.status}.`);
+                                        }
+                                        return response.text();
+                                    })
+                                    .then((html) => { this.$root.outerHTML = html; })
+                                    .catch(() => { this.chunk_failed = true; });
+                            }""",
+                            seq_type="definition",
+                        ),
+                    },
+                    directive="x-data",
+                ),
+                **{"x-intersect.once.margin.200px": "loadNextChunk()"},
+            )(
+                # Error pages (and redirects, e.g. to a login page) are never
+                # spliced into the table; the sentinel stays for a retry.
+                TableCell(
+                    colspan=len(template.columns),
+                    _class="text-muted-foreground text-center",
+                )(
+                    Span(x_show="!chunk_failed")("Loading more rows..."),
+                    Span(x_show="chunk_failed", x_cloak=True)(
+                        "Could not load more rows. ",
+                        Button(
+                            variant="link",
+                            size="sm",
+                            type="button",
+                            **{"@click": "loadNextChunk()"},
+                        )("Retry"),
+                    ),
+                )
+            )
+        )
+
+    def chunk_url(self, offset: int) -> str:
+        scheme, netloc, path, query, fragment = urlsplit(self.endpoint)
+        query_parameters = [
+            (key, value)
+            for key, value in parse_qsl(query, keep_blank_values=True)
+            if key != self.offset_parameter
+        ]
+        query_parameters.append((self.offset_parameter, str(offset)))
+
+        return urlunsplit((scheme, netloc, path, urlencode(query_parameters), fragment))
+
+    def render_sentinel(self, offset: int) -> str:
+        return (
+            self.sentinel_opening_tag
+            + escape(json.dumps(self.chunk_url(offset)))
+            + self.sentinel_closing_tag
+        )
+
+    def __call__(self, offset: int = 0, limit: int | None = None) -> str:
+        limit = self.chunk_size if limit is None else limit
+        if offset < 0:
+            raise ValueError(f"'offset' must be a non-negative integer, got {offset}.")
+        if limit <= 0:
+            raise ValueError(f"'limit' must be a positive integer, got {limit}.")
+
+        # One extra row is requested to know whether another chunk exists
+        # without an additional round trip that would come back empty.
+        rows = list(self.load_rows(offset, limit + 1))
+        has_more_rows = len(rows) > limit
+
+        rendered_rows = "".join(self.template.render_rows(rows[:limit]))
+        if has_more_rows:
+            rendered_rows += self.render_sentinel(offset + limit)
+
+        return rendered_rows
+
+
+class WindowedTable(DataTable):
+    def __init__(
+        self,
+        chunk_renderer: TableRowChunkRenderer,
+        initial_rows: int | None = None,
+        **attributes: Unpack[PyTableAttributes],
+    ):
+        super().__init__(chunk_renderer.template, rows=(), **attributes)
+
+        self.chunk_renderer = chunk_renderer
+        self.table_body.children = [
+            mark_safe(chunk_renderer(offset=0, limit=initial_rows))
+        ]
+
+
+def _serialize_table_rows(
+    keys: Sequence[str | int], rows: Iterable[Mapping[str, Any] | Sequence[Any]]
+) -> str:
+    serialized_rows = json.dumps(
+        [["" if row[key] is None else str(row[key]) for key in keys] for row in rows],
+        separators=(",", ":"),
+        ensure_ascii=False,
+    )
+
+    return _escape_script_json(serialized_rows)
+
+
+class VirtualTable(Table):
+    def __init__(
+        self,
+        columns: Sequence[TableColumn],
+        rows: Iterable[Mapping[str, Any] | Sequence[Any]],
+        row_height: int = 37,
+        viewport_height: int = 480,
+        overscan: int = 10,
+        **attributes: Unpack[PyTableAttributes],
+    ):
+        if not columns:
+            raise ValueError(
+                f"`{self.__class__.__qualname__}` must be created with at least one column."
+            )
+
+        base_x_data_attribute = AlpineJSData(
+            data={
+                "rows": [],
+                "row_height": row_height,
+                "viewport_height": viewport_height,
+                "overscan": overscan,
+                "scroll_top": 0,
+                "init()": Statement(
+                    # Frozen rows are not wrapped in reactive proxies, only the
+                    # visible slice is ever read. `init()` runs before the
+                    # children are walked, so `$refs.rows` is not set yet and
+                    # the row buffer is looked up directly.
+                    """{ this.rows = Object.freeze(JSON.parse(this.$el.querySelector(':scope > script[type="application/json"]').textContent)); }""",
+                    seq_type="definition",
+                ),
+                "getStartIndex()": Statement(
+                    "{ return Math.max(0, Math.floor(this.scroll_top / this.row_height) - this.overscan) }",
+                    seq_type="definition",
+                ),
+                "getEndIndex()": Statement(
+                    "{ return Math.min(this.rows.length, Math.ceil((this.scroll_top + this.viewport_height) / this.row_height) + this.overscan) }",
+                    seq_type="definition",
+                ),
+                "getVisibleRows()": Statement(
+                    "{ const start = this.getStartIndex(); return this.rows.slice(start, this.getEndIndex()).map((cells, offset) => ({ index: start + offset, cells: cells })) }",
+                    seq_type="definition",
+                ),
+                "getTopSpacerHeight()": Statement(
+                    "{ return this.getStartIndex() * this.row_height }",
+                    seq_type="definition",
+                ),
+                "getBottomSpacerHeight()": Statement(
+                    "{ return (this.rows.length - this.getEndIndex()) * this.row_height }",
+                    seq_type="definition",
+                ),
+            },
+            directive="x-data",
+        )
+        x_data_attribute = attributes.pop("x_data", None)
+        style_attribute = attributes.pop("style", "")
+
+        super().__init__(
+            x_data=alpine_js_data_merge(base_x_data_attribute, x_data_attribute),
+            style=f"height: {viewport_height}px; overflow-y: auto; {style_attribute}".strip(),
+            data_virtual_table=True,
+            **{"@scroll.passive": "scroll_top = $el.scrollTop"},
+            **attributes,
+        )
+
+        self.columns = list(columns)
+        keys = [column["key"] for column in self.columns]
+
+        self.children.append(
+            Script(type="application/json", x_ref="rows")(
+                mark_safe(_serialize_table_rows(keys, rows))
+            )
+        )
+
+        # Rows are keyed by their slot in the visible window, so scrolling
+        # recycles the same `TableRow` nodes and only updates their text.
+        super().__call__(
+            TableHeader(_class="sticky top-0 z-10 bg-background")(
+                TableRow()(
+                    TableHead(**column.get("head_attributes", {}))(
+                        column.get("header", str(column["key"]))
+                    )
+                    for column in self.columns
+                )
+            ),
+            TableBody()(
+                Tr(
+                    aria_hidden="true",
+                    data_slot="table-spacer",
+                    **{":style": "`height: ${getTopSpacerHeight()}px`"},
+                )(),
+                Template(
+                    **{"x-for": "(row, slot) in getVisibleRows()", ":key": "slot"}
+                )(
+                    TableRow(
+                        style=f"height: {row_height}px",
+                        **{":data-index": "row.index"},
+                    )(
+                        TableCell(
+                            **column.get("cell_attributes", {}),
+                            x_text=f"row.cells[{index}]",
+                        )()
+                        for index, column in enumerate(self.columns)
+                    )
+                ),
+                Tr(
+                    aria_hidden="true",
+                    data_slot="table-spacer",
+                    **{":style": "`height: ${getBottomSpacerHeight()}px`"},
+                )(),
+            ),
+        )
+
+    def __call__(self, *_children: tuple) -> Self:
+        warnings.warn(
+            f"Trying to add child to a non-child element: {self.__class__.__qualname__}",
+            UserWarning,
+            stacklevel=2,
+        )
+
+        return self
@@ -4,11 +4,12 @@ from typing import Self
 
 from aether import BaseWebElement
 from aether.plugins.alpinejs import AlpineJSData, Statement, alpine_js_data_merge
-from aether.plugins.tailwindcss import tw_merge
 from aether.tags.html import Button as PyButton
 from aether.tags.html import ButtonAttributes as PyButtonAttributes
 from aether.tags.html import Div, DivAttributes
 
+from .utils import tw_merge
+
 try:
     from typing import Unpack
 except ImportError:
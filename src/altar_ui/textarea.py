@@ -2,7 +2,6 @@ import warnings
 from typing import Self
 
 from aether.plugins.alpinejs import AlpineJSData, Statement, alpine_js_data_merge
-from aether.plugins.tailwindcss import tw_merge
 from aether.tags.html import (
     Textarea as PyTextarea,
 )
@@ -10,6 +9,8 @@ from aether.tags.html import (
     TextareaAttributes as PyTextareaAttributes,
 )
 
+from .utils import tw_merge
+
 try:
     from typing import Unpack
 except ImportError:
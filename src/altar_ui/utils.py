@@ -0,0 +1,189 @@
+import math
+from collections import OrderedDict
+from collections.abc import Callable, Generator, Iterable
+from threading import Lock
+from typing import Any, NamedTuple, TypeVar
+
+from aether import BaseWebElement, mark_safe
+from aether.base import _render_element
+from aether.plugins.tailwindcss import tw_merge as _tw_merge
+from aether.tags.html import BaseHTMLElement
+
+
+class TailwindMergeCacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    evictions: int
+    maxsize: int
+    currsize: int
+
+
+class _TailwindMergeCache:
+    def __init__(self, maxsize: int = 4096):
+        self._cache: OrderedDict[tuple[str, ...], str] = OrderedDict()
+        self._lock = Lock()
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def merge(self, tw_classes: tuple[str, ...]) -> str:
+        if self.maxsize <= 0:
+            self.misses += 1
+            return _tw_merge(*tw_classes)
+
+        with self._lock:
+            merged_tw_classes = self._cache.get(tw_classes)
+            if merged_tw_classes is not None:
+                self._cache.move_to_end(tw_classes)
+                self.hits += 1
+                return merged_tw_classes
+
+        merged_tw_classes = _tw_merge(*tw_classes)
+
+        with self._lock:
+            self.misses += 1
+            self._cache[tw_classes] = merged_tw_classes
+            while len(self._cache) > self.maxsize:
+                self._cache.popitem(last=False)
+                self.evictions += 1
+
+        return merged_tw_classes
+
+    def resize(self, maxsize: int) -> None:
+        if maxsize < 0:
+            raise ValueError(
+                f"'maxsize' must be a non-negative integer, got {maxsize}."
+            )
+
+        with self._lock:
+            self.maxsize = maxsize
+            while len(self._cache) > self.maxsize:
+                self._cache.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._cache.clear()
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+
+    def info(self) -> TailwindMergeCacheInfo:
+        with self._lock:
+            return TailwindMergeCacheInfo(
+                hits=self.hits,
+                misses=self.misses,
+                evictions=self.evictions,
+                maxsize=self.maxsize,
+                currsize=len(self._cache),
+            )
+
+
+_tw_merge_cache = _TailwindMergeCache()
+
+
+def tw_merge(*tw_classes: str) -> str:
+    # The merge result only depends on the input strings, so identical
+    # inputs (e.g. the static base classes of a component) are served
+    # from a bounded LRU cache instead of being re-merged.
+    return _tw_merge_cache.merge(tw_classes)
+
+
+def tw_merge_cache_info() -> TailwindMergeCacheInfo:
+    return _tw_merge_cache.info()
+
+
+def tw_merge_cache_clear() -> None:
+    _tw_merge_cache.clear()
+
+
+def set_tw_merge_cache_maxsize(maxsize: int) -> None:
+    _tw_merge_cache.resize(maxsize)
+
+
+_T = TypeVar("_T")
+
+# Marks the varying parts (an attribute value or the children) of an element
+# rendered once as a template; see `_render_template_parts`.
+_TEMPLATE_SLOT = mark_safe("\x00")
+
+
+def _render_template_parts(element: BaseWebElement) -> tuple[str, ...]:
+    # The static markup around every `_TEMPLATE_SLOT` is rendered once, so
+    # building another element only joins the parts with the escaped values.
+    return tuple("".join(element.render()).split(_TEMPLATE_SLOT))
+
+
+def _call_cached(cached_function: Callable[..., _T], *arguments: Any) -> _T:
+    # Templates are cached by their attributes, which can hold unhashable
+    # values (e.g. a dict); those are rendered without the cache instead.
+    try:
+        return cached_function(*arguments)
+    except TypeError:
+        return cached_function.__wrapped__(*arguments)
+
+
+def _escape_script_json(serialized_json: str) -> str:
+    # JSON embedded in a `<script>` element has its markup characters escaped
+    # to keep it from closing the element early.
+    return (
+        serialized_json.replace("<", "\\u003c")
+        .replace(">", "\\u003e")
+        .replace("&", "\\u0026")
+    )
+
+
+def _is_plottable(value: Any) -> bool:
+    return (
+        isinstance(value, int | float)
+        and not isinstance(value, bool)
+        and math.isfinite(value)
+    )
+
+
+def _is_array_like(values: Any) -> bool:
+    return hasattr(values, "tolist") and not isinstance(values, str)
+
+
+def _column_to_list(values: Any, precision: int | None) -> list[Any]:
+    # NumPy arrays are rounded in bulk before being converted; `array.array`
+    # and plain sequences are rounded value by value.
+    if precision is not None and hasattr(values, "round"):
+        return values.round(precision).tolist()
+
+    values = values.tolist() if _is_array_like(values) else list(values)
+    if precision is not None:
+        values = [
+            round(value, precision) if isinstance(value, float) else value
+            for value in values
+        ]
+
+    return values
+
+
+class LazyChildren(BaseHTMLElement):
+    tag_name = "passthrough"
+    have_children = False
+    content_category = None
+
+    def __init__(self, children: Iterable[Any]):
+        super().__init__()
+
+        # Children are only pulled from the iterable while rendering, so a
+        # generator (e.g. rows read from a database cursor) is never
+        # materialized. Like any generator, it can only be rendered once.
+        self.lazy_children = children
+        self.is_rendered = False
+
+    def render(self, stringify: bool = True) -> Generator[str]:
+        # A second pass over an exhausted generator would silently render no
+        # children at all, so it is refused instead.
+        if self.is_rendered and iter(self.lazy_children) is self.lazy_children:
+            raise ValueError(
+                "Lazy children can only be rendered once. Pass a list instead of a generator to render the element more than once."
+            )
+
+        self.is_rendered = True
+        for child in self.lazy_children:
+            yield from _render_element(child, stringify, self.escape_quote)
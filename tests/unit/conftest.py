@@ -0,0 +1,50 @@
+import json
+import shutil
+import subprocess
+import threading
+from collections.abc import Callable, Generator
+from typing import Any
+from wsgiref.simple_server import WSGIRequestHandler, make_server
+
+import pytest
+
+
+class _QuietHandler(WSGIRequestHandler):
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def serve_wsgi_once() -> Generator[Callable[[Callable[..., Any]], str]]:
+    # Serves a single request to a WSGI app on a free local port and returns
+    # its URL; the server is torn down after the test.
+    servers = []
+
+    def serve(app: Callable[..., Any]) -> str:
+        server = make_server("127.0.0.1", 0, app, handler_class=_QuietHandler)
+        thread = threading.Thread(target=server.handle_request)
+        thread.start()
+        servers.append((server, thread))
+        return f"http://127.0.0.1:{server.server_port}/"
+
+    yield serve
+
+    for server, thread in servers:
+        thread.join()
+        server.server_close()
+
+
+@pytest.fixture
+def run_javascript() -> Callable[[str], Any]:
+    # Runs a script in node and returns the JSON value it prints.
+    node = shutil.which("node")
+    if node is None:
+        pytest.skip("requires node")
+
+    def run(script: str) -> Any:
+        result = subprocess.run(  # noqa: S603
+            [node, "-e", script], capture_output=True, text=True, check=True
+        )
+        return json.loads(result.stdout)
+
+    return run
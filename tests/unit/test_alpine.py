@@ -0,0 +1,65 @@
+import warnings
+
+import pytest
+from aether import render
+
+from altar_ui.alpine import (
+    AlpineDataRuntime,
+    alpine_data_registry,
+    use_alpine_runtime_constant,
+)
+from altar_ui.pagination import PaginationItem
+
+
+def test_registry_emits_each_component_once():
+    with alpine_data_registry() as used_alpine_data:
+        runtime = AlpineDataRuntime()
+        items = [PaginationItem(index) for index in range(3)]
+
+    assert used_alpine_data == {"altarPaginationItem"}
+    assert render(runtime).count("Alpine.data('altarPaginationItem'") == 1
+    assert 'x-data="altarPaginationItem({ pageIndex: 3 })"' in render(items[2])
+
+
+def test_identical_runtime_constants_are_emitted_once():
+    with alpine_data_registry():
+        runtime = AlpineDataRuntime()
+        constant_ids = {
+            use_alpine_runtime_constant("__testConstants", "{ value: 1 }")
+            for _ in range(3)
+        }
+        other_constant_id = use_alpine_runtime_constant(
+            "__testConstants", "{ value: 2 }"
+        )
+
+    assert len(constant_ids) == 1
+    assert other_constant_id not in constant_ids
+    assert render(runtime).count("{ value: 1 }") == 1
+
+
+def test_runtime_constants_script_keeps_the_nonce():
+    with alpine_data_registry():
+        runtime = AlpineDataRuntime(nonce="abc123")
+        use_alpine_runtime_constant("__testConstants", "{ value: '</script>' }")
+        PaginationItem(0)
+
+    html = render(runtime)
+
+    assert html.count('<script nonce="abc123">') == 2
+    assert html.index("window.__testConstants") < html.index("Alpine.data(")
+    assert "</script>'" not in html
+
+
+def test_missing_runtime_is_reported():
+    with pytest.warns(UserWarning, match="no `AlpineDataRuntime` was created"):
+        with alpine_data_registry():
+            use_alpine_runtime_constant("__testConstants", "{ value: 1 }")
+
+
+def test_nested_registries_defer_to_the_outer_runtime():
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        with alpine_data_registry():
+            with alpine_data_registry():
+                use_alpine_runtime_constant("__testConstants", "{ value: 1 }")
+            AlpineDataRuntime()
@@ -0,0 +1,85 @@
+import math
+import warnings
+from datetime import date, datetime, timedelta, timezone
+
+import pytest
+
+from altar_ui.chart import aggregate_chart_data
+
+_time_keys = {
+    "iso strings": [
+        "2024-01-05T10:30",
+        "2024-01-06T23:59",
+        "2024-02-01",
+        "2024-01-05 11:00",
+    ],
+    "iso strings with offsets": [
+        "2024-01-05T23:30-02:00",
+        "2024-01-06T01:00Z",
+        "2024-01-05T01:00",
+        "2024-01-08",
+    ],
+    "aware datetimes": [
+        datetime(2024, 1, 5, 23, 30, tzinfo=timezone(timedelta(hours=-2))),
+        datetime(2024, 1, 6, 1, 0, tzinfo=timezone.utc),
+        datetime(2024, 1, 5, 1, 0),
+        datetime(2024, 1, 8, 0, 0),
+    ],
+    "dates": [date(2024, 1, 5), date(2024, 1, 7), date(2024, 1, 8), None],
+}
+
+
+@pytest.mark.parametrize("time_bucket", ["hour", "day", "week", "month"])
+@pytest.mark.parametrize("keys", _time_keys.values(), ids=_time_keys.keys())
+def test_time_buckets_match_between_lists_and_arrays(keys, time_bucket):
+    np = pytest.importorskip("numpy")
+
+    aggregated_lists = aggregate_chart_data(
+        {"key": keys, "value": [1, 2, 3, 4]},
+        by="key",
+        value="value",
+        time_bucket=time_bucket,
+    )
+    with warnings.catch_warnings():
+        # NumPy warns that it converts aware values to UTC.
+        warnings.simplefilter("ignore", UserWarning)
+        aggregated_arrays = aggregate_chart_data(
+            {"key": np.array(keys, dtype=object), "value": np.array([1, 2, 3, 4.0])},
+            by="key",
+            value="value",
+            time_bucket=time_bucket,
+        )
+
+    assert aggregated_lists["chart_labels"] == aggregated_arrays["chart_labels"]
+    assert aggregated_lists["chart_data"] == [
+        None if math.isnan(value) else value
+        for value in aggregated_arrays["chart_data"].tolist()
+    ]
+
+
+def test_aware_datetimes_are_bucketed_in_utc():
+    aggregated = aggregate_chart_data(
+        {
+            "key": ["2024-01-05T23:30-02:00", "2024-01-06T00:30Z"],
+            "value": [1, 2],
+        },
+        by="key",
+        value="value",
+        time_bucket="day",
+    )
+
+    assert aggregated["chart_labels"] == ["2024-01-06"]
+    assert aggregated["chart_data"] == [3]
+
+
+@pytest.mark.parametrize("array_type", ["list", "numpy", "numpy object"])
+def test_numeric_time_keys_are_rejected(array_type):
+    keys = [1, 2]
+    if array_type != "list":
+        np = pytest.importorskip("numpy")
+        keys = np.array(keys, dtype=object if array_type == "numpy object" else None)
+
+    with pytest.raises(TypeError, match="can only group dates, datetimes"):
+        aggregate_chart_data(
+            {"key": keys, "value": [1, 2]}, by="key", value="value", time_bucket="day"
+        )
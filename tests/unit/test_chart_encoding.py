@@ -0,0 +1,143 @@
+import array
+import base64
+import json
+import math
+import struct
+import sys
+import warnings
+from html import unescape
+
+import pytest
+from aether import render
+
+from altar_ui.chart import Chart
+
+_values = [
+    1.5,
+    -2.25,
+    0.1,
+    1e-310,
+    3,
+    None,
+    math.nan,
+    math.inf,
+    -math.inf,
+    -0.0,
+    123456.789,
+    7,
+    -1e30,
+    2.5,
+    4,
+    8.125,
+]
+
+
+def _chart_config(chart: Chart) -> dict:
+    html = unescape(render(chart))
+    start = html.index("chart_config: ") + len("chart_config: ")
+    return json.JSONDecoder().raw_decode(html, start)[0]
+
+
+def _decode_column(encoded_data: dict) -> list[float | None]:
+    # Mirrors `__decodeChartData` in the browser.
+    is_float32 = encoded_data["encoding"] == "float32"
+    bits = array.array("I" if is_float32 else "Q")
+    bits.frombytes(base64.b64decode(encoded_data["data"]))
+    if sys.byteorder == "big":
+        bits.byteswap()
+
+    if encoded_data["delta"]:
+        mask = 0xFFFFFFFF if is_float32 else 2**64 - 1
+        for index in range(1, len(bits)):
+            bits[index] = (bits[index] + bits[index - 1]) & mask
+
+    values = array.array("f" if is_float32 else "d", bits.tobytes())
+    return [None if math.isnan(value) else value for value in values]
+
+
+def _to_float32(value: float | None) -> float | None:
+    if value is None:
+        return None
+    return struct.unpack("f", struct.pack("f", value))[0]
+
+
+def _build_chart(max_points: int | None, **attributes) -> Chart:
+    return Chart(
+        chart_type="line",
+        chart_labels=[str(index) for index in range(len(_values))],
+        chart_datasets=[
+            {"label": "first", "data": _values},
+            {"label": "second", "data": list(reversed(_values))},
+        ],
+        **({"chart_max_points": max_points} if max_points is not None else {}),
+        **attributes,
+    )
+
+
+@pytest.mark.parametrize("max_points", [None, 8])
+@pytest.mark.parametrize("delta", [False, True])
+@pytest.mark.parametrize("encoding", ["float32", "float64"])
+def test_typed_array_payload_round_trips_to_the_json_payload(
+    encoding, delta, max_points
+):
+    json_config = _chart_config(_build_chart(max_points, chart_data_encoding="json"))
+    encoded_config = _chart_config(
+        _build_chart(
+            max_points, chart_data_encoding=encoding, chart_delta_encoding=delta
+        )
+    )
+
+    assert encoded_config["data"]["labels"] == json_config["data"]["labels"]
+    for json_dataset, encoded_dataset in zip(
+        json_config["data"]["datasets"],
+        encoded_config["data"]["datasets"],
+        strict=True,
+    ):
+        expected_values = json_dataset["data"]
+        if encoding == "float32":
+            expected_values = [_to_float32(value) for value in expected_values]
+
+        decoded_values = _decode_column(encoded_dataset["data"])
+        assert decoded_values == expected_values
+        assert [math.copysign(1, value) for value in decoded_values if value == 0] == [
+            math.copysign(1, value) for value in expected_values if value == 0
+        ]
+
+
+def test_float32_payload_falls_back_to_json_when_values_overflow():
+    with warnings.catch_warnings(record=True) as caught_warnings:
+        warnings.simplefilter("always")
+        config = _chart_config(
+            Chart(
+                chart_type="line",
+                chart_labels=["a", "b"],
+                chart_datasets=[{"label": "first", "data": [1.0, 1e300]}],
+                chart_data_encoding="float32",
+            )
+        )
+
+    assert config["data"]["datasets"][0]["data"] == [1.0, 1e300]
+    assert any("float32" in str(warning.message) for warning in caught_warnings)
+
+
+@pytest.mark.parametrize("max_points", [None, 100])
+@pytest.mark.parametrize("encoding", ["json", "float32"])
+@pytest.mark.parametrize("array_type", ["array", "numpy"])
+def test_label_columns_are_always_strings(max_points, encoding, array_type):
+    if array_type == "numpy":
+        np = pytest.importorskip("numpy")
+        labels = np.arange(4)
+    else:
+        labels = array.array("q", range(4))
+
+    config = _chart_config(
+        Chart(
+            chart_type="line",
+            chart_labels=labels,
+            chart_data=array.array("d", [1.5, 2, 3, 4]),
+            chart_max_points=max_points,
+            chart_data_encoding=encoding,
+        )
+    )
+
+    assert config["data"]["labels"] == ["0", "1", "2", "3"]
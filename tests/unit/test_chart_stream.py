@@ -0,0 +1,75 @@
+import json
+import math
+import urllib.request
+
+import pytest
+
+from altar_ui.chart import format_chart_stream_event
+
+
+def _parse_events(stream: str) -> list[dict[str, str]]:
+    # A minimal Server-Sent Events parser, following the `EventSource` rules
+    # for the fields the chart uses.
+    events = []
+    for block in stream.split("\n\n"):
+        if not block:
+            continue
+
+        event = {}
+        for line in block.split("\n"):
+            field_name, _, value = line.partition(":")
+            event[field_name] = value.removeprefix(" ")
+        events.append(event)
+
+    return events
+
+
+def test_event_framing():
+    event = format_chart_stream_event(
+        [[1, 2.5], [3, 4]], labels=["a", "b"], event="tick", event_id="7", retry=500
+    )
+
+    assert event == (
+        'id: 7\nevent: tick\nretry: 500\ndata: {"data":[[1,2.5],[3,4]],"labels":["a","b"]}\n\n'
+    )
+
+
+def test_event_framing_without_optional_fields():
+    assert format_chart_stream_event([[1]]) == 'data: {"data":[[1]]}\n\n'
+
+
+def test_non_finite_values_are_written_as_null():
+    event = _parse_events(
+        format_chart_stream_event([[math.nan, math.inf, -math.inf, None, 1.0]])
+    )[0]
+
+    assert json.loads(event["data"]) == {"data": [[None, None, None, None, 1.0]]}
+
+
+@pytest.mark.parametrize("field_name", ["event", "event_id"])
+@pytest.mark.parametrize("value", ["a\nb", "a\rb", "a\r\nb"])
+def test_line_breaks_are_rejected(field_name, value):
+    with pytest.raises(ValueError, match="line breaks"):
+        format_chart_stream_event([[1]], **{field_name: value})
+
+
+def test_events_through_a_local_event_stream(serve_wsgi_once):
+    events = [
+        format_chart_stream_event([[index, index * 1.5]], labels=[str(index)])
+        for index in range(3)
+    ]
+
+    def app(_environ, start_response):
+        start_response(
+            "200 OK",
+            [("content-type", "text/event-stream"), ("cache-control", "no-cache")],
+        )
+        return (event.encode() for event in events)
+
+    with urllib.request.urlopen(serve_wsgi_once(app)) as response:  # noqa: S310
+        assert response.headers["content-type"] == "text/event-stream"
+        received_events = _parse_events(response.read().decode())
+
+    assert [json.loads(event["data"]) for event in received_events] == [
+        {"data": [[index, index * 1.5]], "labels": [str(index)]} for index in range(3)
+    ]
@@ -0,0 +1,188 @@
+import re
+
+import pytest
+from aether import render
+from aether.plugins.alpinejs import AlpineHookForm, AlpineValidationTrigger
+from aether.tags.html import Div
+
+from altar_ui.alpine import AlpineDataRuntime, alpine_data_registry
+from altar_ui.form import (
+    Form,
+    FormControl,
+    FormField,
+    HookFormItem,
+    _form_field_x_data_attribute,
+)
+from altar_ui.input import Input
+from altar_ui.textarea import Textarea
+
+
+def test_form_keeps_fields_in_a_map_with_an_error_count():
+    html = render(Form()(FormField()))
+
+    assert "form_fields: {  }, form_fields_error_count: 0" in html
+    assert 'x-init="form_fields[field_id] = has_error"' in html
+
+
+def test_field_updates_keep_the_error_count(run_javascript):
+    update = _form_field_x_data_attribute.data["updateHasErrorValueInParent(id, value)"]
+    script = (
+        "const Alpine = { raw: (value) => value };"
+        "const form = { form_fields: { a: null, b: null }, form_fields_error_count: 0,"
+        f" updateHasErrorValueInParent(id, value) {update.data} }};"
+        "const counts = [];"
+        "for (const [id, value] of [['a', true], ['a', true], ['b', true],"
+        " ['a', false], ['c', true], ['b', null], ['b', false]]) {"
+        " form.updateHasErrorValueInParent(id, value);"
+        " counts.push(form.form_fields_error_count); }"
+        "console.log(JSON.stringify({ counts: counts, fields: form.form_fields }));"
+    )
+
+    assert run_javascript(script) == {
+        # Repeated updates and unknown fields ('c') leave the count unchanged.
+        "counts": [1, 1, 2, 1, 1, 0, 0],
+        "fields": {"a": False, "b": False},
+    }
+
+
+def test_with_child_rejects_a_second_child():
+    control = FormControl(hook_form_item=HookFormItem(name="field")).with_child(Input)
+
+    with pytest.raises(ValueError, match="already has 1"):
+        control.with_child(Input)
+
+
+def test_with_child_rejects_other_element_types():
+    with pytest.raises(ValueError, match="Invalid child type"):
+        FormControl(hook_form_item=HookFormItem(name="field")).with_child(Div)
+
+
+def test_with_child_mirrors_number_constraints():
+    hook_form_item = AlpineHookForm(
+        name="amount",
+        constraints={
+            "type": {"value": "number"},
+            "min": {"value": 1},
+            "max": {"value": 10},
+            "step": {"value": 0.5},
+        },
+    )
+
+    html = render(FormControl(hook_form_item=hook_form_item).with_child(Input))
+
+    assert 'type="number"' in html
+    assert 'min="1"' in html
+    assert 'max="10"' in html
+    assert 'step="0.5"' in html
+
+
+@pytest.mark.parametrize("child_type", [Input, Textarea])
+def test_with_child_mirrors_length_constraints(child_type):
+    hook_form_item = AlpineHookForm(
+        name="name",
+        constraints={
+            "type": {"value": "text"},
+            "min_length": {"value": 2},
+            "max_length": {"value": 5},
+        },
+    )
+
+    html = render(FormControl(hook_form_item=hook_form_item).with_child(child_type))
+
+    assert 'minlength="2"' in html
+    assert 'maxlength="5"' in html
+    assert 'min="' not in html
+
+
+def test_with_child_matches_calling_with_a_child():
+    hook_form_item = AlpineHookForm(
+        name="name", required=True, constraints={"type": {"value": "text"}}
+    )
+
+    assert render(
+        FormControl(hook_form_item=hook_form_item).with_child(Input, placeholder="Name")
+    ) == render(FormControl(hook_form_item=hook_form_item)(Input(placeholder="Name")))
+
+
+def _spec_id(html: str) -> str:
+    return re.search(r"runValidation\(\$event.target.value, &#x27;(\w+)&#x27;\)", html)[
+        1
+    ]
+
+
+def test_identical_validation_specs_share_one_id():
+    def control(name: str, min_length: int) -> FormControl:
+        return FormControl(
+            hook_form_item=AlpineHookForm(
+                name=name,
+                validator={"validation_rules": [{"test": "/^a/", "message": "A"}]},
+                constraints={"min_length": {"value": min_length}},
+            )
+        ).with_child(Input)
+
+    with alpine_data_registry():
+        runtime = AlpineDataRuntime()
+        first, second, other = (
+            render(control("first", 2)),
+            render(control("second", 2)),
+            render(control("other", 3)),
+        )
+    runtime_html = render(runtime)
+
+    assert _spec_id(first) == _spec_id(second)
+    assert _spec_id(first) != _spec_id(other)
+    assert runtime_html.count(f"'{_spec_id(first)}': ") == 1
+    assert runtime_html.count("test: /^a/") == 2
+
+
+def test_debounce_and_throttle_cannot_be_combined():
+    with pytest.raises(ValueError, match="cannot be used together"):
+        HookFormItem(name="field", validation_debounce=300, validation_throttle=300)
+
+
+def test_effect_validation_cannot_be_debounced():
+    with pytest.raises(ValueError, match="cannot be debounced or throttled"):
+        HookFormItem(
+            name="field",
+            validator={"validation_trigger": AlpineValidationTrigger.ON_EFFECT},
+            validation_debounce=300,
+        )
+
+
+def test_debounced_validation_trigger():
+    html = render(
+        FormControl(
+            hook_form_item=HookFormItem(
+                name="field",
+                validator={"validation_trigger": AlpineValidationTrigger.ON_INPUT},
+                validation_debounce=250,
+            )
+        ).with_child(Input)
+    )
+
+    assert '@input.debounce.250ms="runValidation(' in html
+
+
+def test_blur_then_live_validation():
+    html = render(
+        FormControl(
+            hook_form_item=HookFormItem(
+                name="field",
+                validation_strategy="blur_then_live",
+                validation_debounce=300,
+            )
+        ).with_child(Input)
+    )
+
+    # Validated on blur right away, then on every (debounced) input once the
+    # field has shown an error.
+    assert re.search(
+        r'@blur="runValidation\([^"]*\); if \(getHasError\(\)\) '
+        r'\{ validation_live = true \}"',
+        html,
+    )
+    assert re.search(
+        r'@input.debounce.300ms="if \(validation_live\) \{ runValidation\([^"]*\) \}"',
+        html,
+    )
+    assert "@blur.debounce" not in html
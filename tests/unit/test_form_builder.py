@@ -0,0 +1,57 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from aether import render
+from pydantic import BaseModel, Field
+
+from altar_ui.form_builder import SchemaForm, _js_regex_literal
+
+
+@pytest.mark.parametrize(
+    ("pattern", "literal"),
+    [
+        (r"^(?P<code>[A-Z]{2})-\d+$", r"/^(?<code>[A-Z]{2})-\d+$/"),
+        (r"^(?P<word>a)(?P=word)$", r"/^(?<word>a)\k<word>$/"),
+        (r"^\/api$", r"/^\/api$/"),
+        (r"^a/b[/]$", r"/^a\/b[\/]$/"),
+        (r"\\/", r"/\\\//"),
+        (r"(?i)\Aab\z", r"/^ab$/i"),
+        (r"[]a]", r"/[\]a]/"),
+        ("a\nb", r"/a\nb/"),
+        (r"(?#comment)a", "/a/"),
+        (r"(?i)", "/(?:)/i"),
+    ],
+)
+def test_js_regex_literal(pattern: str, literal: str):
+    assert _js_regex_literal(pattern) == literal
+
+
+@pytest.mark.parametrize(
+    "pattern", [r"(?x)a", r"a(?i)b", r"(?>a)", r"a++", r"\p{L}", r"[[:alpha:]]"]
+)
+def test_js_regex_literal_untranslatable(pattern: str):
+    assert _js_regex_literal(pattern) is None
+
+
+def test_untranslatable_pattern_is_skipped_with_warning():
+    class Model(BaseModel):
+        name: str = Field(pattern=r"^\p{L}+$")
+
+    with pytest.warns(UserWarning, match="no JavaScript equivalent"):
+        html = render(SchemaForm({"name": Model.model_fields["name"]})(None))
+
+    assert "p{L}" not in html
+
+
+def test_aware_datetime_value_has_no_offset():
+    class Model(BaseModel):
+        when: datetime
+
+    html = render(
+        SchemaForm(
+            {"when": Model.model_fields["when"]},
+            {"when": datetime(2020, 1, 1, 9, 30, tzinfo=timezone(timedelta(hours=2)))},
+        )(None)
+    )
+
+    assert 'value="2020-01-01T09:30"' in html
@@ -0,0 +1,109 @@
+import pytest
+from aether.plugins.alpinejs import AlpineHookForm
+
+from altar_ui.form import HookFormItem, _validation_spec_literal
+from altar_ui.form_validator import FormValidator, _format_js_number
+
+
+def _validate_rule(test: str, value: str) -> bool:
+    validator = FormValidator(
+        AlpineHookForm(
+            name="field",
+            validator={"validation_rules": [{"test": test, "message": "Invalid"}]},
+        )
+    )
+    return validator.validate({"field": value}) == {}
+
+
+@pytest.mark.parametrize(
+    ("test", "value", "is_valid"),
+    [
+        ("/^é$/i", "É", True),
+        (r"/^\s$/", "\u00a0", True),
+        (r"/^\s$/", "\x1c", False),
+        (r"/^\d$/", "٣", False),
+        (r"/^\w+$/", "é", False),
+        (r"/^[\w-]+$/", "a-b_c", True),
+        (r"/^\bq\B/", "qq", True),
+        ("/^.$/", "😀", False),
+        ("/^..$/", "😀", True),
+        ("/^a$/", "a\n", False),
+        ("/^(?<word>[a-z]+)$/", "abc", True),
+    ],
+)
+def test_rules_match_like_javascript(test, value, is_valid):
+    assert _validate_rule(test, value) is is_valid
+
+
+@pytest.mark.parametrize(
+    ("number", "formatted_number"),
+    [
+        (1e-7, "1e-7"),
+        (1.5e-7, "1.5e-7"),
+        (0.000001, "0.000001"),
+        (1e20, "100000000000000000000"),
+        (1e21, "1e+21"),
+        (-0.5, "-0.5"),
+        (0.1 + 0.2, "0.30000000000000004"),
+        (3, "3"),
+    ],
+)
+def test_numbers_are_formatted_like_javascript(number, formatted_number):
+    assert _format_js_number(number) == formatted_number
+
+
+def test_numpy_columns_match_list_columns():
+    np = pytest.importorskip("numpy")
+
+    validator = FormValidator(
+        AlpineHookForm(
+            name="amount",
+            required=True,
+            constraints={
+                "min": {"value": 1},
+                "max": {"value": 100},
+                "step": {"value": 0.5},
+            },
+        )
+    )
+    column = np.array([0.5, 1, 1.25, 50, 150, np.inf, np.nan, -3, 1e16, 99.5])
+
+    assert validator.validate_columns({"amount": column}) == (
+        validator.validate_columns({"amount": column.tolist()})
+    )
+    assert validator.validate_columns({"amount": column})[:5] == [
+        {"amount": "Must be at least 1."},
+        {},
+        {"amount": "Must be a multiple of 0.5."},
+        {},
+        {"amount": "Must be at most 100."},
+    ]
+
+
+@pytest.mark.parametrize(
+    ("hook_form_item", "message"),
+    [
+        (AlpineHookForm(name="field", required=True), "This field is required."),
+        (HookFormItem(name="field", required=True), "This field is required."),
+        (
+            HookFormItem(name="field", required=True, required_message="Needed"),
+            "Needed",
+        ),
+    ],
+)
+def test_required_message_is_shared_with_the_client(hook_form_item, message):
+    validator = FormValidator(hook_form_item)
+
+    assert validator.validate({"field": ""}) == {"field": message}
+    assert validator.validate({}) == {"field": message}
+    # `runValidation` reports the message from the spec for an empty value.
+    assert _validation_spec_literal(hook_form_item).endswith(
+        f'required_message: "{message}" }}'
+    )
+
+
+def test_optional_fields_have_no_required_message():
+    hook_form_item = HookFormItem(name="field")
+
+    assert FormValidator(hook_form_item).validate({"field": ""}) == {}
+    assert "required_message" not in _validation_spec_literal(hook_form_item)
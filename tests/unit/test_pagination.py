@@ -0,0 +1,70 @@
+import pytest
+from aether import render
+from aether.plugins.alpinejs import AlpineJSData
+
+from altar_ui.pagination import (
+    Pagination,
+    PaginationContent,
+    PaginationItem,
+    PaginationLink,
+    PaginationNext,
+    PaginationPrevious,
+    PaginationWindow,
+    _page_window_statement,
+)
+
+
+def test_window_helpers_are_only_added_with_a_window():
+    without_window = render(
+        Pagination(10)(PaginationContent()(PaginationItem(0)(PaginationLink()("1"))))
+    )
+    with_window = render(
+        Pagination(10, sibling_count=2)(
+            PaginationContent()(
+                PaginationPrevious(), PaginationWindow(), PaginationNext()
+            )
+        )
+    )
+
+    assert "getPageWindow" not in without_window
+    assert "siblingCount" not in without_window
+    assert "getPageWindow()" in with_window
+    assert "siblingCount: 2" in with_window
+
+
+def test_user_x_data_overrides_the_window_helpers():
+    html = render(
+        Pagination(
+            10, x_data=AlpineJSData(data={"siblingCount": 3}, directive="x-data")
+        )(PaginationContent()(PaginationWindow()))
+    )
+
+    assert "siblingCount: 3" in html
+    assert "siblingCount: 1" not in html
+
+
+@pytest.mark.parametrize(
+    ("number_of_pages", "current_page_index", "sibling_count", "pages"),
+    [
+        (1, 1, 1, [1]),
+        (3, 1, 1, [1, 2, 3]),
+        (5, 3, 1, [1, 2, 3, 4, 5]),
+        (5, 3, 2, [1, 2, 3, 4, 5]),
+        (10, 1, 1, [1, 2, None, 10]),
+        (10, 10, 1, [1, None, 9, 10]),
+        (10, 4, 1, [1, 2, 3, 4, 5, None, 10]),
+        (10, 5, 1, [1, None, 4, 5, 6, None, 10]),
+        (10, 5, 0, [1, None, 5, None, 10]),
+    ],
+)
+def test_page_window_edges(
+    run_javascript, number_of_pages, current_page_index, sibling_count, pages
+):
+    script = (
+        f"const pagination = {{ numberOfPages: {number_of_pages}, "
+        f"currentPageIndex: {current_page_index}, siblingCount: {sibling_count}, "
+        f"getPageWindow() {_page_window_statement.data} }};"
+        "console.log(JSON.stringify(pagination.getPageWindow()));"
+    )
+
+    assert run_javascript(script) == pages
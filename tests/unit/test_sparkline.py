@@ -0,0 +1,30 @@
+import math
+
+import pytest
+from aether import render
+
+from altar_ui.sparkline import Sparkline, build_sparkline_path
+
+
+def test_sparkline_path_has_no_empty_attributes():
+    html = render(Sparkline([1, 3, 2]))
+
+    assert 'd="M0.0 23.2L50.0 0.8L100.0 12.0"' in html
+    assert "pathLength" not in html
+    assert '=""' not in html
+
+
+@pytest.mark.parametrize("gap", [None, math.nan, math.inf])
+def test_gaps_split_the_path(gap):
+    path = build_sparkline_path([1, 2, gap, 2, 1], width=4, height=10)
+
+    assert path.count("M") == 2
+
+
+def test_numpy_values_match_list_values():
+    np = pytest.importorskip("numpy")
+    values = [1.5, 3, 2, None, 4]
+
+    assert build_sparkline_path(
+        np.array(values, dtype="float64"), width=100, height=24
+    ) == build_sparkline_path(values, width=100, height=24)
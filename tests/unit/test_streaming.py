@@ -0,0 +1,151 @@
+import asyncio
+import sqlite3
+import threading
+import urllib.request
+
+from aether import render
+from aether.tags.html import Div
+
+from altar_ui.streaming import (
+    ASGIStreamingResponse,
+    WSGIStreamingResponse,
+    render_chunks,
+)
+from altar_ui.table import Table, TableBody, TableCell, TableRow
+
+
+def _build_page(number_of_rows: int = 200) -> Table:
+    return Table()(
+        TableBody()(
+            TableRow()(TableCell()(f"Row {index}")) for index in range(number_of_rows)
+        )
+    )
+
+
+async def _call_asgi(app, receive):
+    messages = []
+
+    async def send(message):
+        messages.append(message)
+
+    await app({"type": "http"}, receive, send)
+    return messages
+
+
+async def _receive_until_cancelled():
+    await asyncio.Event().wait()
+
+
+def test_render_chunks_matches_render():
+    expected_html = render(_build_page())
+    chunks = list(render_chunks(_build_page(), chunk_size=1024))
+
+    assert b"".join(chunks).decode() == expected_html
+    assert all(len(chunk) == 1024 for chunk in chunks[:-1])
+
+
+def test_wsgi_response_through_a_local_server(serve_wsgi_once):
+    expected_html = render(_build_page())
+
+    url = serve_wsgi_once(
+        lambda environ, start_response: WSGIStreamingResponse(
+            _build_page(), chunk_size=1024
+        )(environ, start_response)
+    )
+    with urllib.request.urlopen(url) as response:  # noqa: S310
+        assert response.headers["content-type"] == "text/html; charset=utf-8"
+        assert response.read().decode() == expected_html
+
+
+def test_asgi_response_streams_the_whole_page():
+    expected_html = render(_build_page())
+
+    messages = asyncio.run(
+        _call_asgi(
+            ASGIStreamingResponse(_build_page(), chunk_size=1024),
+            _receive_until_cancelled,
+        )
+    )
+
+    assert messages[0]["type"] == "http.response.start"
+    assert messages[0]["status"] == 200
+    assert b"".join(message["body"] for message in messages[1:]) == (
+        expected_html.encode()
+    )
+    assert messages[-1]["more_body"] is False
+
+
+def test_asgi_response_stops_when_the_client_disconnects():
+    rendered_rows = []
+
+    def rows():
+        for index in range(10_000):
+            rendered_rows.append(index)
+            yield TableRow()(TableCell()(f"Row {index}"))
+
+    async def receive():
+        return {"type": "http.disconnect"}
+
+    messages = asyncio.run(
+        _call_asgi(
+            ASGIStreamingResponse(Table()(TableBody()(rows())), chunk_size=1024),
+            receive,
+        )
+    )
+
+    assert len(rendered_rows) < 10_000
+    assert all(message.get("more_body", True) for message in messages)
+
+
+def test_asgi_response_does_not_block_the_event_loop():
+    async def main():
+        ticks = 0
+        done = asyncio.Event()
+
+        async def tick():
+            nonlocal ticks
+            while not done.is_set():
+                ticks += 1
+                await asyncio.sleep(0)
+
+        ticker = asyncio.ensure_future(tick())
+        await _call_asgi(
+            ASGIStreamingResponse(
+                Div()(*(_build_page(50) for _ in range(20))), chunk_size=1024
+            ),
+            _receive_until_cancelled,
+        )
+        done.set()
+        await ticker
+        return ticks
+
+    assert asyncio.run(main()) > 1
+
+
+def test_asgi_response_renders_lazy_children_on_one_thread():
+    thread_ids = set()
+
+    def rows():
+        # sqlite3 objects can only be used from the thread that created them.
+        connection = sqlite3.connect(":memory:")
+        try:
+            for (index,) in connection.execute(
+                "WITH RECURSIVE n(i) AS (SELECT 0 UNION ALL SELECT i + 1 FROM n "
+                "WHERE i < 999) SELECT i FROM n"
+            ):
+                thread_ids.add(threading.get_ident())
+                yield TableRow()(TableCell()(f"Row {index}"))
+        finally:
+            thread_ids.add(threading.get_ident())
+            connection.close()
+
+    messages = asyncio.run(
+        _call_asgi(
+            ASGIStreamingResponse(Table()(TableBody()(rows())), chunk_size=256),
+            _receive_until_cancelled,
+        )
+    )
+
+    assert len(messages) > 10
+    assert b"Row 999" in b"".join(message["body"] for message in messages[1:])
+    assert len(thread_ids) == 1
@@ -0,0 +1,115 @@
+import json
+import re
+
+import pytest
+from aether import render
+from aether.tags.html import B
+
+from altar_ui.table import (
+    DataTable,
+    Table,
+    TableBody,
+    TableCell,
+    TableHead,
+    TableHeader,
+    TableRow,
+    TableRowChunkRenderer,
+    TableRowTemplate,
+    VirtualTable,
+)
+
+
+def test_data_table_matches_the_component_tree():
+    columns = [
+        {"key": "name", "header": "<Name>"},
+        {
+            "key": "note",
+            "cell_attributes": {"_class": "[&>{}]:font-bold", "title": '"{0}"'},
+        },
+        {"key": "count"},
+    ]
+    rows = [
+        {"name": "<script>", "note": "a & b", "count": 1},
+        {"name": '"quoted"', "note": "{0} {} {name}", "count": 1.5},
+        {"name": B()("bold"), "note": None, "count": -3},
+    ]
+
+    expected_html = render(
+        Table()(
+            TableHeader()(
+                TableRow()(
+                    TableHead(**column.get("head_attributes", {}))(
+                        column.get("header", str(column["key"]))
+                    )
+                    for column in columns
+                )
+            ),
+            TableBody()(
+                TableRow()(
+                    TableCell(**column.get("cell_attributes", {}))(row[column["key"]])
+                    for column in columns
+                )
+                for row in rows
+            ),
+        )
+    )
+
+    assert render(DataTable(columns, rows)) == expected_html
+
+
+def _chunk_renderer(number_of_rows: int = 5) -> TableRowChunkRenderer:
+    rows = [{"name": f"Row {index}"} for index in range(number_of_rows)]
+    return TableRowChunkRenderer(
+        TableRowTemplate([{"key": "name"}]),
+        lambda offset, limit: rows[offset : offset + limit],
+        endpoint="/rows?sort=name",
+        chunk_size=2,
+    )
+
+
+def test_chunk_renderer_replaces_the_sentinel_row():
+    html = _chunk_renderer()(offset=0)
+
+    assert html.count("<tr") == 3
+    assert "data-table-sentinel" in html
+    assert "/rows?sort=name&amp;offset=2" in html
+    # The retry button calls `loadNextChunk()` too, with itself as `$el`.
+    assert "this.$root.outerHTML = html" in html
+    assert "this.$el.outerHTML" not in html
+
+
+def test_chunk_renderer_last_chunk_has_no_sentinel():
+    html = _chunk_renderer()(offset=4)
+
+    assert html.count("<tr") == 1
+    assert "data-table-sentinel" not in html
+
+
+@pytest.mark.parametrize(("offset", "limit"), [(-1, None), (0, 0), (0, -5)])
+def test_chunk_renderer_rejects_invalid_bounds(offset: int, limit: int | None):
+    with pytest.raises(ValueError, match="must be a"):
+        _chunk_renderer()(offset=offset, limit=limit)
+
+
+def test_virtual_table_embeds_escaped_rows():
+    html = render(
+        VirtualTable(
+            [{"key": "name"}, {"key": "count"}],
+            [{"name": "</script><b>&", "count": 1}, {"name": "x", "count": None}],
+        )
+    )
+
+    payload = re.search(
+        r'<script type="application/json" x-ref="rows">(.*?)</script>', html
+    ).group(1)
+    assert payload == r'[["\u003c/script\u003e\u003cb\u003e\u0026","1"],["x",""]]'
+    assert json.loads(payload) == [["</script><b>&", "1"], ["x", ""]]
+
+
+def test_virtual_table_reads_rows_without_refs():
+    html = render(VirtualTable([{"key": "name"}], [{"name": "x"}]))
+
+    # `init()` runs before Alpine registers the `x-ref` of the child script.
+    init = re.search(r"init\(\) \{(.*?)\}", html).group(1)
+    assert "$refs" not in init
+    assert "querySelector(&#x27;:scope &gt; script" in init